@@ -1,147 +1,332 @@
+import functools
+import inspect
+import sys
 import threading
 import time
-import random
-import matplotlib.pyplot as plt
 import os
-import csv
-import pandas as pd
-import numpy as np
 
-# Verifica e cria os diretórios "graficos" e "dataset" se não existirem
-if not os.path.exists("graficos"):
-    os.makedirs("graficos")
-if not os.path.exists("dataset"):
-    os.makedirs("dataset")
+# Permite importar os módulos vizinhos e o pacote "common" (na raiz do repositório),
+# inclusive quando este arquivo é carregado pelo runner a partir de outro diretório
+PROBLEM_DIR = os.path.dirname(os.path.abspath(__file__))
+for path in (PROBLEM_DIR, os.path.dirname(PROBLEM_DIR)):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from common.context import RunContext
+from common.spinlock import make_spinlock
+from philosophers_watchdog import DeadlockWatchdog, DeadlockDetected, format_cycle
+from philosophers_async import AsyncPhilosophersSemaphores, AsyncPhilosophersMonitors, AsyncPhilosophersLocks, run_philosophers_test_async
+
+TITLE = "Dining-Philosophers"
+
+# Parâmetros do teste e seus valores padrão (o runner permite varrer vários valores de cada um)
+PARAMETERS = {
+    "philosophers": 5,  # Quantidade de filósofos (threads ou tarefas do asyncio)
+    "meals": 5,  # Ciclos de pensar e comer de cada filósofo
+    "watchdog": 0.0,  # Intervalo (s) do watchdog de deadlock das versões com threads; 0 desliga
+}
+
+# Menores valores aceitos: com um único filósofo, os dois garfos são o mesmo
+MINIMUMS = {
+    "philosophers": 2,
+    "meals": 1,
+    "watchdog": 0.0,
+}
 
 # Implementação da classe utilizando Semáforos para resolver o problema dos Filósofos Comensais
 class PhilosophersSemaphores:
-    def __init__(self, num_philosophers=5):
+    def __init__(self, num_philosophers=5, meals=5, context=None):
         self.num_philosophers = num_philosophers
+        self.meals = meals  # Quantas vezes cada filósofo pensa e come
+        context = context or RunContext()
+        self.waits = context.waits  # Registro dos tempos de espera pelos garfos
+        self.events = context.events  # Registro de eventos
+        self.clock = context.clock  # Relógio real ou virtual
+        self.workload = context.workload  # Fluxos de sorteios dos participantes
+        self.work = context.work  # Fase de trabalho: time.sleep ou computação (--work)
         # Cria um semáforo para cada garfo
-        self.forks = [threading.Semaphore(1) for _ in range(num_philosophers)]
+        self.forks = [context.sync.Semaphore(1) for _ in range(num_philosophers)]
 
     def dine(self, philosopher_id):
+        stream = self.workload.stream(f"philosopher-{philosopher_id}")  # Sorteios deste participante
         # Define os garfos esquerdo e direito para cada filósofo
         left_fork = philosopher_id
         right_fork = (philosopher_id + 1) % self.num_philosophers
 
-        for _ in range(5):  # Cada filósofo realiza o ciclo 5 vezes
-            print(f"(Semaphores) Filósofo {philosopher_id} está pensando.")
-            time.sleep(random.uniform(0.05, 0.2))  # Simula o tempo de pensar
+        for _ in range(self.meals):  # Cada filósofo realiza o ciclo "meals" vezes
+            self.events.log("(Semaphores) Filósofo {} está pensando.", philosopher_id)
+            self.work(stream.uniform(0.05, 0.2))  # Simula o tempo de pensar
             # Pega os garfos (semáforos)
+            start = self.clock.now_ns()
             self.forks[left_fork].acquire()
             self.forks[right_fork].acquire()
-            print(f"(Semaphores) Filósofo {philosopher_id} está comendo.")
-            time.sleep(random.uniform(0.05, 0.2))  # Simula o tempo de comer
+            self.waits.record("forks", self.clock.now_ns() - start)
+            self.events.log("(Semaphores) Filósofo {} está comendo.", philosopher_id)
+            self.work(stream.uniform(0.05, 0.2))  # Simula o tempo de comer
             # Libera os garfos (semáforos)
             self.forks[left_fork].release()
             self.forks[right_fork].release()
 
 # Implementação da classe utilizando Monitores
 class PhilosophersMonitors:
-    def __init__(self, num_philosophers=5):
+    def __init__(self, num_philosophers=5, meals=5, context=None):
         self.num_philosophers = num_philosophers
+        self.meals = meals  # Quantas vezes cada filósofo pensa e come
+        context = context or RunContext()
+        self.waits = context.waits  # Registro dos tempos de espera pelos garfos
+        self.events = context.events  # Registro de eventos
+        self.clock = context.clock
+        self.workload = context.workload  # Fluxos de sorteios dos participantes
+        self.work = context.work  # Fase de trabalho: time.sleep ou computação (--work)
         # Estado dos garfos: True se ocupado, False se livre
         self.forks = [False for _ in range(num_philosophers)]
-        self.condition = threading.Condition()  # Condição para controle de acesso
+        self.condition = context.sync.Condition()  # Condição para controle de acesso
+        self.wakeups = 0  # Vezes que um filósofo acordou do wait (notify_all acorda todos)
 
     def dine(self, philosopher_id):
+        stream = self.workload.stream(f"philosopher-{philosopher_id}")  # Sorteios deste participante
         left_fork = philosopher_id
         right_fork = (philosopher_id + 1) % self.num_philosophers
 
-        for _ in range(5):
-            print(f"(Monitors) Filósofo {philosopher_id} está pensando.")
-            time.sleep(random.uniform(0.05, 0.2))
+        for _ in range(self.meals):
+            self.events.log("(Monitors) Filósofo {} está pensando.", philosopher_id)
+            self.work(stream.uniform(0.05, 0.2))
+            start = self.clock.now_ns()
             with self.condition:
                 # Aguarda até que os dois garfos estejam disponíveis
                 while self.forks[left_fork] or self.forks[right_fork]:
                     self.condition.wait()
+                    self.wakeups += 1
                 # Reserva os garfos
                 self.forks[left_fork] = True
                 self.forks[right_fork] = True
-            print(f"(Monitors) Filósofo {philosopher_id} está comendo.")
-            time.sleep(random.uniform(0.05, 0.2))
+            self.waits.record("forks", self.clock.now_ns() - start)
+            self.events.log("(Monitors) Filósofo {} está comendo.", philosopher_id)
+            self.work(stream.uniform(0.05, 0.2))
             with self.condition:
                 # Libera os garfos e notifica outros threads
                 self.forks[left_fork] = False
                 self.forks[right_fork] = False
                 self.condition.notify_all()
 
+# Estados dos filósofos no monitor com uma condição por filósofo
+THINKING, HUNGRY, EATING = 0, 1, 2
+
+# Monitor com vetor de estados e uma condição por filósofo (solução de Tanenbaum):
+# ao terminar de comer, o filósofo só testa e acorda os dois vizinhos, em vez de
+# acordar todos os que esperam com notify_all
+class PhilosophersStateMonitors:
+    def __init__(self, num_philosophers=5, meals=5, context=None):
+        self.num_philosophers = num_philosophers
+        self.meals = meals  # Quantas vezes cada filósofo pensa e come
+        context = context or RunContext()
+        self.waits = context.waits  # Registro dos tempos de espera pelos garfos
+        self.events = context.events  # Registro de eventos
+        self.clock = context.clock
+        self.workload = context.workload  # Fluxos de sorteios dos participantes
+        self.work = context.work  # Fase de trabalho: time.sleep ou computação (--work)
+        self.lock = context.sync.Lock()  # Exclusão mútua do monitor
+        self.state = [THINKING for _ in range(num_philosophers)]
+        # Todas as condições compartilham o lock do monitor
+        self.conditions = [context.sync.Condition(self.lock) for _ in range(num_philosophers)]
+        self.wakeups = 0  # Vezes que um filósofo acordou do wait
+
+    # Se o filósofo está com fome e nenhum vizinho está comendo, passa a comer e é acordado
+    def test(self, philosopher_id):
+        left = (philosopher_id - 1) % self.num_philosophers
+        right = (philosopher_id + 1) % self.num_philosophers
+        if self.state[philosopher_id] == HUNGRY and self.state[left] != EATING and self.state[right] != EATING:
+            self.state[philosopher_id] = EATING
+            self.conditions[philosopher_id].notify()
+
+    def dine(self, philosopher_id):
+        stream = self.workload.stream(f"philosopher-{philosopher_id}")  # Sorteios deste participante
+        left = (philosopher_id - 1) % self.num_philosophers
+        right = (philosopher_id + 1) % self.num_philosophers
+
+        for _ in range(self.meals):
+            self.events.log("(Monitors - estados) Filósofo {} está pensando.", philosopher_id)
+            self.work(stream.uniform(0.05, 0.2))
+            start = self.clock.now_ns()
+            with self.lock:
+                self.state[philosopher_id] = HUNGRY
+                self.test(philosopher_id)
+                # Aguarda até que um vizinho o coloque no estado EATING
+                while self.state[philosopher_id] != EATING:
+                    self.conditions[philosopher_id].wait()
+                    self.wakeups += 1
+            self.waits.record("forks", self.clock.now_ns() - start)
+            self.events.log("(Monitors - estados) Filósofo {} está comendo.", philosopher_id)
+            self.work(stream.uniform(0.05, 0.2))
+            with self.lock:
+                # Volta a pensar e verifica se os vizinhos podem comer agora
+                self.state[philosopher_id] = THINKING
+                self.test(left)
+                self.test(right)
+
 # Implementação da classe utilizando Locks/Mutexes
 class PhilosophersLocks:
-    def __init__(self, num_philosophers=5):
+    label = "Locks/Mutexes"  # Rótulo dos eventos
+
+    def __init__(self, num_philosophers=5, meals=5, context=None):
         self.num_philosophers = num_philosophers
+        self.meals = meals  # Quantas vezes cada filósofo pensa e come
+        context = context or RunContext()
+        self.waits = context.waits  # Registro dos tempos de espera pelos garfos
+        self.events = context.events  # Registro de eventos
+        self.clock = context.clock
+        self.workload = context.workload  # Fluxos de sorteios dos participantes
+        self.work = context.work  # Fase de trabalho: time.sleep ou computação (--work)
         # Cria um lock para cada garfo
-        self.forks = [threading.Lock() for _ in range(num_philosophers)]
+        self.forks = [self.new_lock(context) for _ in range(num_philosophers)]
+
+    def new_lock(self, context):
+        return context.sync.Lock()
 
     def dine(self, philosopher_id):
+        stream = self.workload.stream(f"philosopher-{philosopher_id}")  # Sorteios deste participante
         left_fork = philosopher_id
         right_fork = (philosopher_id + 1) % self.num_philosophers
 
-        for _ in range(5):
-            print(f"(Locks/Mutexes) Filósofo {philosopher_id} está pensando.")
-            time.sleep(random.uniform(0.05, 0.2))
+        for _ in range(self.meals):
+            self.events.log("({}) Filósofo {} está pensando.", self.label, philosopher_id)
+            self.work(stream.uniform(0.05, 0.2))
             # Garante exclusão mútua nos dois garfos
+            start = self.clock.now_ns()
             with self.forks[left_fork]:
                 with self.forks[right_fork]:
-                    print(f"(Locks/Mutexes) Filósofo {philosopher_id} está comendo.")
-                    time.sleep(random.uniform(0.05, 0.2))
-
-# Função para executar os testes com threads
-def run_philosophers_test(philosopher_class, num_philosophers=5):
-    philosophers = philosopher_class(num_philosophers)
-    threads = []
-
-    # Cria uma thread para cada filósofo
-    for i in range(num_philosophers):
-        t = threading.Thread(target=philosophers.dine, args=(i,))
-        threads.append(t)
-        t.start()
-
-    # Aguarda todas as threads terminarem
-    for t in threads:
-        t.join()
-
-# Função para medir o tempo de execução de cada implementação
-def measure_time(philosopher_class, label):
-    print(f"Iniciando teste: {label}")
-    start_time = time.time()  # Marca o início do teste
-    run_philosophers_test(philosopher_class)
-    end_time = time.time()  # Marca o fim do teste
-    execution_time = end_time - start_time
-    print(f"{label} concluído. Tempo total: {execution_time:.2f}s\n")
-    return execution_time
-
-# Pergunta ao usuário o número de repetições para os testes
-repeat_count = int(input("Quantas vezes esses testes serão repetidos? "))
-
-# Cria um arquivo CSV para salvar os resultados dos testes
-dataset_path = "dataset/dataset.csv"
-with open(dataset_path, mode="w", newline="") as file:
-    writer = csv.writer(file)
-    writer.writerow(["Execução", "Semáforos", "Monitores", "Locks/Mutexes"])
-
-    # Realiza as repetições solicitadas
-    for i in range(1, repeat_count + 1):
-        print(f"Iniciando execução {i} de {repeat_count}...")
-        tempos = {
-            "Semáforos": measure_time(PhilosophersSemaphores, "Semáforos"),
-            "Monitores": measure_time(PhilosophersMonitors, "Monitores"),
-            "Locks/Mutexes": measure_time(PhilosophersLocks, "Locks/Mutexes"),
-        }
-        writer.writerow([i, tempos["Semáforos"], tempos["Monitores"], tempos["Locks/Mutexes"]])
-
-# Leitura do dataset e geração do gráfico comparativo
-data = pd.read_csv(dataset_path)
-avg_times = data.mean().iloc[1:]
-std_dev = data.std().iloc[1:]
-
-# Criação do gráfico de barras para comparar tempos médios
-plt.bar(avg_times.index, avg_times.values, yerr=1.96 * std_dev / np.sqrt(len(data)), capsize=5, color=['#87CEFA', '#2F4F4F', '#F4A460'])
-plt.ylim(0, max(avg_times.values + 1.96 * std_dev / np.sqrt(len(data))) * 1.2)
-for i, (value, error) in enumerate(zip(avg_times.values, 1.96 * std_dev / np.sqrt(len(data)))):
-            plt.text(i, value + error + 0.05, f"{value:.2f}s", ha='center', va='bottom')
-plt.xlabel('Mecanismo de Exclusão Mútua')
-plt.ylabel('Tempo Médio de Execução (s)')
-plt.title('Comparação de Tempos Médios: Dining-Philosophers')
-plt.savefig("graficos/comparison_average.png")
+                    self.waits.record("forks", self.clock.now_ns() - start)
+                    self.events.log("({}) Filósofo {} está comendo.", self.label, philosopher_id)
+                    self.work(stream.uniform(0.05, 0.2))
+
+# Implementação com um spinlock adaptativo por garfo. O garfo fica preso durante
+# a refeição inteira, então a média de posse passa do limite e o lock deixa de
+# insistir, bloqueando como um lock comum: o spin só ajuda em seções curtas
+class PhilosophersSpinLocks(PhilosophersLocks):
+    label = "Spinlock"
+
+    def new_lock(self, context):
+        return make_spinlock(context.sync)
+
+# Execução em que um filósofo falhou: não tem tempo (None, célula vazia no dataset)
+def failed(philosopher_class, error, context):
+    print(f"Execução abortada ({philosopher_class.__name__}): {error}")
+    if context is not None:
+        context.set_metric("erro", str(error))
+    return None
+
+# Função para executar os testes com threads e medir o tempo de execução. Com
+# "watchdog" > 0, os garfos são observados por um DeadlockWatchdog; se ele
+# encontrar um ciclo de espera, as threads são abortadas e o resultado é None.
+# Se algum filósofo (thread ou tarefa) falhar, o resultado também é None
+def run_philosophers_test(philosopher_class, num_philosophers=5, meals=5, context=None, watchdog=0.0):
+    # Versões com corrotinas usam uma tarefa do asyncio por filósofo
+    if inspect.iscoroutinefunction(philosopher_class.dine):
+        try:
+            return run_philosophers_test_async(philosopher_class, num_philosophers, meals, context)
+        except Exception as error:
+            return failed(philosopher_class, error, context)
+
+    philosophers = philosopher_class(num_philosophers, meals, context)
+    threads = context.clock.threads if context is not None else None  # Escalonador do relógio virtual
+
+    # Monitores reservam os dois garfos de uma vez e não entram em deadlock,
+    # então só os garfos que são semáforos/locks são observados. No relógio
+    # virtual o próprio escalonador detecta o deadlock (VirtualDeadlock)
+    detector = None
+    forks = getattr(philosophers, "forks", None)
+    if watchdog > 0 and threads is None and forks and hasattr(forks[0], "acquire"):
+        detector = DeadlockWatchdog(watchdog, context.sync if context is not None else None)
+        philosophers.forks = detector.watch(philosophers.forks)
+        detector.start()
+
+    errors = []  # Exceções dos filósofos, com threads próprias ou do pool
+
+    def dine(philosopher_id):
+        try:
+            philosophers.dine(philosopher_id)
+        except DeadlockDetected:
+            pass  # Execução abortada pelo watchdog
+        except Exception as error:
+            errors.append(error)
+
+    if threads is not None:
+        # No relógio virtual, o escalonador de eventos discretos executa a rodada em tempo simulado
+        elapsed = threads.run([functools.partial(dine, i) for i in range(num_philosophers)],
+                              [f"Filósofo {i}" for i in range(num_philosophers)])
+    elif context is not None and context.pool is not None:
+        # Com o pool (--pool), as threads persistentes executam a rodada e o custo de criá-las é gravado à parte
+        elapsed = context.pool.run([functools.partial(dine, i) for i in range(num_philosophers)],
+                                   [f"Filósofo {i}" for i in range(num_philosophers)])
+        context.set_metric("pool.setup_s", context.pool.take_setup())
+    else:
+        # As threads são criadas e iniciadas antes da região medida e aguardam nesta
+        # barreira; o tempo só começa quando todas chegaram, então o custo de criar
+        # milhares de threads não entra na curva de escalabilidade
+        start_barrier = threading.Barrier(num_philosophers + 1)
+
+        def start_and_dine(philosopher_id):
+            start_barrier.wait()
+            dine(philosopher_id)
+
+        # Cria uma thread para cada filósofo
+        threads = []
+        for i in range(num_philosophers):
+            t = threading.Thread(target=start_and_dine, args=(i,), name=f"Filósofo {i}")
+            threads.append(t)
+            t.start()
+
+        start_barrier.wait()  # Libera todos os filósofos de uma vez
+        start_time = time.perf_counter()  # Marca o início do teste
+
+        # Aguarda todas as threads terminarem
+        for t in threads:
+            t.join()
+
+        elapsed = time.perf_counter() - start_time
+
+    # Monitores contam quantas vezes os filósofos acordaram do wait
+    if context is not None and hasattr(philosophers, "wakeups"):
+        context.set_metric("wakeups", philosophers.wakeups)
+        context.set_metric("wakeups_por_refeicao", philosophers.wakeups / (num_philosophers * meals))
+
+    if detector:
+        detector.stop()
+        if context is not None:
+            context.set_metric("deadlock", 1 if detector.cycle else 0)
+        if detector.cycle:
+            print(f"Deadlock detectado ({philosopher_class.__name__}): {format_cycle(detector.cycle)}")
+            if context is not None:
+                context.set_metric("deadlock_cycle", format_cycle(detector.cycle))
+            return None
+    if errors:
+        return failed(philosopher_class, errors[0], context)
+    return elapsed
+
+# Executa um teste com os parâmetros informados e registra a vazão (refeições/s)
+# e o tempo médio de fome (de pedir os garfos até começar a comer).
+# Uma execução abortada por deadlock ou falha não tem tempo (None, célula vazia no dataset)
+def run_once(philosopher_class, params, context):
+    elapsed = run_philosophers_test(philosopher_class, params["philosophers"], params["meals"], context, params["watchdog"])
+    if elapsed is not None:
+        context.set_metric("refeicoes_por_s", params["philosophers"] * params["meals"] / elapsed)
+    hunger = context.waits.merged().get("forks")
+    if hunger is not None:
+        context.set_metric("fome_media_s", hunger.mean() / 1e9)
+    return elapsed
+
+# Mecanismos comparados, na ordem das colunas do dataset: chave -> (rótulo, classe)
+MECHANISMS = {
+    "semaphores": ("Semáforos", PhilosophersSemaphores),
+    "monitors": ("Monitores", PhilosophersMonitors),
+    "monitors-state": ("Monitores (condição por filósofo)", PhilosophersStateMonitors),
+    "locks": ("Locks/Mutexes", PhilosophersLocks),
+    "spinlock": ("Spinlock adaptativo", PhilosophersSpinLocks),
+    "semaphores-asyncio": ("Semáforos (asyncio)", AsyncPhilosophersSemaphores),
+    "monitors-asyncio": ("Monitores (asyncio)", AsyncPhilosophersMonitors),
+    "locks-asyncio": ("Locks/Mutexes (asyncio)", AsyncPhilosophersLocks),
+}
+
+if __name__ == "__main__":
+    from common.runner import main
+    main(default_problem="dining-philosophers")
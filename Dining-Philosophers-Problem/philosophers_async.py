@@ -0,0 +1,122 @@
+import asyncio
+from common.context import RunContext
+
+# Versões dos Filósofos Comensais com corrotinas: cada filósofo é uma tarefa do
+# asyncio e os garfos usam asyncio.Semaphore, asyncio.Condition e asyncio.Lock.
+# Como tudo roda em uma única thread, é possível simular milhares de filósofos
+# e comparar o custo da troca de tarefas com o da troca de threads do SO.
+
+# Implementação da classe utilizando Semáforos do asyncio
+class AsyncPhilosophersSemaphores:
+    def __init__(self, num_philosophers=5, meals=5, context=None):
+        self.num_philosophers = num_philosophers
+        self.meals = meals  # Quantas vezes cada filósofo pensa e come
+        context = context or RunContext()
+        self.waits = context.waits  # Registro dos tempos de espera pelos garfos
+        self.events = context.events  # Registro de eventos
+        self.workload = context.workload  # Fluxos de sorteios dos participantes
+        self.clock = context.clock  # Relógio real ou virtual
+        # Cria um semáforo para cada garfo
+        self.forks = [asyncio.Semaphore(1) for _ in range(num_philosophers)]
+
+    async def dine(self, philosopher_id):
+        stream = self.workload.stream(f"philosopher-{philosopher_id}")  # Sorteios deste participante
+        # Define os garfos esquerdo e direito para cada filósofo
+        left_fork = philosopher_id
+        right_fork = (philosopher_id + 1) % self.num_philosophers
+
+        for _ in range(self.meals):  # Cada filósofo realiza o ciclo "meals" vezes
+            self.events.log("(Semaphores - asyncio) Filósofo {} está pensando.", philosopher_id)
+            await asyncio.sleep(stream.uniform(0.05, 0.2))  # Simula o tempo de pensar
+            # Pega os garfos (semáforos)
+            start = self.clock.now_ns()
+            await self.forks[left_fork].acquire()
+            await self.forks[right_fork].acquire()
+            self.waits.record("forks", self.clock.now_ns() - start)
+            self.events.log("(Semaphores - asyncio) Filósofo {} está comendo.", philosopher_id)
+            await asyncio.sleep(stream.uniform(0.05, 0.2))  # Simula o tempo de comer
+            # Libera os garfos (semáforos)
+            self.forks[left_fork].release()
+            self.forks[right_fork].release()
+
+# Implementação da classe utilizando Monitores do asyncio
+class AsyncPhilosophersMonitors:
+    def __init__(self, num_philosophers=5, meals=5, context=None):
+        self.num_philosophers = num_philosophers
+        self.meals = meals  # Quantas vezes cada filósofo pensa e come
+        context = context or RunContext()
+        self.waits = context.waits  # Registro dos tempos de espera pelos garfos
+        self.events = context.events  # Registro de eventos
+        self.workload = context.workload  # Fluxos de sorteios dos participantes
+        self.clock = context.clock  # Relógio real ou virtual
+        # Estado dos garfos: True se ocupado, False se livre
+        self.forks = [False for _ in range(num_philosophers)]
+        self.condition = asyncio.Condition()  # Condição para controle de acesso
+
+    async def dine(self, philosopher_id):
+        stream = self.workload.stream(f"philosopher-{philosopher_id}")  # Sorteios deste participante
+        left_fork = philosopher_id
+        right_fork = (philosopher_id + 1) % self.num_philosophers
+
+        for _ in range(self.meals):
+            self.events.log("(Monitors - asyncio) Filósofo {} está pensando.", philosopher_id)
+            await asyncio.sleep(stream.uniform(0.05, 0.2))
+            start = self.clock.now_ns()
+            async with self.condition:
+                # Aguarda até que os dois garfos estejam disponíveis
+                while self.forks[left_fork] or self.forks[right_fork]:
+                    await self.condition.wait()
+                # Reserva os garfos
+                self.forks[left_fork] = True
+                self.forks[right_fork] = True
+            self.waits.record("forks", self.clock.now_ns() - start)
+            self.events.log("(Monitors - asyncio) Filósofo {} está comendo.", philosopher_id)
+            await asyncio.sleep(stream.uniform(0.05, 0.2))
+            async with self.condition:
+                # Libera os garfos e notifica as outras tarefas
+                self.forks[left_fork] = False
+                self.forks[right_fork] = False
+                self.condition.notify_all()
+
+# Implementação da classe utilizando Locks/Mutexes do asyncio
+class AsyncPhilosophersLocks:
+    def __init__(self, num_philosophers=5, meals=5, context=None):
+        self.num_philosophers = num_philosophers
+        self.meals = meals  # Quantas vezes cada filósofo pensa e come
+        context = context or RunContext()
+        self.waits = context.waits  # Registro dos tempos de espera pelos garfos
+        self.events = context.events  # Registro de eventos
+        self.workload = context.workload  # Fluxos de sorteios dos participantes
+        self.clock = context.clock  # Relógio real ou virtual
+        # Cria um lock para cada garfo
+        self.forks = [asyncio.Lock() for _ in range(num_philosophers)]
+
+    async def dine(self, philosopher_id):
+        stream = self.workload.stream(f"philosopher-{philosopher_id}")  # Sorteios deste participante
+        left_fork = philosopher_id
+        right_fork = (philosopher_id + 1) % self.num_philosophers
+
+        for _ in range(self.meals):
+            self.events.log("(Locks/Mutexes - asyncio) Filósofo {} está pensando.", philosopher_id)
+            await asyncio.sleep(stream.uniform(0.05, 0.2))
+            # Garante exclusão mútua nos dois garfos
+            start = self.clock.now_ns()
+            async with self.forks[left_fork]:
+                async with self.forks[right_fork]:
+                    self.waits.record("forks", self.clock.now_ns() - start)
+                    self.events.log("(Locks/Mutexes - asyncio) Filósofo {} está comendo.", philosopher_id)
+                    await asyncio.sleep(stream.uniform(0.05, 0.2))
+
+# Executa os testes com uma tarefa por filósofo e mede o tempo de execução
+def run_philosophers_test_async(philosopher_class, num_philosophers=5, meals=5, context=None):
+    context = context or RunContext()
+
+    async def run():
+        philosophers = philosopher_class(num_philosophers, meals, context)  # Criado dentro do laço de eventos
+        dinners = [philosophers.dine(i) for i in range(num_philosophers)]  # Criadas fora da região medida
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        await asyncio.gather(*dinners)
+        return loop.time() - start_time
+
+    return context.clock.run(run())
@@ -0,0 +1,122 @@
+import threading
+
+# Watchdog de deadlock para as versões com threads dos Filósofos Comensais.
+# Semáforos e Locks/Mutexes pegam sempre o garfo esquerdo e depois o direito,
+# então todos podem ficar com um garfo esperando o vizinho para sempre. O
+# watchdog mantém um grafo de espera (quem possui cada garfo e qual garfo cada
+# thread espera) e procura ciclos periodicamente; ao achar um, aborta a execução
+# em vez de deixar o benchmark travado.
+#
+# O custo por aquisição é um acquire não bloqueante e duas atribuições; só quem
+# precisa esperar passa a esperar em fatias de "interval" segundos, o que
+# permite deixá-lo ligado em varreduras longas. Com --count-sync, a espera em
+# fatias conta como uma única aquisição bloqueada, como um acquire comum.
+
+class DeadlockDetected(Exception):
+    def __init__(self, cycle):
+        super().__init__("Deadlock detectado: " + format_cycle(cycle))
+        self.cycle = cycle
+
+# Ciclo como lista de (thread, garfo esperado, thread dona do garfo)
+def format_cycle(cycle):
+    return " -> ".join(f"{waiter} espera garfo {fork} (com {owner})" for waiter, fork, owner in cycle)
+
+# Garfo observado: mesma interface do semáforo/lock original (acquire, release e with)
+class WatchedFork:
+    def __init__(self, watchdog, index, primitive):
+        self.watchdog = watchdog
+        self.index = index
+        self.primitive = primitive
+
+    def acquire(self):
+        watchdog = self.watchdog
+        me = threading.get_ident()
+        if not self.primitive.acquire(blocking=False):
+            # Garfo ocupado: registra a aresta de espera e aguarda em fatias,
+            # verificando se o watchdog abortou a execução
+            watchdog.waiting[me] = self.index
+            counters = watchdog.counters
+            counts = counters.pause() if counters is not None else None
+            try:
+                while not self.primitive.acquire(timeout=watchdog.interval):
+                    if watchdog.aborted.is_set():
+                        del watchdog.waiting[me]
+                        raise DeadlockDetected(watchdog.cycle)
+            finally:
+                if counters is not None:
+                    counters.resume(counts)
+            del watchdog.waiting[me]
+        watchdog.owners[self.index] = me
+        return True
+
+    def release(self):
+        # Limpa o dono antes de liberar para o grafo nunca apontar para quem já soltou o garfo
+        self.watchdog.owners[self.index] = None
+        self.primitive.release()
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, *exc):
+        self.release()
+
+class DeadlockWatchdog:
+    def __init__(self, interval=0.1, sync=None):
+        self.interval = interval  # Intervalo entre verificações (e tempo máximo até a detecção, vezes dois)
+        self.counters = getattr(sync, "counters", None)  # Contadores do --count-sync, se houver
+        self.owners = []  # Garfo -> thread que o possui (None se livre)
+        self.waiting = {}  # Thread -> garfo que ela espera
+        self.cycle = None  # Ciclo encontrado, se houver
+        self.aborted = threading.Event()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, name="Watchdog", daemon=True)
+
+    # Substitui os garfos por versões observadas
+    def watch(self, forks):
+        self.owners = [None] * len(forks)
+        return [WatchedFork(self, index, fork) for index, fork in enumerate(forks)]
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+
+    def run(self):
+        suspect = None
+        while not self.stopped.wait(self.interval):
+            cycle = self.find_cycle()
+            # O grafo é lido sem travas, então um ciclo só é aceito se aparecer
+            # igual em duas verificações seguidas (um deadlock real não muda)
+            if cycle and cycle == suspect:
+                names = {thread.ident: thread.name for thread in threading.enumerate()}
+                self.cycle = [(names.get(waiter, waiter), fork, names.get(owner, owner)) for waiter, fork, owner in cycle]
+                self.aborted.set()
+                return
+            suspect = cycle
+
+    # Cada thread espera no máximo um garfo, então basta seguir as arestas
+    # thread -> dono do garfo esperado a partir de cada thread em espera
+    def find_cycle(self):
+        waiting = dict(self.waiting)
+        visited = set()
+        for start in waiting:
+            path = []
+            position = {}
+            thread = start
+            while thread in waiting and thread not in visited:
+                visited.add(thread)
+                position[thread] = len(path)
+                fork = waiting[thread]
+                owner = self.owners[fork]
+                if owner is None:
+                    break
+                path.append((thread, fork, owner))
+                if owner in position:
+                    cycle = path[position[owner]:]
+                    # Começa pela menor thread para que o mesmo ciclo seja sempre igual
+                    first = min(range(len(cycle)), key=lambda i: cycle[i][0])
+                    return cycle[first:] + cycle[:first]
+                thread = owner
+        return None
@@ -1,155 +1,404 @@
+import functools
+import inspect
+import sys
 import threading
 import time
-import random
 import os
-import csv
-import matplotlib.pyplot as plt
-import pandas as pd
-import numpy as np
 
-# Certifique-se de que as pastas necessárias existem
-if not os.path.exists("dataset"):
-    os.makedirs("dataset")
-if not os.path.exists("graficos"):
-    os.makedirs("graficos")
+# Permite importar os módulos vizinhos e o pacote "common" (na raiz do repositório),
+# inclusive quando este arquivo é carregado pelo runner a partir de outro diretório
+PROBLEM_DIR = os.path.dirname(os.path.abspath(__file__))
+for path in (PROBLEM_DIR, os.path.dirname(PROBLEM_DIR)):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from common.context import RunContext
+from common.spinlock import make_spinlock
+from buffer_storage import make_storage
+from buffer_processes import ProcessBufferSemaphores, ProcessBufferMonitors, ProcessBufferLocks
+from buffer_stdlib import BufferQueue, BufferSimpleQueue, BufferDeque
+from buffer_async import AsyncBufferSemaphores, AsyncBufferMonitors, AsyncBufferLocks, measure_time_async
+
+TITLE = "Producer-Consumer"
+
+# Parâmetros do teste e seus valores padrão (o runner permite varrer vários valores de cada um)
+PARAMETERS = {
+    "buffer_size": 5,  # Capacidade do buffer compartilhado
+    "total_items": 100,  # Itens produzidos e consumidos em cada execução
+    "producers": 1,  # Threads (ou processos/tarefas) produtoras
+    "consumers": 1,  # Threads (ou processos/tarefas) consumidoras
+    "backend": "ring",  # Armazenamento do buffer: "ring" (circular pré-alocado) ou "list" (lista original)
+    "batch_size": 1,  # Itens por rajada (produce_many/consume_many); 1 mantém um item por chamada
+}
+
+# Menores valores aceitos: sem produtores, consumidores ou espaço no buffer o teste não termina
+MINIMUMS = {
+    "buffer_size": 1,
+    "total_items": 1,
+    "producers": 1,
+    "consumers": 1,
+    "batch_size": 1,
+}
 
 # Implementação do problema Produtor-Consumidor usando Locks e Mutexes
 class BufferLocks:
-    def __init__(self, size):
-        self.buffer = []  # Lista que atuará como o buffer compartilhado
+    label = "Locks/Mutexes"  # Rótulo dos eventos
+
+    def __init__(self, size, backend="ring", context=None):
+        self.buffer = make_storage(backend, size)  # Armazenamento compartilhado (circular por padrão)
         self.size = size  # Tamanho máximo do buffer
-        self.lock = threading.Lock()  # Lock para exclusão mútua
-        self.not_full = threading.Condition(self.lock)  # Condição para buffer não cheio
-        self.not_empty = threading.Condition(self.lock)  # Condição para buffer não vazio
+        context = context or RunContext()
+        self.waits = context.waits  # Registro dos tempos de espera
+        self.events = context.events  # Registro de eventos
+        self.clock = context.clock  # Relógio real ou virtual
+        self.lock = self.new_lock(context)  # Lock para exclusão mútua
+        self.not_full = context.sync.Condition(self.lock)  # Condição para buffer não cheio
+        self.not_empty = context.sync.Condition(self.lock)  # Condição para buffer não vazio
+
+    def new_lock(self, context):
+        return context.sync.Lock()
 
     def produce(self, item):
+        start = self.clock.now_ns()
         with self.not_full:
             while len(self.buffer) >= self.size:  # Aguarda até que haja espaço no buffer
                 self.not_full.wait()
-            self.buffer.append(item)  # Adiciona o item ao buffer
-            print(f"(Locks/Mutexes) Produtor produziu: {item}")
+            self.waits.record("produce", self.clock.now_ns() - start)
+            self.buffer.put(item)  # Adiciona o item ao buffer
             self.not_empty.notify()  # Notifica que há um item disponível
+        self.events.log("({}) Produtor produziu: {}", self.label, item)
 
     def consume(self):
+        start = self.clock.now_ns()
         with self.not_empty:
             while len(self.buffer) == 0:  # Aguarda até que haja itens no buffer
                 self.not_empty.wait()
-            item = self.buffer.pop(0)  # Remove o item do buffer
-            print(f"(Locks/Mutexes) Consumidor consumiu: {item}")
+            self.waits.record("consume", self.clock.now_ns() - start)
+            item = self.buffer.get()  # Remove o item do buffer
             self.not_full.notify()  # Notifica que há espaço disponível no buffer
-            return item
+        self.events.log("({}) Consumidor consumiu: {}", self.label, item)
+        return item
+
+    # Coloca todos os itens, tantos quantos couberem a cada aquisição, com uma notificação por lote
+    def produce_many(self, items):
+        position = 0
+        while position < len(items):
+            start = self.clock.now_ns()
+            with self.not_full:
+                while len(self.buffer) >= self.size:  # Aguarda até que haja espaço no buffer
+                    self.not_full.wait()
+                self.waits.record("produce", self.clock.now_ns() - start)
+                count = min(self.size - len(self.buffer), len(items) - position)
+                self.buffer.put_many(items[position:position + count])
+                self.not_empty.notify(count)  # Até um consumidor por item novo
+            position += count
+        self.events.log("({}) Produtor produziu {} itens", self.label, len(items))
+
+    # Retira até max_n itens de uma vez; devolve [] se o timeout expirar com o buffer vazio
+    def consume_many(self, max_n, timeout=None):
+        start = self.clock.now_ns()
+        with self.not_empty:
+            if not self.not_empty.wait_for(lambda: len(self.buffer) > 0, timeout):
+                return []
+            self.waits.record("consume", self.clock.now_ns() - start)
+            items = self.buffer.get_many(min(max_n, len(self.buffer)))
+            self.not_full.notify(len(items))  # Até um produtor por espaço liberado
+        self.events.log("({}) Consumidor consumiu {} itens", self.label, len(items))
+        return items
+
+# Implementação do problema Produtor-Consumidor com o spinlock adaptativo: a mesma
+# estrutura de BufferLocks, mas o lock insiste um pouco antes de bloquear, já que
+# a seção crítica (colocar ou tirar um item) é muito curta. Com --count-sync,
+# make_spinlock conta cada aquisição lógica uma vez, não cada tentativa de giro
+class BufferSpinLocks(BufferLocks):
+    label = "Spinlock"
+
+    def new_lock(self, context):
+        return make_spinlock(context.sync)
 
 # Implementação do problema Produtor-Consumidor usando Monitores
 class BufferMonitors:
-    def __init__(self, size):
-        self.buffer = []
+    def __init__(self, size, backend="ring", context=None):
+        self.buffer = make_storage(backend, size)  # Armazenamento compartilhado (circular por padrão)
         self.size = size
-        self.condition = threading.Condition()
+        context = context or RunContext()
+        self.waits = context.waits
+        self.events = context.events
+        self.clock = context.clock
+        self.condition = context.sync.Condition()
 
     def produce(self, item):
+        start = self.clock.now_ns()
         with self.condition:
             while len(self.buffer) >= self.size:
                 self.condition.wait()
-            self.buffer.append(item)
-            print(f"(Monitors) Produtor produziu: {item}")
+            self.waits.record("produce", self.clock.now_ns() - start)
+            self.buffer.put(item)
             self.condition.notify_all()
+        self.events.log("(Monitors) Produtor produziu: {}", item)
 
     def consume(self):
+        start = self.clock.now_ns()
         with self.condition:
             while len(self.buffer) == 0:
                 self.condition.wait()
-            item = self.buffer.pop(0)
-            print(f"(Monitors) Consumidor consumiu: {item}")
+            self.waits.record("consume", self.clock.now_ns() - start)
+            item = self.buffer.get()
+            self.condition.notify_all()
+        self.events.log("(Monitors) Consumidor consumiu: {}", item)
+        return item
+
+    def produce_many(self, items):
+        position = 0
+        while position < len(items):
+            start = self.clock.now_ns()
+            with self.condition:
+                while len(self.buffer) >= self.size:
+                    self.condition.wait()
+                self.waits.record("produce", self.clock.now_ns() - start)
+                count = min(self.size - len(self.buffer), len(items) - position)
+                self.buffer.put_many(items[position:position + count])
+                self.condition.notify_all()  # Um único notify_all por lote
+            position += count
+        self.events.log("(Monitors) Produtor produziu {} itens", len(items))
+
+    def consume_many(self, max_n, timeout=None):
+        start = self.clock.now_ns()
+        with self.condition:
+            if not self.condition.wait_for(lambda: len(self.buffer) > 0, timeout):
+                return []
+            self.waits.record("consume", self.clock.now_ns() - start)
+            items = self.buffer.get_many(min(max_n, len(self.buffer)))
             self.condition.notify_all()
-            return item
+        self.events.log("(Monitors) Consumidor consumiu {} itens", len(items))
+        return items
 
 # Implementação do problema Produtor-Consumidor usando Semáforos
 class BufferSemaphores:
-    def __init__(self, size):
-        self.buffer = []  # Lista que atuará como o buffer compartilhado
+    def __init__(self, size, backend="ring", context=None):
+        self.buffer = make_storage(backend, size)  # Armazenamento compartilhado (circular por padrão)
         self.size = size  # Tamanho máximo do buffer
-        self.empty = threading.Semaphore(size)  # Contador de espaços vazios no buffer
-        self.full = threading.Semaphore(0)  # Contador de itens disponíveis no buffer
-        self.mutex = threading.Semaphore(1)  # Semáforo binário para exclusão mútua
+        context = context or RunContext()
+        self.waits = context.waits  # Registro dos tempos de espera
+        self.events = context.events  # Registro de eventos
+        self.clock = context.clock
+        self.empty = context.sync.Semaphore(size)  # Contador de espaços vazios no buffer
+        self.full = context.sync.Semaphore(0)  # Contador de itens disponíveis no buffer
+        self.mutex = context.sync.Semaphore(1)  # Semáforo binário para exclusão mútua
 
     def produce(self, item):
+        start = self.clock.now_ns()
         self.empty.acquire()  # Decrementa o semáforo de espaços vazios
         self.mutex.acquire()  # Garante exclusão mútua
-        self.buffer.append(item)  # Adiciona o item ao buffer
-        print(f"(Semaphores) Produtor produziu: {item}")
+        self.waits.record("produce", self.clock.now_ns() - start)
+        self.buffer.put(item)  # Adiciona o item ao buffer
         self.mutex.release()  # Libera o semáforo binário
+        self.events.log("(Semaphores) Produtor produziu: {}", item)
         self.full.release()  # Incrementa o semáforo de itens disponíveis
 
     def consume(self):
+        start = self.clock.now_ns()
         self.full.acquire()  # Decrementa o semáforo de itens disponíveis
         self.mutex.acquire()  # Garante exclusão mútua
-        item = self.buffer.pop(0)  # Remove o primeiro item do buffer
-        print(f"(Semaphores) Consumidor consumiu: {item}")
+        self.waits.record("consume", self.clock.now_ns() - start)
+        item = self.buffer.get()  # Remove o primeiro item do buffer
         self.mutex.release()  # Libera o semáforo binário
+        self.events.log("(Semaphores) Consumidor consumiu: {}", item)
         self.empty.release()  # Incrementa o semáforo de espaços vazios
         return item
 
-# Funções do produtor e consumidor
-def producer(buffer, total_items):
+    # Espera por um espaço e pega, sem bloquear, os demais que já estiverem livres;
+    # cada lote entra no buffer com uma única passagem pelo mutex
+    def produce_many(self, items):
+        position = 0
+        while position < len(items):
+            start = self.clock.now_ns()
+            self.empty.acquire()  # Aguarda pelo menos um espaço vazio
+            count = 1
+            while position + count < len(items) and self.empty.acquire(False):
+                count += 1
+            self.mutex.acquire()
+            self.waits.record("produce", self.clock.now_ns() - start)
+            self.buffer.put_many(items[position:position + count])
+            self.mutex.release()
+            self.full.release(count)  # Libera os itens do lote de uma vez
+            position += count
+        self.events.log("(Semaphores) Produtor produziu {} itens", len(items))
+
+    # Retira até max_n itens de uma vez; devolve [] se o timeout expirar com o buffer vazio
+    def consume_many(self, max_n, timeout=None):
+        start = self.clock.now_ns()
+        if not self.full.acquire(timeout=timeout):
+            return []
+        count = 1
+        while count < max_n and self.full.acquire(False):
+            count += 1
+        self.mutex.acquire()
+        self.waits.record("consume", self.clock.now_ns() - start)
+        items = self.buffer.get_many(count)
+        self.mutex.release()
+        self.empty.release(count)
+        self.events.log("(Semaphores) Consumidor consumiu {} itens", len(items))
+        return items
+
+# Funções do produtor e consumidor; "stream" é o fluxo de sorteios do participante e
+# "work" executa as fases de produção e consumo (time.sleep ou computação, --work)
+def producer(buffer, total_items, stream, work=time.sleep):
     for _ in range(total_items):
-        item = random.randint(1, 100)  # Gera um número aleatório
+        item = stream.randint(1, 100)  # Gera um número aleatório
         buffer.produce(item)  # Adiciona o item ao buffer
-        time.sleep(random.uniform(0.01, 0.05))  # Simula atraso na produção
+        work(stream.uniform(0.01, 0.05))  # Simula atraso na produção
 
-def consumer(buffer, total_items):
+def consumer(buffer, total_items, stream, work=time.sleep):
     for _ in range(total_items):
         buffer.consume()  # Remove um item do buffer
-        time.sleep(random.uniform(0.01, 0.05))  # Simula atraso no consumo
+        work(stream.uniform(0.01, 0.05))  # Simula atraso no consumo
+
+# Versões em rajadas (batch_size > 1): o produtor gera "batch_size" itens de uma
+# vez e os entrega com produce_many; o consumidor retira até "batch_size" itens
+# por chamada de consume_many. O atraso do produtor é sorteado uma vez por rajada.
+def producer_batches(buffer, total_items, stream, work, batch_size):
+    remaining = total_items
+    while remaining > 0:
+        items = [stream.randint(1, 100) for _ in range(min(batch_size, remaining))]
+        buffer.produce_many(items)
+        remaining -= len(items)
+        work(stream.uniform(0.01, 0.05))  # Simula atraso entre rajadas
+
+# Quantos itens cada consume_many devolve depende do escalonamento, então o
+# consumidor sorteia um atraso por item (e não por chamada): a quantidade de
+# sorteios fica fixa e o trace de --workload paired serve a todos os mecanismos.
+# Cada chamada espera a média dos atrasos dos itens que retirou.
+def consumer_batches(buffer, total_items, stream, work, batch_size):
+    delays = [stream.uniform(0.01, 0.05) for _ in range(total_items)]
+    consumed = 0
+    while consumed < total_items:
+        count = len(buffer.consume_many(min(batch_size, total_items - consumed)))
+        work(sum(delays[consumed:consumed + count]) / count)
+        consumed += count
+
+# Executa a tarefa de um participante depois que todos estão prontos na barreira de
+# largada. Threads guardam a exceção, se houver, em "errors" para que a repetição seja
+# descartada; processos (errors None) deixam a exceção encerrá-los com código de erro
+def run_task(start_barrier, errors, target, *args):
+    start_barrier.wait()
+    if errors is None:
+        target(*args)
+        return
+    try:
+        target(*args)
+    except Exception as error:
+        errors.append(error)
+
+# Divide o total de itens entre os participantes (os primeiros recebem o resto)
+def split_items(total_items, parts):
+    base, extra = divmod(total_items, parts)
+    return [base + (1 if i < extra else 0) for i in range(parts)]
+
+# Execução em que um participante falhou: não tem tempo (None, célula vazia no dataset)
+def failed(buffer_class, error, context):
+    print(f"Execução abortada ({buffer_class.__name__}): {error}")
+    context.set_metric("erro", str(error))
+    return None
+
+# Função para medir o tempo de execução de um teste com N produtores e M consumidores
+# Com batch_size > 1, os itens são produzidos e consumidos em rajadas (produce_many/consume_many).
+# Se alguma thread, processo ou tarefa falhar, o resultado é None
+def measure_time(buffer_class, total_items, size=5, backend="ring", num_producers=1, num_consumers=1, context=None,
+                 batch_size=1):
+    context = context or RunContext()
 
-# Função para medir o tempo de execução de um teste
-def measure_time(buffer_class, total_items):
-    buffer = buffer_class(5)  # Cria uma instância do buffer com tamanho 5
-    start_time = time.time()
+    # Versões com corrotinas usam tarefas do asyncio no lugar de threads
+    if inspect.iscoroutinefunction(buffer_class.produce):
+        try:
+            return measure_time_async(buffer_class, split_items(total_items, num_producers),
+                                      split_items(total_items, num_consumers), size, backend, context, batch_size)
+        except Exception as error:
+            return failed(buffer_class, error, context)
 
-    # Cria as threads para o produtor e consumidor
-    producer_thread = threading.Thread(target=producer, args=(buffer, total_items))
-    consumer_thread = threading.Thread(target=consumer, args=(buffer, total_items))
+    buffer = buffer_class(size, backend, context)  # Cria uma instância do buffer com o armazenamento escolhido
+    worker_class = getattr(buffer_class, "worker_class", threading.Thread)  # Threads ou processos
+    tasks = []
 
-    # Inicia as threads
-    producer_thread.start()
-    consumer_thread.start()
+    # Tarefas dos produtores e dos consumidores, dividindo os itens entre elas
+    batches = (batch_size,) if batch_size > 1 else ()
+    produce, consume = (producer_batches, consumer_batches) if batches else (producer, consumer)
+    for i, count in enumerate(split_items(total_items, num_producers), start=1):
+        tasks.append((produce, (buffer, count, context.workload.stream(f"producer-{i}"), context.work) + batches))
+    for i, count in enumerate(split_items(total_items, num_consumers), start=1):
+        tasks.append((consume, (buffer, count, context.workload.stream(f"consumer-{i}"), context.work) + batches))
+
+    # No relógio virtual, o escalonador de eventos discretos executa a rodada em tempo simulado
+    if context.clock.threads is not None:
+        try:
+            return context.clock.threads.run([functools.partial(target, *args) for target, args in tasks])
+        except Exception as error:
+            return failed(buffer_class, error, context)
+
+    # Com o pool (--pool), as threads persistentes executam a rodada e o custo de criá-las é gravado à parte
+    if context.pool is not None and worker_class is threading.Thread:
+        try:
+            elapsed = context.pool.run([functools.partial(target, *args) for target, args in tasks])
+        except Exception as error:
+            elapsed = failed(buffer_class, error, context)
+        context.set_metric("pool.setup_s", context.pool.take_setup())
+        return elapsed
+
+    # Cria e inicia as threads (ou processos) antes da região medida; todos aguardam na
+    # barreira e o tempo só começa quando foram liberados, então o custo do fork dos
+    # processos não entra na medida, como o de criar threads também não entra
+    errors = [] if worker_class is threading.Thread else None  # Exceções das threads
+    start_barrier = getattr(buffer_class, "barrier_class", threading.Barrier)(len(tasks) + 1)
+    threads = [worker_class(target=run_task, args=(start_barrier, errors, target) + args) for target, args in tasks]
+    for t in threads:
+        t.start()
+
+    start_barrier.wait()  # Libera todos os participantes de uma vez
+    start_time = time.perf_counter()
 
     # Aguarda a finalização das threads
-    producer_thread.join()
-    consumer_thread.join()
+    for t in threads:
+        t.join()
 
-    end_time = time.time()
+    end_time = time.perf_counter()
+
+    # Buffers entre processos precisam liberar a memória compartilhada
+    if hasattr(buffer, "close"):
+        buffer.close()
+
+    # Processos que terminaram com erro (a exceção fica no processo filho)
+    errors = (errors or []) + [f"{t.name} terminou com código {t.exitcode}"
+                               for t in threads if getattr(t, "exitcode", 0)]
+    if errors:
+        return failed(buffer_class, errors[0], context)
     return end_time - start_time
 
-# Pergunta ao usuário quantas vezes os testes devem ser repetidos
-repeat_count = int(input("Quantas vezes esses testes serão repetidos? "))
-
-dataset_path = "dataset/dataset.csv"
-
-# Criação do arquivo CSV para armazenar os resultados
-with open(dataset_path, mode="w", newline="") as file:
-    writer = csv.writer(file)
-    writer.writerow(["Execução", "Semáforos", "Monitores", "Locks/Mutexes"])
-
-    for i in range(1, repeat_count + 1):
-        print(f"Iniciando execução {i} de {repeat_count}...")
-        tempos = {
-            "Semáforos": measure_time(BufferSemaphores, 100),
-            "Monitores": measure_time(BufferMonitors, 100),
-            "Locks/Mutexes": measure_time(BufferLocks, 100),
-        }
-        writer.writerow([i, tempos["Semáforos"], tempos["Monitores"], tempos["Locks/Mutexes"]])
-
-# Geração do gráfico comparativo com base nos resultados
-data = pd.read_csv(dataset_path)
-avg_times = data.mean().iloc[1:]
-std_dev = data.std().iloc[1:]
-
-plt.bar(avg_times.index, avg_times.values, yerr=1.96 * std_dev / np.sqrt(len(data)), capsize=5, color=['#87CEFA', '#2F4F4F', '#F4A460'])
-plt.ylim(0, max(avg_times.values + 1.96 * std_dev / np.sqrt(len(data))) * 1.2)
-for i, (value, error) in enumerate(zip(avg_times.values, 1.96 * std_dev / np.sqrt(len(data)))):
-            plt.text(i, value + error + 0.05, f"{value:.2f}s", ha='center', va='bottom')
-plt.xlabel('Mecanismo de Exclusão Mútua')
-plt.ylabel('Tempo Médio de Execução (s)')
-plt.title('Comparação de Tempos Médios: Producer-Consumer')
-plt.savefig("graficos/comparison_average.png")
\ No newline at end of file
+# Executa um teste com os parâmetros informados e registra a vazão (itens/s) no contexto.
+# Uma execução em que algum participante falhou não tem tempo (None, célula vazia no dataset)
+def run_once(buffer_class, params, context):
+    elapsed = measure_time(buffer_class, params["total_items"], params["buffer_size"], params["backend"],
+                           params["producers"], params["consumers"], context, params["batch_size"])
+    if elapsed is not None:
+        context.set_metric("itens_por_s", params["total_items"] / elapsed)
+    return elapsed
+
+# Mecanismos comparados, na ordem das colunas do dataset: chave -> (rótulo, classe)
+MECHANISMS = {
+    "semaphores": ("Semáforos", BufferSemaphores),
+    "monitors": ("Monitores", BufferMonitors),
+    "locks": ("Locks/Mutexes", BufferLocks),
+    "spinlock": ("Spinlock adaptativo", BufferSpinLocks),
+    "queue": ("queue.Queue", BufferQueue),
+    "simple-queue": ("queue.SimpleQueue", BufferSimpleQueue),
+    "deque": ("deque + Condition", BufferDeque),
+    "semaphores-process": ("Semáforos (processos)", ProcessBufferSemaphores),
+    "monitors-process": ("Monitores (processos)", ProcessBufferMonitors),
+    "locks-process": ("Locks/Mutexes (processos)", ProcessBufferLocks),
+    "semaphores-asyncio": ("Semáforos (asyncio)", AsyncBufferSemaphores),
+    "monitors-asyncio": ("Monitores (asyncio)", AsyncBufferMonitors),
+    "locks-asyncio": ("Locks/Mutexes (asyncio)", AsyncBufferLocks),
+}
+
+if __name__ == "__main__":
+    from common.runner import main
+    main(default_problem="producer-consumer")
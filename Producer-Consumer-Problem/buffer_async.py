@@ -0,0 +1,252 @@
+import asyncio
+from buffer_storage import make_storage
+from common.context import RunContext
+
+# Versões do Produtor-Consumidor com corrotinas: produtores e consumidores são
+# tarefas do asyncio e a sincronização usa asyncio.Semaphore, asyncio.Condition
+# e asyncio.Lock. Todas as tarefas rodam em uma única thread, então o custo
+# medido é o da troca de tarefas no laço de eventos, e não de threads do SO.
+
+# Implementação do problema Produtor-Consumidor usando Locks e Mutexes do asyncio
+class AsyncBufferLocks:
+    def __init__(self, size, backend="ring", context=None):
+        self.buffer = make_storage(backend, size)  # Armazenamento compartilhado (circular por padrão)
+        self.size = size  # Tamanho máximo do buffer
+        context = context or RunContext()
+        self.waits = context.waits  # Registro dos tempos de espera
+        self.events = context.events  # Registro de eventos
+        self.clock = context.clock  # Relógio real ou virtual
+        self.lock = asyncio.Lock()  # Lock para exclusão mútua
+        self.not_full = asyncio.Condition(self.lock)  # Condição para buffer não cheio
+        self.not_empty = asyncio.Condition(self.lock)  # Condição para buffer não vazio
+
+    async def produce(self, item):
+        start = self.clock.now_ns()
+        async with self.not_full:
+            while len(self.buffer) >= self.size:  # Aguarda até que haja espaço no buffer
+                await self.not_full.wait()
+            self.waits.record("produce", self.clock.now_ns() - start)
+            self.buffer.put(item)  # Adiciona o item ao buffer
+            self.not_empty.notify()  # Notifica que há um item disponível
+        self.events.log("(Locks/Mutexes - asyncio) Produtor produziu: {}", item)
+
+    async def consume(self):
+        start = self.clock.now_ns()
+        async with self.not_empty:
+            while len(self.buffer) == 0:  # Aguarda até que haja itens no buffer
+                await self.not_empty.wait()
+            self.waits.record("consume", self.clock.now_ns() - start)
+            item = self.buffer.get()  # Remove o item do buffer
+            self.not_full.notify()  # Notifica que há espaço disponível no buffer
+        self.events.log("(Locks/Mutexes - asyncio) Consumidor consumiu: {}", item)
+        return item
+
+    # Coloca todos os itens, tantos quantos couberem a cada aquisição, com uma notificação por lote
+    async def produce_many(self, items):
+        position = 0
+        while position < len(items):
+            start = self.clock.now_ns()
+            async with self.not_full:
+                while len(self.buffer) >= self.size:  # Aguarda até que haja espaço no buffer
+                    await self.not_full.wait()
+                self.waits.record("produce", self.clock.now_ns() - start)
+                count = min(self.size - len(self.buffer), len(items) - position)
+                self.buffer.put_many(items[position:position + count])
+                self.not_empty.notify(count)  # Até um consumidor por item novo
+            position += count
+        self.events.log("(Locks/Mutexes - asyncio) Produtor produziu {} itens", len(items))
+
+    # Retira até max_n itens de uma vez; devolve [] se o timeout expirar com o buffer vazio
+    async def consume_many(self, max_n, timeout=None):
+        start = self.clock.now_ns()
+        async with self.not_empty:
+            try:
+                await asyncio.wait_for(self.not_empty.wait_for(lambda: len(self.buffer) > 0), timeout)
+            except asyncio.TimeoutError:
+                return []
+            self.waits.record("consume", self.clock.now_ns() - start)
+            items = self.buffer.get_many(min(max_n, len(self.buffer)))
+            self.not_full.notify(len(items))  # Até um produtor por espaço liberado
+        self.events.log("(Locks/Mutexes - asyncio) Consumidor consumiu {} itens", len(items))
+        return items
+
+# Implementação do problema Produtor-Consumidor usando Monitores do asyncio
+class AsyncBufferMonitors:
+    def __init__(self, size, backend="ring", context=None):
+        self.buffer = make_storage(backend, size)
+        self.size = size
+        context = context or RunContext()
+        self.waits = context.waits
+        self.events = context.events
+        self.clock = context.clock
+        self.condition = asyncio.Condition()
+
+    async def produce(self, item):
+        start = self.clock.now_ns()
+        async with self.condition:
+            while len(self.buffer) >= self.size:
+                await self.condition.wait()
+            self.waits.record("produce", self.clock.now_ns() - start)
+            self.buffer.put(item)
+            self.condition.notify_all()
+        self.events.log("(Monitors - asyncio) Produtor produziu: {}", item)
+
+    async def consume(self):
+        start = self.clock.now_ns()
+        async with self.condition:
+            while len(self.buffer) == 0:
+                await self.condition.wait()
+            self.waits.record("consume", self.clock.now_ns() - start)
+            item = self.buffer.get()
+            self.condition.notify_all()
+        self.events.log("(Monitors - asyncio) Consumidor consumiu: {}", item)
+        return item
+
+    async def produce_many(self, items):
+        position = 0
+        while position < len(items):
+            start = self.clock.now_ns()
+            async with self.condition:
+                while len(self.buffer) >= self.size:
+                    await self.condition.wait()
+                self.waits.record("produce", self.clock.now_ns() - start)
+                count = min(self.size - len(self.buffer), len(items) - position)
+                self.buffer.put_many(items[position:position + count])
+                self.condition.notify_all()  # Um único notify_all por lote
+            position += count
+        self.events.log("(Monitors - asyncio) Produtor produziu {} itens", len(items))
+
+    async def consume_many(self, max_n, timeout=None):
+        start = self.clock.now_ns()
+        async with self.condition:
+            try:
+                await asyncio.wait_for(self.condition.wait_for(lambda: len(self.buffer) > 0), timeout)
+            except asyncio.TimeoutError:
+                return []
+            self.waits.record("consume", self.clock.now_ns() - start)
+            items = self.buffer.get_many(min(max_n, len(self.buffer)))
+            self.condition.notify_all()
+        self.events.log("(Monitors - asyncio) Consumidor consumiu {} itens", len(items))
+        return items
+
+# Implementação do problema Produtor-Consumidor usando Semáforos do asyncio
+class AsyncBufferSemaphores:
+    def __init__(self, size, backend="ring", context=None):
+        self.buffer = make_storage(backend, size)  # Armazenamento compartilhado (circular por padrão)
+        self.size = size  # Tamanho máximo do buffer
+        context = context or RunContext()
+        self.waits = context.waits  # Registro dos tempos de espera
+        self.events = context.events  # Registro de eventos
+        self.clock = context.clock  # Relógio real ou virtual
+        self.empty = asyncio.Semaphore(size)  # Contador de espaços vazios no buffer
+        self.full = asyncio.Semaphore(0)  # Contador de itens disponíveis no buffer
+        self.mutex = asyncio.Semaphore(1)  # Semáforo binário para exclusão mútua
+
+    async def produce(self, item):
+        start = self.clock.now_ns()
+        await self.empty.acquire()  # Decrementa o semáforo de espaços vazios
+        await self.mutex.acquire()  # Garante exclusão mútua
+        self.waits.record("produce", self.clock.now_ns() - start)
+        self.buffer.put(item)  # Adiciona o item ao buffer
+        self.mutex.release()  # Libera o semáforo binário
+        self.events.log("(Semaphores - asyncio) Produtor produziu: {}", item)
+        self.full.release()  # Incrementa o semáforo de itens disponíveis
+
+    async def consume(self):
+        start = self.clock.now_ns()
+        await self.full.acquire()  # Decrementa o semáforo de itens disponíveis
+        await self.mutex.acquire()  # Garante exclusão mútua
+        self.waits.record("consume", self.clock.now_ns() - start)
+        item = self.buffer.get()  # Remove o item do buffer
+        self.mutex.release()  # Libera o semáforo binário
+        self.events.log("(Semaphores - asyncio) Consumidor consumiu: {}", item)
+        self.empty.release()  # Incrementa o semáforo de espaços vazios
+        return item
+
+    # Espera por um espaço e pega, sem esperar, os demais que já estiverem livres
+    async def produce_many(self, items):
+        position = 0
+        while position < len(items):
+            start = self.clock.now_ns()
+            await self.empty.acquire()  # Aguarda pelo menos um espaço vazio
+            count = 1
+            while position + count < len(items) and not self.empty.locked():
+                await self.empty.acquire()  # Não suspende: há espaço livre
+                count += 1
+            await self.mutex.acquire()
+            self.waits.record("produce", self.clock.now_ns() - start)
+            self.buffer.put_many(items[position:position + count])
+            self.mutex.release()
+            for _ in range(count):  # asyncio.Semaphore.release não aceita n
+                self.full.release()
+            position += count
+        self.events.log("(Semaphores - asyncio) Produtor produziu {} itens", len(items))
+
+    # Retira até max_n itens de uma vez; devolve [] se o timeout expirar com o buffer vazio
+    async def consume_many(self, max_n, timeout=None):
+        start = self.clock.now_ns()
+        try:
+            await asyncio.wait_for(self.full.acquire(), timeout)
+        except asyncio.TimeoutError:
+            return []
+        count = 1
+        while count < max_n and not self.full.locked():
+            await self.full.acquire()
+            count += 1
+        await self.mutex.acquire()
+        self.waits.record("consume", self.clock.now_ns() - start)
+        items = self.buffer.get_many(count)
+        self.mutex.release()
+        for _ in range(count):
+            self.empty.release()
+        self.events.log("(Semaphores - asyncio) Consumidor consumiu {} itens", len(items))
+        return items
+
+# Corrotinas do produtor e consumidor
+async def producer(buffer, total_items, stream):
+    for _ in range(total_items):
+        item = stream.randint(1, 100)  # Gera um número aleatório
+        await buffer.produce(item)  # Adiciona o item ao buffer
+        await asyncio.sleep(stream.uniform(0.01, 0.05))  # Simula atraso na produção
+
+async def consumer(buffer, total_items, stream):
+    for _ in range(total_items):
+        await buffer.consume()  # Remove um item do buffer
+        await asyncio.sleep(stream.uniform(0.01, 0.05))  # Simula atraso no consumo
+
+# Versões em rajadas, iguais às das threads (producer_batches/consumer_batches)
+async def producer_batches(buffer, total_items, stream, batch_size):
+    remaining = total_items
+    while remaining > 0:
+        items = [stream.randint(1, 100) for _ in range(min(batch_size, remaining))]
+        await buffer.produce_many(items)
+        remaining -= len(items)
+        await asyncio.sleep(stream.uniform(0.01, 0.05))  # Simula atraso entre rajadas
+
+async def consumer_batches(buffer, total_items, stream, batch_size):
+    delays = [stream.uniform(0.01, 0.05) for _ in range(total_items)]  # Um atraso por item, como nas threads
+    consumed = 0
+    while consumed < total_items:
+        count = len(await buffer.consume_many(min(batch_size, total_items - consumed)))
+        await asyncio.sleep(sum(delays[consumed:consumed + count]) / count)
+        consumed += count
+
+# Mede o tempo de um teste com uma tarefa por produtor e por consumidor.
+# producer_items e consumer_items trazem quantos itens cada tarefa processa.
+def measure_time_async(buffer_class, producer_items, consumer_items, size, backend, context=None, batch_size=1):
+    context = context or RunContext()
+    batches = (batch_size,) if batch_size > 1 else ()
+    produce, consume = (producer_batches, consumer_batches) if batches else (producer, consumer)
+
+    async def run():
+        buffer = buffer_class(size, backend, context)  # O buffer precisa ser criado dentro do laço de eventos
+        tasks = [produce(buffer, count, context.workload.stream(f"producer-{i}"), *batches)
+                 for i, count in enumerate(producer_items, start=1)]
+        tasks += [consume(buffer, count, context.workload.stream(f"consumer-{i}"), *batches)
+                  for i, count in enumerate(consumer_items, start=1)]
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        await asyncio.gather(*tasks)
+        return loop.time() - start_time
+
+    return context.clock.run(run())
@@ -0,0 +1,214 @@
+import multiprocessing
+import random
+from buffer_storage import SharedRingBuffer
+from common.eventlog import EventLog
+
+# Versões do Produtor-Consumidor em que produtores e consumidores são processos.
+# O buffer é um anel em memória compartilhada e a sincronização usa os
+# Semáforos, Locks e Condições do módulo multiprocessing, compartilhados entre
+# processos, o que permite usar vários núcleos sem a disputa pelo GIL.
+
+# Os filhos são criados por fork sempre que a plataforma permite: produtores e
+# consumidores vêm do benchmark.py carregado pelo caminho do arquivo, que um
+# interpretador novo (spawn) não consegue importar. Isso importa dentro dos
+# processos do --jobs, que são criados por spawn e herdariam esse método.
+PROCESSES = multiprocessing.get_context("fork" if "fork" in multiprocessing.get_all_start_methods() else None)
+
+# Processo que reinicia o gerador aleatório ao começar, para que os filhos
+# criados por fork não repitam a mesma sequência de itens e atrasos. A semente
+# de cada filho é sorteada no pai, na ordem de criação, pelo gerador que o runner
+# iniciou com a semente da execução (--seed): a mesma execução repete a mesma
+# carga em cada produtor e consumidor
+class ReseededProcess(PROCESSES.Process):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.seed = random.getrandbits(64)
+
+    def run(self):
+        random.seed(self.seed)
+        super().run()
+
+# Log usado pelos processos filhos. Um anel em memória ficaria no processo filho e
+# nunca chegaria ao flush() do pai, então só o modo "print" registra eventos (com a
+# E/S dentro da medida, como nas threads); em "buffer" e "off" eles são descartados
+def process_event_log(context):
+    return EventLog("print" if context is not None and context.events.mode == "print" else "off")
+
+# Implementação do problema Produtor-Consumidor usando Locks e Mutexes entre processos
+class ProcessBufferLocks:
+    worker_class = ReseededProcess  # Tipo de trabalhador usado por measure_time
+    barrier_class = PROCESSES.Barrier  # Barreira de largada compartilhada entre os processos
+    virtual_time = False  # Processos são escalonados pelo SO, não pelo relógio virtual
+
+    def __init__(self, size, backend=None, context=None):
+        # Entre processos só faz sentido o anel em memória compartilhada, então "backend" é ignorado.
+        # Do contexto só o modo de log é usado: o que os filhos registrassem nele não voltaria ao
+        # processo pai, então eles imprimem diretamente, a menos que o log esteja desligado.
+        self.buffer = SharedRingBuffer(size)
+        self.events = process_event_log(context)
+        self.size = size
+        self.lock = PROCESSES.Lock()  # Lock para exclusão mútua
+        self.not_full = PROCESSES.Condition(self.lock)  # Condição para buffer não cheio
+        self.not_empty = PROCESSES.Condition(self.lock)  # Condição para buffer não vazio
+
+    def produce(self, item):
+        with self.not_full:
+            while len(self.buffer) >= self.size:  # Aguarda até que haja espaço no buffer
+                self.not_full.wait()
+            self.buffer.put(item)  # Adiciona o item ao buffer
+            self.not_empty.notify()  # Notifica que há um item disponível
+        self.events.log("(Locks/Mutexes - processos) Produtor produziu: {}", item)
+
+    def consume(self):
+        with self.not_empty:
+            while len(self.buffer) == 0:  # Aguarda até que haja itens no buffer
+                self.not_empty.wait()
+            item = self.buffer.get()  # Remove o item do buffer
+            self.not_full.notify()  # Notifica que há espaço disponível no buffer
+        self.events.log("(Locks/Mutexes - processos) Consumidor consumiu: {}", item)
+        return item
+
+    # Coloca todos os itens, tantos quantos couberem a cada aquisição, com uma notificação por lote
+    def produce_many(self, items):
+        position = 0
+        while position < len(items):
+            with self.not_full:
+                while len(self.buffer) >= self.size:  # Aguarda até que haja espaço no buffer
+                    self.not_full.wait()
+                count = min(self.size - len(self.buffer), len(items) - position)
+                self.buffer.put_many(items[position:position + count])
+                self.not_empty.notify(count)  # Até um consumidor por item novo
+            position += count
+        self.events.log("(Locks/Mutexes - processos) Produtor produziu {} itens", len(items))
+
+    # Retira até max_n itens de uma vez; devolve [] se o timeout expirar com o buffer vazio
+    def consume_many(self, max_n, timeout=None):
+        with self.not_empty:
+            if not self.not_empty.wait_for(lambda: len(self.buffer) > 0, timeout):
+                return []
+            items = self.buffer.get_many(min(max_n, len(self.buffer)))
+            self.not_full.notify(len(items))  # Até um produtor por espaço liberado
+        self.events.log("(Locks/Mutexes - processos) Consumidor consumiu {} itens", len(items))
+        return items
+
+    # Libera a memória compartilhada ao final do teste
+    def close(self):
+        self.buffer.close(unlink=True)
+
+# Implementação do problema Produtor-Consumidor usando Monitores entre processos
+class ProcessBufferMonitors:
+    worker_class = ReseededProcess
+    barrier_class = PROCESSES.Barrier
+    virtual_time = False
+
+    def __init__(self, size, backend=None, context=None):
+        self.buffer = SharedRingBuffer(size)
+        self.size = size
+        self.events = process_event_log(context)
+        self.condition = PROCESSES.Condition()
+
+    def produce(self, item):
+        with self.condition:
+            while len(self.buffer) >= self.size:
+                self.condition.wait()
+            self.buffer.put(item)
+            self.condition.notify_all()
+        self.events.log("(Monitors - processos) Produtor produziu: {}", item)
+
+    def consume(self):
+        with self.condition:
+            while len(self.buffer) == 0:
+                self.condition.wait()
+            item = self.buffer.get()
+            self.condition.notify_all()
+        self.events.log("(Monitors - processos) Consumidor consumiu: {}", item)
+        return item
+
+    def produce_many(self, items):
+        position = 0
+        while position < len(items):
+            with self.condition:
+                while len(self.buffer) >= self.size:
+                    self.condition.wait()
+                count = min(self.size - len(self.buffer), len(items) - position)
+                self.buffer.put_many(items[position:position + count])
+                self.condition.notify_all()  # Um único notify_all por lote
+            position += count
+        self.events.log("(Monitors - processos) Produtor produziu {} itens", len(items))
+
+    def consume_many(self, max_n, timeout=None):
+        with self.condition:
+            if not self.condition.wait_for(lambda: len(self.buffer) > 0, timeout):
+                return []
+            items = self.buffer.get_many(min(max_n, len(self.buffer)))
+            self.condition.notify_all()
+        self.events.log("(Monitors - processos) Consumidor consumiu {} itens", len(items))
+        return items
+
+    def close(self):
+        self.buffer.close(unlink=True)
+
+# Implementação do problema Produtor-Consumidor usando Semáforos entre processos
+class ProcessBufferSemaphores:
+    worker_class = ReseededProcess
+    barrier_class = PROCESSES.Barrier
+    virtual_time = False
+
+    def __init__(self, size, backend=None, context=None):
+        self.buffer = SharedRingBuffer(size)
+        self.size = size
+        self.events = process_event_log(context)
+        self.empty = PROCESSES.Semaphore(size)  # Contador de espaços vazios no buffer
+        self.full = PROCESSES.Semaphore(0)  # Contador de itens disponíveis no buffer
+        self.mutex = PROCESSES.Semaphore(1)  # Semáforo binário para exclusão mútua
+
+    def produce(self, item):
+        self.empty.acquire()  # Decrementa o semáforo de espaços vazios
+        self.mutex.acquire()  # Garante exclusão mútua
+        self.buffer.put(item)  # Adiciona o item ao buffer
+        self.mutex.release()  # Libera o semáforo binário
+        self.events.log("(Semaphores - processos) Produtor produziu: {}", item)
+        self.full.release()  # Incrementa o semáforo de itens disponíveis
+
+    def consume(self):
+        self.full.acquire()  # Decrementa o semáforo de itens disponíveis
+        self.mutex.acquire()  # Garante exclusão mútua
+        item = self.buffer.get()  # Remove o item do buffer
+        self.mutex.release()  # Libera o semáforo binário
+        self.events.log("(Semaphores - processos) Consumidor consumiu: {}", item)
+        self.empty.release()  # Incrementa o semáforo de espaços vazios
+        return item
+
+    # Espera por um espaço e pega, sem bloquear, os demais que já estiverem livres
+    def produce_many(self, items):
+        position = 0
+        while position < len(items):
+            self.empty.acquire()  # Aguarda pelo menos um espaço vazio
+            count = 1
+            while position + count < len(items) and self.empty.acquire(False):
+                count += 1
+            self.mutex.acquire()
+            self.buffer.put_many(items[position:position + count])
+            self.mutex.release()
+            for _ in range(count):  # multiprocessing.Semaphore.release não aceita n
+                self.full.release()
+            position += count
+        self.events.log("(Semaphores - processos) Produtor produziu {} itens", len(items))
+
+    # Retira até max_n itens de uma vez; devolve [] se o timeout expirar com o buffer vazio
+    def consume_many(self, max_n, timeout=None):
+        if not self.full.acquire(timeout=timeout):
+            return []
+        count = 1
+        while count < max_n and self.full.acquire(False):
+            count += 1
+        self.mutex.acquire()
+        items = self.buffer.get_many(count)
+        self.mutex.release()
+        for _ in range(count):
+            self.empty.release()
+        self.events.log("(Semaphores - processos) Consumidor consumiu {} itens", len(items))
+        return items
+
+    def close(self):
+        self.buffer.close(unlink=True)
@@ -0,0 +1,176 @@
+import collections
+import queue
+from common.context import RunContext
+
+# Buffers prontos da biblioteca padrão, como referência para os buffers escritos
+# à mão. Seguem a mesma interface (produce/consume e as versões em lote) e
+# registram os mesmos tempos de espera, então vazão e latências de cauda
+# (produce.p99_us, consume.p99_us) são comparáveis diretamente.
+#
+# queue.Queue e queue.SimpleQueue usam internamente suas próprias primitivas
+# (SimpleQueue é implementada em C), então não passam por context.sync: não
+# aparecem nos contadores de --count-sync nem rodam no relógio virtual. O parâmetro "backend" é ignorado:
+# cada um usa o próprio armazenamento.
+
+# queue.Queue limitada ao tamanho do buffer
+class BufferQueue:
+    virtual_time = False  # Bloqueia nas primitivas internas da fila
+
+    def __init__(self, size, backend=None, context=None):
+        self.queue = queue.Queue(maxsize=size)
+        self.size = size
+        context = context or RunContext()
+        self.waits = context.waits  # Registro dos tempos de espera
+        self.events = context.events  # Registro de eventos
+        self.clock = context.clock  # Relógio real ou virtual
+
+    def produce(self, item):
+        start = self.clock.now_ns()
+        self.queue.put(item)  # Bloqueia enquanto a fila estiver cheia
+        self.waits.record("produce", self.clock.now_ns() - start)
+        self.events.log("(queue.Queue) Produtor produziu: {}", item)
+
+    def consume(self):
+        start = self.clock.now_ns()
+        item = self.queue.get()  # Bloqueia enquanto a fila estiver vazia
+        self.waits.record("consume", self.clock.now_ns() - start)
+        self.events.log("(queue.Queue) Consumidor consumiu: {}", item)
+        return item
+
+    # A Queue não tem operações em lote: cada item passa por um put
+    def produce_many(self, items):
+        for item in items:
+            start = self.clock.now_ns()
+            self.queue.put(item)
+            self.waits.record("produce", self.clock.now_ns() - start)
+        self.events.log("(queue.Queue) Produtor produziu {} itens", len(items))
+
+    # Espera pelo primeiro item e leva, sem bloquear, os que já estiverem na fila
+    def consume_many(self, max_n, timeout=None):
+        start = self.clock.now_ns()
+        try:
+            items = [self.queue.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+        self.waits.record("consume", self.clock.now_ns() - start)
+        while len(items) < max_n:
+            try:
+                items.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        self.events.log("(queue.Queue) Consumidor consumiu {} itens", len(items))
+        return items
+
+# queue.SimpleQueue (em C, sem limite de tamanho). Um semáforo com as posições
+# livres mantém o mesmo limite dos demais buffers: sem ele os produtores nunca
+# esperariam e a comparação não seria justa
+class BufferSimpleQueue:
+    virtual_time = False
+
+    def __init__(self, size, backend=None, context=None):
+        self.queue = queue.SimpleQueue()
+        self.size = size
+        context = context or RunContext()
+        self.waits = context.waits
+        self.events = context.events
+        self.clock = context.clock
+        self.free = context.sync.Semaphore(size)  # Posições livres no buffer
+
+    def produce(self, item):
+        start = self.clock.now_ns()
+        self.free.acquire()
+        self.waits.record("produce", self.clock.now_ns() - start)
+        self.queue.put(item)
+        self.events.log("(queue.SimpleQueue) Produtor produziu: {}", item)
+
+    def consume(self):
+        start = self.clock.now_ns()
+        item = self.queue.get()
+        self.waits.record("consume", self.clock.now_ns() - start)
+        self.free.release()
+        self.events.log("(queue.SimpleQueue) Consumidor consumiu: {}", item)
+        return item
+
+    def produce_many(self, items):
+        for item in items:
+            start = self.clock.now_ns()
+            self.free.acquire()
+            self.waits.record("produce", self.clock.now_ns() - start)
+            self.queue.put(item)
+        self.events.log("(queue.SimpleQueue) Produtor produziu {} itens", len(items))
+
+    def consume_many(self, max_n, timeout=None):
+        start = self.clock.now_ns()
+        try:
+            items = [self.queue.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+        self.waits.record("consume", self.clock.now_ns() - start)
+        while len(items) < max_n:
+            try:
+                items.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        self.free.release(len(items))  # Libera as posições do lote de uma vez
+        self.events.log("(queue.SimpleQueue) Consumidor consumiu {} itens", len(items))
+        return items
+
+# collections.deque protegida por um lock com duas condições, no estilo de
+# BufferLocks, mas com as operações da deque (append/popleft em C)
+class BufferDeque:
+    def __init__(self, size, backend=None, context=None):
+        self.items = collections.deque()
+        self.size = size
+        context = context or RunContext()
+        self.waits = context.waits
+        self.events = context.events
+        self.clock = context.clock
+        self.lock = context.sync.Lock()  # Lock para exclusão mútua
+        self.not_full = context.sync.Condition(self.lock)  # Condição para buffer não cheio
+        self.not_empty = context.sync.Condition(self.lock)  # Condição para buffer não vazio
+
+    def produce(self, item):
+        start = self.clock.now_ns()
+        with self.not_full:
+            while len(self.items) >= self.size:
+                self.not_full.wait()
+            self.waits.record("produce", self.clock.now_ns() - start)
+            self.items.append(item)
+            self.not_empty.notify()
+        self.events.log("(deque + Condition) Produtor produziu: {}", item)
+
+    def consume(self):
+        start = self.clock.now_ns()
+        with self.not_empty:
+            while not self.items:
+                self.not_empty.wait()
+            self.waits.record("consume", self.clock.now_ns() - start)
+            item = self.items.popleft()
+            self.not_full.notify()
+        self.events.log("(deque + Condition) Consumidor consumiu: {}", item)
+        return item
+
+    def produce_many(self, items):
+        position = 0
+        while position < len(items):
+            start = self.clock.now_ns()
+            with self.not_full:
+                while len(self.items) >= self.size:
+                    self.not_full.wait()
+                self.waits.record("produce", self.clock.now_ns() - start)
+                count = min(self.size - len(self.items), len(items) - position)
+                self.items.extend(items[position:position + count])
+                self.not_empty.notify(count)
+            position += count
+        self.events.log("(deque + Condition) Produtor produziu {} itens", len(items))
+
+    def consume_many(self, max_n, timeout=None):
+        start = self.clock.now_ns()
+        with self.not_empty:
+            if not self.not_empty.wait_for(lambda: len(self.items) > 0, timeout):
+                return []
+            self.waits.record("consume", self.clock.now_ns() - start)
+            items = [self.items.popleft() for _ in range(min(max_n, len(self.items)))]
+            self.not_full.notify(len(items))
+        self.events.log("(deque + Condition) Consumidor consumiu {} itens", len(items))
+        return items
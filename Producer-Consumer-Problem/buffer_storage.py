@@ -0,0 +1,143 @@
+from multiprocessing import shared_memory
+
+# Armazenamentos disponíveis para os buffers do problema Produtor-Consumidor.
+# Todos expõem a mesma interface (put, get, put_many, get_many e len) para que
+# Semáforos, Monitores e Locks/Mutexes possam usar qualquer um deles sem mudar
+# a sincronização.
+# A capacidade nunca é verificada aqui: quem garante que não há overflow nem
+# underflow é o mecanismo de exclusão mútua que envolve o armazenamento.
+
+# Buffer circular de capacidade fixa, pré-alocado uma única vez
+class RingBuffer:
+    def __init__(self, capacity):
+        self.slots = [None] * capacity  # Posições pré-alocadas
+        self.capacity = capacity
+        self.head = 0  # Próxima posição a ser lida
+        self.tail = 0  # Próxima posição a ser escrita
+        self.count = 0  # Quantidade de itens armazenados
+
+    def __len__(self):
+        return self.count
+
+    def put(self, item):
+        self.slots[self.tail] = item
+        self.tail = (self.tail + 1) % self.capacity
+        self.count += 1
+
+    def get(self):
+        item = self.slots[self.head]
+        self.slots[self.head] = None  # Libera a referência ao item consumido
+        self.head = (self.head + 1) % self.capacity
+        self.count -= 1
+        return item
+
+    # Escreve vários itens com no máximo duas cópias de fatia (antes e depois da volta do anel)
+    def put_many(self, items):
+        first = min(len(items), self.capacity - self.tail)
+        self.slots[self.tail:self.tail + first] = items[:first]
+        self.slots[:len(items) - first] = items[first:]
+        self.tail = (self.tail + len(items)) % self.capacity
+        self.count += len(items)
+
+    def get_many(self, n):
+        first = min(n, self.capacity - self.head)
+        items = self.slots[self.head:self.head + first] + self.slots[:n - first]
+        self.slots[self.head:self.head + first] = [None] * first
+        self.slots[:n - first] = [None] * (n - first)
+        self.head = (self.head + n) % self.capacity
+        self.count -= n
+        return items
+
+# Armazenamento original: lista com append/pop(0), O(n) a cada remoção
+class ListBuffer:
+    def __init__(self, capacity):
+        self.items = []
+        self.capacity = capacity
+
+    def __len__(self):
+        return len(self.items)
+
+    def put(self, item):
+        self.items.append(item)
+
+    def get(self):
+        return self.items.pop(0)
+
+    def put_many(self, items):
+        self.items.extend(items)
+
+    def get_many(self, n):
+        items = self.items[:n]
+        del self.items[:n]
+        return items
+
+# Buffer circular em memória compartilhada, usado pelas versões com processos.
+# Cabeçalho (head, tail, count) e posições ficam no mesmo bloco como inteiros
+# de 64 bits, então apenas itens inteiros podem ser armazenados.
+class SharedRingBuffer:
+    HEADER = 3  # Quantidade de inteiros do cabeçalho antes das posições
+
+    def __init__(self, capacity, name=None):
+        create = name is None  # Sem nome: cria o bloco; com nome: apenas se conecta a ele
+        self.shm = shared_memory.SharedMemory(name=name, create=create, size=(self.HEADER + capacity) * 8)
+        self.capacity = capacity
+        self.cells = self.shm.buf.cast("q")
+        if create:
+            self.cells[0] = self.cells[1] = self.cells[2] = 0
+
+    # Ao ser enviado para outro processo, reconecta-se ao mesmo bloco pelo nome
+    def __reduce__(self):
+        return (SharedRingBuffer, (self.capacity, self.shm.name))
+
+    def __len__(self):
+        return self.cells[2]
+
+    def put(self, item):
+        tail = self.cells[1]
+        self.cells[self.HEADER + tail] = item
+        self.cells[1] = (tail + 1) % self.capacity
+        self.cells[2] += 1
+
+    def get(self):
+        head = self.cells[0]
+        item = self.cells[self.HEADER + head]
+        self.cells[0] = (head + 1) % self.capacity
+        self.cells[2] -= 1
+        return item
+
+    # Versões em lote: o cabeçalho é atualizado uma única vez
+    def put_many(self, items):
+        tail = self.cells[1]
+        for item in items:
+            self.cells[self.HEADER + tail] = item
+            tail = (tail + 1) % self.capacity
+        self.cells[1] = tail
+        self.cells[2] += len(items)
+
+    def get_many(self, n):
+        head = self.cells[0]
+        items = []
+        for _ in range(n):
+            items.append(self.cells[self.HEADER + head])
+            head = (head + 1) % self.capacity
+        self.cells[0] = head
+        self.cells[2] -= n
+        return items
+
+    # Desconecta do bloco; quem o criou também deve removê-lo (unlink=True)
+    def close(self, unlink=False):
+        self.cells.release()
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+STORAGE_BACKENDS = {
+    "ring": RingBuffer,
+    "list": ListBuffer,
+}
+
+# Cria o armazenamento escolhido com a capacidade informada
+def make_storage(backend, capacity):
+    if backend not in STORAGE_BACKENDS:
+        raise ValueError(f"Armazenamento desconhecido: {backend!r} (opções: {', '.join(STORAGE_BACKENDS)})")
+    return STORAGE_BACKENDS[backend](capacity)
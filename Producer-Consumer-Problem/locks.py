@@ -1,11 +1,12 @@
 import threading
 import time
 import random
+from buffer_storage import make_storage
 
 # Implementação do problema Produtor-Consumidor usando Locks e Mutexes
 class BufferLocks:
-    def __init__(self, size):
-        self.buffer = []  # Lista que atuará como o buffer compartilhado
+    def __init__(self, size, backend="ring"):
+        self.buffer = make_storage(backend, size)  # Armazenamento compartilhado (circular por padrão)
         self.size = size  # Tamanho máximo do buffer
         self.lock = threading.Lock()  # Lock para exclusão mútua
         self.not_full = threading.Condition(self.lock)  # Condição para buffer não cheio
@@ -15,7 +16,7 @@ class BufferLocks:
         with self.not_full:
             while len(self.buffer) >= self.size:  # Aguarda até que haja espaço no buffer
                 self.not_full.wait()
-            self.buffer.append(item)  # Adiciona o item ao buffer
+            self.buffer.put(item)  # Adiciona o item ao buffer
             print(f"(Locks/Mutexes) Produtor produziu: {item}")
             self.not_empty.notify()  # Notifica que há um item disponível
 
@@ -23,7 +24,7 @@ class BufferLocks:
         with self.not_empty:
             while len(self.buffer) == 0:  # Aguarda até que haja itens no buffer
                 self.not_empty.wait()
-            item = self.buffer.pop(0)  # Remove o item do buffer
+            item = self.buffer.get()  # Remove o item do buffer
             print(f"(Locks/Mutexes) Consumidor consumiu: {item}")
             self.not_full.notify()  # Notifica que há espaço disponível no buffer
             return item
@@ -1,11 +1,12 @@
 import threading
 import time
 import random
+from buffer_storage import make_storage
 
 # Implementação do problema Produtor-Consumidor usando Monitores
 class BufferMonitors:
-    def __init__(self, size):
-        self.buffer = []  # Lista que atuará como o buffer compartilhado
+    def __init__(self, size, backend="ring"):
+        self.buffer = make_storage(backend, size)  # Armazenamento compartilhado (circular por padrão)
         self.size = size  # Tamanho máximo do buffer
         self.condition = threading.Condition()  # Condição para sincronização entre produtores e consumidores
 
@@ -13,7 +14,7 @@ class BufferMonitors:
         with self.condition:
             while len(self.buffer) >= self.size:  # Aguarda até que haja espaço no buffer
                 self.condition.wait()
-            self.buffer.append(item)  # Adiciona o item ao buffer
+            self.buffer.put(item)  # Adiciona o item ao buffer
             print(f"(Monitors) Produtor produziu: {item}")
             self.condition.notify_all()  # Notifica que há um item disponível
 
@@ -21,7 +22,7 @@ class BufferMonitors:
         with self.condition:
             while len(self.buffer) == 0:  # Aguarda até que haja itens no buffer
                 self.condition.wait()
-            item = self.buffer.pop(0)  # Remove o item do buffer
+            item = self.buffer.get()  # Remove o item do buffer
             print(f"(Monitors) Consumidor consumiu: {item}")
             self.condition.notify_all()  # Notifica que há espaço disponível no buffer
             return item
@@ -1,11 +1,12 @@
 import threading
 import time
 import random
+from buffer_storage import make_storage
 
 # Implementação do problema Produtor-Consumidor usando Semáforos
 class BufferSemaphores:
-    def __init__(self, size):
-        self.buffer = []  # Lista que atuará como o buffer compartilhado
+    def __init__(self, size, backend="ring"):
+        self.buffer = make_storage(backend, size)  # Armazenamento compartilhado (circular por padrão)
         self.size = size  # Tamanho máximo do buffer
         self.empty = threading.Semaphore(size)  # Semáforo que controla os espaços vazios no buffer
         self.full = threading.Semaphore(0)  # Semáforo que controla os itens disponíveis no buffer
@@ -14,7 +15,7 @@ class BufferSemaphores:
     def produce(self, item):
         self.empty.acquire()  # Aguarda até que haja espaço vazio no buffer
         self.mutex.acquire()  # Entra na seção crítica
-        self.buffer.append(item)  # Adiciona o item ao buffer
+        self.buffer.put(item)  # Adiciona o item ao buffer
         print(f"(Semaphores) Produtor produziu: {item}")
         self.mutex.release()  # Libera a seção crítica
         self.full.release()  # Sinaliza que há um item disponível no buffer
@@ -22,7 +23,7 @@ class BufferSemaphores:
     def consume(self):
         self.full.acquire()  # Aguarda até que haja itens disponíveis no buffer
         self.mutex.acquire()  # Entra na seção crítica
-        item = self.buffer.pop(0)  # Remove o item do buffer
+        item = self.buffer.get()  # Remove o item do buffer
         print(f"(Semaphores) Consumidor consumiu: {item}")
         self.mutex.release()  # Libera a seção crítica
         self.empty.release()  # Sinaliza que há espaço vazio disponível no buffer
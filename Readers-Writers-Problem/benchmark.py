@@ -1,37 +1,65 @@
+import functools
+import inspect
+import sys
 import threading
 import time
-import random
 import os
-import csv
-import matplotlib.pyplot as plt
-import pandas as pd
-import numpy as np
 
-# Criação das pastas para armazenar gráficos e dataset
-if not os.path.exists("graficos"):
-    os.makedirs("graficos")
-if not os.path.exists("dataset"):
-    os.makedirs("dataset")
+# Permite importar os módulos vizinhos e o pacote "common" (na raiz do repositório),
+# inclusive quando este arquivo é carregado pelo runner a partir de outro diretório
+PROBLEM_DIR = os.path.dirname(os.path.abspath(__file__))
+for path in (PROBLEM_DIR, os.path.dirname(PROBLEM_DIR)):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from common.context import RunContext
+from common.spinlock import make_spinlock
+from readers_writers_async import AsyncReadersWritersSemaphores, AsyncReadersWritersMonitors, AsyncReadersWritersLocks, run_readers_writers_test_async
+
+TITLE = "Readers-Writers"
+
+# Parâmetros do teste e seus valores padrão (o runner permite varrer vários valores de cada um)
+PARAMETERS = {
+    "readers": 5,  # Quantidade de leitores (threads ou tarefas do asyncio)
+    "writers": 2,  # Quantidade de escritores
+    "operations": 3,  # Leituras ou escritas feitas por cada participante
+}
+
+# Menores valores aceitos (o teste pode não ter leitores ou escritores)
+MINIMUMS = {
+    "readers": 0,
+    "writers": 0,
+    "operations": 1,
+}
 
 # Implementação com Semáforos
 class ReadersWritersSemaphores:
-    def __init__(self):
+    def __init__(self, context=None):
         self.read_count = 0  # Contador de leitores ativos
-        self.mutex = threading.Semaphore(1)  # Controle de acesso ao contador de leitores
-        self.write_lock = threading.Semaphore(1)  # Controle de acesso exclusivo para escritores
+        context = context or RunContext()
+        self.waits = context.waits  # Registro dos tempos de espera para ler e escrever
+        self.events = context.events  # Registro de eventos
+        self.clock = context.clock  # Relógio real ou virtual
+        self.workload = context.workload  # Fluxos de sorteios dos participantes
+        self.work = context.work  # Fase de trabalho: time.sleep ou computação (--work)
+        self.mutex = context.sync.Semaphore(1)  # Controle de acesso ao contador de leitores
+        self.write_lock = context.sync.Semaphore(1)  # Controle de acesso exclusivo para escritores
 
     def read(self, reader_id):
+        stream = self.workload.stream(f"reader-{reader_id}")  # Sorteios deste participante
         # Controle de entrada de leitores
+        start = self.clock.now_ns()
         self.mutex.acquire()
         self.read_count += 1
         if self.read_count == 1:  # Se for o primeiro leitor, bloqueia os escritores
             self.write_lock.acquire()
         self.mutex.release()
+        self.waits.record("read", self.clock.now_ns() - start)
 
         # Simula a leitura
-        print(f"(Semaphores) Leitor {reader_id} está lendo...")
-        time.sleep(random.uniform(0.1, 0.5))
-        print(f"(Semaphores) Leitor {reader_id} terminou de ler.")
+        self.events.log("(Semaphores) Leitor {} está lendo...", reader_id)
+        self.work(stream.uniform(0.1, 0.5))
+        self.events.log("(Semaphores) Leitor {} terminou de ler.", reader_id)
 
         # Controle de saída de leitores
         self.mutex.acquire()
@@ -41,31 +69,43 @@ class ReadersWritersSemaphores:
         self.mutex.release()
 
     def write(self, writer_id):
+        stream = self.workload.stream(f"writer-{writer_id}")  # Sorteios deste participante
         # Controle de exclusão mútua para escritores
+        start = self.clock.now_ns()
         self.write_lock.acquire()
-        print(f"(Semaphores) Escritor {writer_id} está escrevendo...")
-        time.sleep(random.uniform(0.1, 0.5))  # Simula a escrita
-        print(f"(Semaphores) Escritor {writer_id} terminou de escrever.")
+        self.waits.record("write", self.clock.now_ns() - start)
+        self.events.log("(Semaphores) Escritor {} está escrevendo...", writer_id)
+        self.work(stream.uniform(0.1, 0.5))  # Simula a escrita
+        self.events.log("(Semaphores) Escritor {} terminou de escrever.", writer_id)
         self.write_lock.release()
 
 # Implementação com Monitores
 class ReadersWritersMonitors:
-    def __init__(self):
+    def __init__(self, context=None):
         self.read_count = 0  # Contador de leitores ativos
+        context = context or RunContext()
+        self.waits = context.waits  # Registro dos tempos de espera para ler e escrever
+        self.events = context.events  # Registro de eventos
+        self.clock = context.clock
+        self.workload = context.workload  # Fluxos de sorteios dos participantes
+        self.work = context.work  # Fase de trabalho: time.sleep ou computação (--work)
         self.writer_active = False  # Indica se há um escritor ativo
-        self.condition = threading.Condition()  # Condição para sincronização entre leitores e escritores
+        self.condition = context.sync.Condition()  # Condição para sincronização entre leitores e escritores
 
     def read(self, reader_id):
+        stream = self.workload.stream(f"reader-{reader_id}")  # Sorteios deste participante
+        start = self.clock.now_ns()
         with self.condition:
             # Espera enquanto houver um escritor ativo
             while self.writer_active:
                 self.condition.wait()
             self.read_count += 1  # Incrementa o contador de leitores ativos
+        self.waits.record("read", self.clock.now_ns() - start)
 
         # Simula a leitura
-        print(f"(Monitors) Leitor {reader_id} está lendo...")
-        time.sleep(random.uniform(0.1, 0.5))
-        print(f"(Monitors) Leitor {reader_id} terminou de ler.")
+        self.events.log("(Monitors) Leitor {} está lendo...", reader_id)
+        self.work(stream.uniform(0.1, 0.5))
+        self.events.log("(Monitors) Leitor {} terminou de ler.", reader_id)
 
         with self.condition:
             self.read_count -= 1  # Decrementa o contador de leitores ativos
@@ -73,16 +113,19 @@ class ReadersWritersMonitors:
                 self.condition.notify_all()
 
     def write(self, writer_id):
+        stream = self.workload.stream(f"writer-{writer_id}")  # Sorteios deste participante
+        start = self.clock.now_ns()
         with self.condition:
             # Espera enquanto houver leitores ou outro escritor ativo
             while self.read_count > 0 or self.writer_active:
                 self.condition.wait()
             self.writer_active = True  # Indica que um escritor está ativo
+        self.waits.record("write", self.clock.now_ns() - start)
 
         # Simula a escrita
-        print(f"(Monitors) Escritor {writer_id} está escrevendo...")
-        time.sleep(random.uniform(0.1, 0.5))
-        print(f"(Monitors) Escritor {writer_id} terminou de escrever.")
+        self.events.log("(Monitors) Escritor {} está escrevendo...", writer_id)
+        self.work(stream.uniform(0.1, 0.5))
+        self.events.log("(Monitors) Escritor {} terminou de escrever.", writer_id)
 
         with self.condition:
             self.writer_active = False  # Libera o escritor
@@ -90,22 +133,36 @@ class ReadersWritersMonitors:
 
 # Implementação com Locks/Mutexes
 class ReadersWritersLocks:
-    def __init__(self):
+    label = "Locks/Mutexes"  # Rótulo dos eventos
+
+    def __init__(self, context=None):
         self.read_count = 0  # Contador de leitores ativos
-        self.lock = threading.Lock()  # Controle de acesso ao contador de leitores
-        self.write_lock = threading.Lock()  # Controle de acesso exclusivo para escritores
+        context = context or RunContext()
+        self.waits = context.waits  # Registro dos tempos de espera para ler e escrever
+        self.events = context.events  # Registro de eventos
+        self.clock = context.clock
+        self.workload = context.workload  # Fluxos de sorteios dos participantes
+        self.work = context.work  # Fase de trabalho: time.sleep ou computação (--work)
+        self.lock = self.new_lock(context)  # Controle de acesso ao contador de leitores
+        self.write_lock = context.sync.Lock()  # Controle de acesso exclusivo para escritores
+
+    def new_lock(self, context):
+        return context.sync.Lock()
 
     def read(self, reader_id):
+        stream = self.workload.stream(f"reader-{reader_id}")  # Sorteios deste participante
         # Controle de entrada de leitores
+        start = self.clock.now_ns()
         with self.lock:
             self.read_count += 1
             if self.read_count == 1:  # Se for o primeiro leitor, bloqueia os escritores
                 self.write_lock.acquire()
+        self.waits.record("read", self.clock.now_ns() - start)
 
         # Simula a leitura
-        print(f"(Locks/Mutexes) Leitor {reader_id} está lendo...")
-        time.sleep(random.uniform(0.1, 0.5))
-        print(f"(Locks/Mutexes) Leitor {reader_id} terminou de ler.")
+        self.events.log("({}) Leitor {} está lendo...", self.label, reader_id)
+        self.work(stream.uniform(0.1, 0.5))
+        self.events.log("({}) Leitor {} terminou de ler.", self.label, reader_id)
 
         # Controle de saída de leitores
         with self.lock:
@@ -114,11 +171,260 @@ class ReadersWritersLocks:
                 self.write_lock.release()
 
     def write(self, writer_id):
+        stream = self.workload.stream(f"writer-{writer_id}")  # Sorteios deste participante
         # Controle de exclusão mútua para escritores
+        start = self.clock.now_ns()
+        with self.write_lock:
+            self.waits.record("write", self.clock.now_ns() - start)
+            self.events.log("({}) Escritor {} está escrevendo...", self.label, writer_id)
+            self.work(stream.uniform(0.1, 0.5))  # Simula a escrita
+            self.events.log("({}) Escritor {} terminou de escrever.", self.label, writer_id)
+
+# Implementação com o spinlock adaptativo no contador de leitores: a seção
+# crítica de read_count dura microssegundos, então o leitor insiste um pouco
+# antes de bloquear. O lock de escrita fica preso durante leituras e escritas
+# inteiras e continua sendo um lock comum
+class ReadersWritersSpinLocks(ReadersWritersLocks):
+    label = "Spinlock"
+
+    def new_lock(self, context):
+        return make_spinlock(context.sync)
+
+# Monitor com preferência para escritores: leitores novos esperam enquanto houver
+# escritor ativo ou aguardando, então uma carga contínua de leituras não
+# impede os escritores de entrar (são os leitores que podem esperar indefinidamente)
+class ReadersWritersWriterPreference:
+    def __init__(self, context=None):
+        self.read_count = 0  # Contador de leitores ativos
+        context = context or RunContext()
+        self.waits = context.waits  # Registro dos tempos de espera para ler e escrever
+        self.events = context.events  # Registro de eventos
+        self.clock = context.clock
+        self.workload = context.workload  # Fluxos de sorteios dos participantes
+        self.work = context.work  # Fase de trabalho: time.sleep ou computação (--work)
+        self.writer_active = False  # Indica se há um escritor ativo
+        self.waiting_writers = 0  # Escritores aguardando a vez
+        self.condition = context.sync.Condition()  # Condição para sincronização entre leitores e escritores
+
+    def read(self, reader_id):
+        stream = self.workload.stream(f"reader-{reader_id}")  # Sorteios deste participante
+        start = self.clock.now_ns()
+        with self.condition:
+            # Espera enquanto houver escritor ativo ou aguardando
+            while self.writer_active or self.waiting_writers > 0:
+                self.condition.wait()
+            self.read_count += 1
+        self.waits.record("read", self.clock.now_ns() - start)
+
+        # Simula a leitura
+        self.events.log("(Preferência para escritores) Leitor {} está lendo...", reader_id)
+        self.work(stream.uniform(0.1, 0.5))
+        self.events.log("(Preferência para escritores) Leitor {} terminou de ler.", reader_id)
+
+        with self.condition:
+            self.read_count -= 1
+            if self.read_count == 0:  # O último leitor libera os escritores
+                self.condition.notify_all()
+
+    def write(self, writer_id):
+        stream = self.workload.stream(f"writer-{writer_id}")  # Sorteios deste participante
+        start = self.clock.now_ns()
+        with self.condition:
+            self.waiting_writers += 1  # A partir daqui, novos leitores esperam
+            while self.read_count > 0 or self.writer_active:
+                self.condition.wait()
+            self.waiting_writers -= 1
+            self.writer_active = True
+        self.waits.record("write", self.clock.now_ns() - start)
+
+        # Simula a escrita
+        self.events.log("(Preferência para escritores) Escritor {} está escrevendo...", writer_id)
+        self.work(stream.uniform(0.1, 0.5))
+        self.events.log("(Preferência para escritores) Escritor {} terminou de escrever.", writer_id)
+
+        with self.condition:
+            self.writer_active = False
+            self.condition.notify_all()
+
+# Monitor com alternância de fases (phase-fair): leituras e escritas se alternam.
+# Um leitor que chega com escritor presente espera só até o fim da escrita atual
+# (ou da próxima), quando o escritor admite de uma vez todos os leitores
+# bloqueados; o próximo escritor espera apenas essa fase de leitura terminar.
+# Assim, tanto leitores quanto escritores têm espera limitada.
+class ReadersWritersPhaseFair:
+    def __init__(self, context=None):
+        self.read_count = 0  # Leitores ativos (inclui os admitidos ao fim de uma escrita)
+        context = context or RunContext()
+        self.waits = context.waits  # Registro dos tempos de espera para ler e escrever
+        self.events = context.events  # Registro de eventos
+        self.clock = context.clock
+        self.workload = context.workload  # Fluxos de sorteios dos participantes
+        self.work = context.work  # Fase de trabalho: time.sleep ou computação (--work)
+        self.writer_active = False  # Indica se há um escritor ativo
+        self.writers_present = 0  # Escritores ativos ou aguardando
+        self.waiting_readers = 0  # Leitores bloqueados até o fim da fase de escrita
+        self.write_phase = 0  # Incrementado ao fim de cada escrita
+        self.condition = context.sync.Condition()  # Condição para sincronização entre leitores e escritores
+
+    def read(self, reader_id):
+        stream = self.workload.stream(f"reader-{reader_id}")  # Sorteios deste participante
+        start = self.clock.now_ns()
+        with self.condition:
+            if self.writers_present > 0:
+                # Espera o fim de uma fase de escrita; quem a encerra já conta este leitor em read_count
+                self.waiting_readers += 1
+                phase = self.write_phase
+                while self.write_phase == phase:
+                    self.condition.wait()
+            else:
+                self.read_count += 1
+        self.waits.record("read", self.clock.now_ns() - start)
+
+        # Simula a leitura
+        self.events.log("(Alternância de fases) Leitor {} está lendo...", reader_id)
+        self.work(stream.uniform(0.1, 0.5))
+        self.events.log("(Alternância de fases) Leitor {} terminou de ler.", reader_id)
+
+        with self.condition:
+            self.read_count -= 1
+            if self.read_count == 0:  # Fim da fase de leitura: libera o próximo escritor
+                self.condition.notify_all()
+
+    def write(self, writer_id):
+        stream = self.workload.stream(f"writer-{writer_id}")  # Sorteios deste participante
+        start = self.clock.now_ns()
+        with self.condition:
+            self.writers_present += 1  # Novos leitores passam a esperar a próxima fase
+            while self.read_count > 0 or self.writer_active:
+                self.condition.wait()
+            self.writer_active = True
+        self.waits.record("write", self.clock.now_ns() - start)
+
+        # Simula a escrita
+        self.events.log("(Alternância de fases) Escritor {} está escrevendo...", writer_id)
+        self.work(stream.uniform(0.1, 0.5))
+        self.events.log("(Alternância de fases) Escritor {} terminou de escrever.", writer_id)
+
+        with self.condition:
+            self.writer_active = False
+            self.writers_present -= 1
+            # Admite de uma vez os leitores bloqueados, antes de qualquer outro escritor
+            self.read_count += self.waiting_readers
+            self.waiting_readers = 0
+            self.write_phase += 1
+            self.condition.notify_all()
+
+# Cópia na escrita (no estilo RCU): os dados compartilhados são uma versão imutável
+# (número da versão, autor) e o leitor só lê a referência atual, o que é atômico
+# em Python, sem lock e sem contador de leitores. O escritor monta uma versão nova
+# a partir da atual e a publica trocando a referência; só os escritores se
+# excluem entre si. Leitores que ainda usam a versão antiga continuam com ela, e
+# ela é liberada pela contagem de referências quando o último termina (o "período
+# de carência" do RCU). Leitores nunca esperam, mas podem ler uma versão que um
+# escritor em andamento já está substituindo.
+class ReadersWritersCopyOnWrite:
+    def __init__(self, context=None):
+        context = context or RunContext()
+        self.waits = context.waits  # Registro dos tempos de espera para ler e escrever
+        self.events = context.events  # Registro de eventos
+        self.clock = context.clock
+        self.workload = context.workload  # Fluxos de sorteios dos participantes
+        self.work = context.work  # Fase de trabalho: time.sleep ou computação (--work)
+        self.snapshot = (0, None)  # Versão publicada: (número da versão, último escritor)
+        self.write_lock = context.sync.Lock()  # Serializa apenas os escritores
+
+    def read(self, reader_id):
+        stream = self.workload.stream(f"reader-{reader_id}")  # Sorteios deste participante
+        start = self.clock.now_ns()
+        version, author = self.snapshot  # Leitura atômica da referência, sem lock
+        self.waits.record("read", self.clock.now_ns() - start)
+
+        # Simula a leitura sobre a versão obtida
+        self.events.log("(Cópia na escrita) Leitor {} está lendo a versão {}...", reader_id, version)
+        self.work(stream.uniform(0.1, 0.5))
+        self.events.log("(Cópia na escrita) Leitor {} terminou de ler.", reader_id)
+
+    def write(self, writer_id):
+        stream = self.workload.stream(f"writer-{writer_id}")  # Sorteios deste participante
+        start = self.clock.now_ns()
         with self.write_lock:
-            print(f"(Locks/Mutexes) Escritor {writer_id} está escrevendo...")
-            time.sleep(random.uniform(0.1, 0.5))  # Simula a escrita
-            print(f"(Locks/Mutexes) Escritor {writer_id} terminou de escrever.")
+            self.waits.record("write", self.clock.now_ns() - start)
+            version, _ = self.snapshot
+            # Simula a construção da nova versão enquanto os leitores seguem com a atual
+            self.events.log("(Cópia na escrita) Escritor {} está escrevendo...", writer_id)
+            self.work(stream.uniform(0.1, 0.5))
+            self.snapshot = (version + 1, writer_id)  # Publica a nova versão
+            self.events.log("(Cópia na escrita) Escritor {} publicou a versão {}.", writer_id, version + 1)
+
+# Quantidade de fatias do indicador de leitores em ReadersWritersSharded
+SHARDS = 16
+
+# Fatia do indicador de leitores: contador próprio com sua condição
+class ReaderShard:
+    def __init__(self, context):
+        self.count = 0  # Leitores ativos nesta fatia
+        self.condition = context.sync.Condition()
+
+# Indicador de leitores fragmentado (no estilo dos big-reader locks e do BRAVO):
+# em vez de um único read_count sob um único mutex, cada leitor atualiza só a
+# fatia dele (reader_id % SHARDS), então leitores de fatias diferentes não
+# disputam o mesmo lock. O custo vai para o escritor: ele sinaliza presença,
+# barrando novos leitores, e percorre todas as fatias esperando cada uma esvaziar.
+class ReadersWritersSharded:
+    def __init__(self, context=None, shards=SHARDS):
+        context = context or RunContext()
+        self.waits = context.waits  # Registro dos tempos de espera para ler e escrever
+        self.events = context.events  # Registro de eventos
+        self.clock = context.clock
+        self.workload = context.workload  # Fluxos de sorteios dos participantes
+        self.work = context.work  # Fase de trabalho: time.sleep ou computação (--work)
+        self.shards = [ReaderShard(context) for _ in range(shards)]
+        self.writer_present = False  # Escritor entrando ou escrevendo: novos leitores esperam
+        self.write_lock = context.sync.Lock()  # Serializa os escritores
+
+    def read(self, reader_id):
+        stream = self.workload.stream(f"reader-{reader_id}")  # Sorteios deste participante
+        shard = self.shards[reader_id % len(self.shards)]
+        start = self.clock.now_ns()
+        with shard.condition:
+            while self.writer_present:
+                shard.condition.wait()
+            shard.count += 1
+        self.waits.record("read", self.clock.now_ns() - start)
+
+        # Simula a leitura
+        self.events.log("(Leitores fragmentados) Leitor {} está lendo...", reader_id)
+        self.work(stream.uniform(0.1, 0.5))
+        self.events.log("(Leitores fragmentados) Leitor {} terminou de ler.", reader_id)
+
+        with shard.condition:
+            shard.count -= 1
+            if shard.count == 0 and self.writer_present:  # Último leitor da fatia: avisa o escritor
+                shard.condition.notify_all()
+
+    def write(self, writer_id):
+        stream = self.workload.stream(f"writer-{writer_id}")  # Sorteios deste participante
+        start = self.clock.now_ns()
+        self.write_lock.acquire()
+        self.writer_present = True
+        # Percorre as fatias: um leitor que entrou antes da sinalização é visto
+        # aqui, e os que chegam depois já encontram writer_present
+        for shard in self.shards:
+            with shard.condition:
+                while shard.count > 0:
+                    shard.condition.wait()
+        self.waits.record("write", self.clock.now_ns() - start)
+
+        # Simula a escrita
+        self.events.log("(Leitores fragmentados) Escritor {} está escrevendo...", writer_id)
+        self.work(stream.uniform(0.1, 0.5))
+        self.events.log("(Leitores fragmentados) Escritor {} terminou de escrever.", writer_id)
+
+        self.writer_present = False
+        for shard in self.shards:  # Libera os leitores barrados em todas as fatias
+            with shard.condition:
+                shard.condition.notify_all()
+        self.write_lock.release()
 
 # Funções dos leitores e escritores
 def reader_task(rw, reader_id, num_reads):
@@ -129,22 +435,65 @@ def writer_task(rw, writer_id, num_writes):
     for _ in range(num_writes):  # Cada escritor executa múltiplas escritas
         rw.write(writer_id)
 
-# Função principal para rodar o teste e medir o tempo de execução
-def run_readers_writers_test(buffer_class, num_readers=5, num_writers=2, num_operations=3):
-    rw = buffer_class()  # Inicializa a classe do buffer
+# Executa a tarefa de uma thread, guardando a exceção em vez de deixá-la só no stderr
+def run_task(errors, target, *args):
+    try:
+        target(*args)
+    except Exception as error:
+        errors.append(error)
+
+# Execução em que um leitor ou escritor falhou: não tem tempo (None, célula vazia no dataset)
+def failed(buffer_class, error, context):
+    print(f"Execução abortada ({buffer_class.__name__}): {error}")
+    if context is not None:
+        context.set_metric("erro", str(error))
+    return None
+
+# Função principal para rodar o teste e medir o tempo de execução.
+# Se alguma thread ou tarefa falhar, o resultado é None
+def run_readers_writers_test(buffer_class, num_readers=5, num_writers=2, num_operations=3, context=None):
+    # Versões com corrotinas usam uma tarefa do asyncio por leitor e por escritor
+    if inspect.iscoroutinefunction(buffer_class.read):
+        try:
+            return run_readers_writers_test_async(buffer_class, num_readers, num_writers, num_operations, context)
+        except Exception as error:
+            return failed(buffer_class, error, context)
+
+    rw = buffer_class(context)  # Inicializa a classe do buffer
+
+    tasks = [functools.partial(reader_task, rw, i + 1, num_operations) for i in range(num_readers)]
+    tasks += [functools.partial(writer_task, rw, i + 1, num_operations) for i in range(num_writers)]
+
+    # No relógio virtual, o escalonador de eventos discretos executa a rodada em tempo simulado
+    if context is not None and context.clock.threads is not None:
+        try:
+            return context.clock.threads.run(tasks)
+        except Exception as error:
+            return failed(buffer_class, error, context)
+
+    # Com o pool (--pool), as threads persistentes executam a rodada e o custo de criá-las é gravado à parte
+    if context is not None and context.pool is not None:
+        try:
+            elapsed = context.pool.run(tasks)
+        except Exception as error:
+            elapsed = failed(buffer_class, error, context)
+        context.set_metric("pool.setup_s", context.pool.take_setup())
+        return elapsed
+
     threads = []  # Lista para armazenar as threads
+    errors = []  # Exceções das threads
 
     # Cria threads para leitores
     for i in range(num_readers):
-        t = threading.Thread(target=reader_task, args=(rw, i + 1, num_operations))
+        t = threading.Thread(target=run_task, args=(errors, reader_task, rw, i + 1, num_operations))
         threads.append(t)
 
     # Cria threads para escritores
     for i in range(num_writers):
-        t = threading.Thread(target=writer_task, args=(rw, i + 1, num_operations))
+        t = threading.Thread(target=run_task, args=(errors, writer_task, rw, i + 1, num_operations))
         threads.append(t)
 
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     # Inicia todas as threads
     for t in threads:
@@ -154,41 +503,36 @@ def run_readers_writers_test(buffer_class, num_readers=5, num_writers=2, num_ope
     for t in threads:
         t.join()
 
-    end_time = time.time()
+    end_time = time.perf_counter()
+    if errors:
+        return failed(buffer_class, errors[0], context)
     return end_time - start_time
 
-# Pergunta ao usuário o número de repetições
-num_repeticoes = int(input("Quantas vezes esses testes serão repetidos? "))
-
-# Salva os tempos de execução em um dataset
-dataset_path = "dataset/dataset.csv"
-with open(dataset_path, mode="w", newline="") as file:
-    writer = csv.writer(file)
-    writer.writerow(["Execução", "Semáforos", "Monitores", "Locks/Mutexes"])
-
-    for repeticao in range(1, num_repeticoes + 1):
-        print(f"\nIniciando repetição {repeticao}/{num_repeticoes}...")
-
-        # Executa os testes para cada abordagem
-        tempos = {
-            "Semáforos": run_readers_writers_test(ReadersWritersSemaphores),
-            "Monitores": run_readers_writers_test(ReadersWritersMonitors),
-            "Locks/Mutexes": run_readers_writers_test(ReadersWritersLocks)
-        }
-
-        writer.writerow([repeticao, tempos["Semáforos"], tempos["Monitores"], tempos["Locks/Mutexes"]])
-
-# Gera o gráfico com base nos dados
-# Lê os dados do dataset
-data = pd.read_csv(dataset_path)
-avg_times = data.mean().iloc[1:]
-std_dev = data.std().iloc[1:]
-
-plt.bar(avg_times.index, avg_times.values, yerr=1.96 * std_dev / np.sqrt(len(data)), capsize=5, color=['#87CEFA', '#2F4F4F', '#F4A460'])
-plt.ylim(0, max(avg_times.values + 1.96 * std_dev / np.sqrt(len(data))) * 1.2)
-for i, (value, error) in enumerate(zip(avg_times.values, 1.96 * std_dev / np.sqrt(len(data)))):
-            plt.text(i, value + error + 0.05, f"{value:.2f}s", ha='center', va='bottom')
-plt.xlabel("Mecanismo de Exclusão Mútua")
-plt.ylabel("Tempo Médio de Execução (s)")
-plt.title("Comparação de Tempos Médios: Readers-Writers")
-plt.savefig("graficos/comparison_average.png") 
\ No newline at end of file
+# Executa um teste com os parâmetros informados.
+# Uma execução em que alguma thread falhou não tem tempo (None, célula vazia no dataset)
+def run_once(buffer_class, params, context):
+    elapsed = run_readers_writers_test(buffer_class, params["readers"], params["writers"], params["operations"], context)
+    # A maior espera de um escritor já sai do histograma como "write.max_us"
+    if elapsed is not None:
+        context.set_metric("operacoes_por_s", (params["readers"] + params["writers"]) * params["operations"] / elapsed)
+        context.set_metric("leituras_por_s", params["readers"] * params["operations"] / elapsed)
+    return elapsed
+
+# Mecanismos comparados, na ordem das colunas do dataset: chave -> (rótulo, classe)
+MECHANISMS = {
+    "semaphores": ("Semáforos", ReadersWritersSemaphores),
+    "monitors": ("Monitores", ReadersWritersMonitors),
+    "locks": ("Locks/Mutexes", ReadersWritersLocks),
+    "spinlock": ("Spinlock adaptativo", ReadersWritersSpinLocks),
+    "writer-preference": ("Preferência para escritores", ReadersWritersWriterPreference),
+    "phase-fair": ("Alternância de fases", ReadersWritersPhaseFair),
+    "copy-on-write": ("Cópia na escrita", ReadersWritersCopyOnWrite),
+    "sharded": ("Leitores fragmentados", ReadersWritersSharded),
+    "semaphores-asyncio": ("Semáforos (asyncio)", AsyncReadersWritersSemaphores),
+    "monitors-asyncio": ("Monitores (asyncio)", AsyncReadersWritersMonitors),
+    "locks-asyncio": ("Locks/Mutexes (asyncio)", AsyncReadersWritersLocks),
+}
+
+if __name__ == "__main__":
+    from common.runner import main
+    main(default_problem="readers-writers")
@@ -0,0 +1,171 @@
+import asyncio
+from common.context import RunContext
+
+# Versões dos Leitores-Escritores com corrotinas: cada leitor e escritor é uma
+# tarefa do asyncio e a sincronização usa asyncio.Semaphore, asyncio.Condition
+# e asyncio.Lock. Como tudo roda em uma única thread, é possível simular
+# milhares de leitores e comparar a troca de tarefas com a troca de threads.
+
+# Implementação com Semáforos do asyncio
+class AsyncReadersWritersSemaphores:
+    def __init__(self, context=None):
+        self.read_count = 0  # Contador de leitores ativos
+        context = context or RunContext()
+        self.waits = context.waits  # Registro dos tempos de espera para ler e escrever
+        self.events = context.events  # Registro de eventos
+        self.workload = context.workload  # Fluxos de sorteios dos participantes
+        self.clock = context.clock  # Relógio real ou virtual
+        self.mutex = asyncio.Semaphore(1)  # Controle de acesso ao contador de leitores
+        self.write_lock = asyncio.Semaphore(1)  # Controle de acesso exclusivo para escritores
+
+    async def read(self, reader_id):
+        stream = self.workload.stream(f"reader-{reader_id}")  # Sorteios deste participante
+        # Controle de entrada de leitores
+        start = self.clock.now_ns()
+        await self.mutex.acquire()
+        self.read_count += 1
+        if self.read_count == 1:  # Se for o primeiro leitor, bloqueia os escritores
+            await self.write_lock.acquire()
+        self.mutex.release()
+        self.waits.record("read", self.clock.now_ns() - start)
+
+        # Simula a leitura
+        self.events.log("(Semaphores - asyncio) Leitor {} está lendo...", reader_id)
+        await asyncio.sleep(stream.uniform(0.1, 0.5))
+        self.events.log("(Semaphores - asyncio) Leitor {} terminou de ler.", reader_id)
+
+        # Controle de saída de leitores
+        await self.mutex.acquire()
+        self.read_count -= 1
+        if self.read_count == 0:  # Se não houver mais leitores, libera os escritores
+            self.write_lock.release()
+        self.mutex.release()
+
+    async def write(self, writer_id):
+        stream = self.workload.stream(f"writer-{writer_id}")  # Sorteios deste participante
+        # Controle de exclusão mútua para escritores
+        start = self.clock.now_ns()
+        await self.write_lock.acquire()
+        self.waits.record("write", self.clock.now_ns() - start)
+        self.events.log("(Semaphores - asyncio) Escritor {} está escrevendo...", writer_id)
+        await asyncio.sleep(stream.uniform(0.1, 0.5))  # Simula a escrita
+        self.events.log("(Semaphores - asyncio) Escritor {} terminou de escrever.", writer_id)
+        self.write_lock.release()
+
+# Implementação com Monitores do asyncio
+class AsyncReadersWritersMonitors:
+    def __init__(self, context=None):
+        self.read_count = 0  # Contador de leitores ativos
+        context = context or RunContext()
+        self.waits = context.waits  # Registro dos tempos de espera para ler e escrever
+        self.events = context.events  # Registro de eventos
+        self.workload = context.workload  # Fluxos de sorteios dos participantes
+        self.clock = context.clock  # Relógio real ou virtual
+        self.writer_active = False  # Indica se há um escritor ativo
+        self.condition = asyncio.Condition()  # Condição para sincronização entre leitores e escritores
+
+    async def read(self, reader_id):
+        stream = self.workload.stream(f"reader-{reader_id}")  # Sorteios deste participante
+        start = self.clock.now_ns()
+        async with self.condition:
+            # Espera enquanto houver um escritor ativo
+            while self.writer_active:
+                await self.condition.wait()
+            self.read_count += 1  # Incrementa o contador de leitores ativos
+        self.waits.record("read", self.clock.now_ns() - start)
+
+        # Simula a leitura
+        self.events.log("(Monitors - asyncio) Leitor {} está lendo...", reader_id)
+        await asyncio.sleep(stream.uniform(0.1, 0.5))
+        self.events.log("(Monitors - asyncio) Leitor {} terminou de ler.", reader_id)
+
+        async with self.condition:
+            self.read_count -= 1  # Decrementa o contador de leitores ativos
+            if self.read_count == 0:  # Se não houver mais leitores, notifica escritores
+                self.condition.notify_all()
+
+    async def write(self, writer_id):
+        stream = self.workload.stream(f"writer-{writer_id}")  # Sorteios deste participante
+        start = self.clock.now_ns()
+        async with self.condition:
+            # Espera enquanto houver leitores ou outro escritor ativo
+            while self.read_count > 0 or self.writer_active:
+                await self.condition.wait()
+            self.writer_active = True  # Indica que um escritor está ativo
+        self.waits.record("write", self.clock.now_ns() - start)
+
+        # Simula a escrita
+        self.events.log("(Monitors - asyncio) Escritor {} está escrevendo...", writer_id)
+        await asyncio.sleep(stream.uniform(0.1, 0.5))
+        self.events.log("(Monitors - asyncio) Escritor {} terminou de escrever.", writer_id)
+
+        async with self.condition:
+            self.writer_active = False  # Libera o escritor
+            self.condition.notify_all()  # Notifica leitores ou escritores aguardando
+
+# Implementação com Locks/Mutexes do asyncio
+class AsyncReadersWritersLocks:
+    def __init__(self, context=None):
+        self.read_count = 0  # Contador de leitores ativos
+        context = context or RunContext()
+        self.waits = context.waits  # Registro dos tempos de espera para ler e escrever
+        self.events = context.events  # Registro de eventos
+        self.workload = context.workload  # Fluxos de sorteios dos participantes
+        self.clock = context.clock  # Relógio real ou virtual
+        self.lock = asyncio.Lock()  # Controle de acesso ao contador de leitores
+        self.write_lock = asyncio.Lock()  # Controle de acesso exclusivo para escritores
+
+    async def read(self, reader_id):
+        stream = self.workload.stream(f"reader-{reader_id}")  # Sorteios deste participante
+        # Controle de entrada de leitores
+        start = self.clock.now_ns()
+        async with self.lock:
+            self.read_count += 1
+            if self.read_count == 1:  # Se for o primeiro leitor, bloqueia os escritores
+                await self.write_lock.acquire()
+        self.waits.record("read", self.clock.now_ns() - start)
+
+        # Simula a leitura
+        self.events.log("(Locks/Mutexes - asyncio) Leitor {} está lendo...", reader_id)
+        await asyncio.sleep(stream.uniform(0.1, 0.5))
+        self.events.log("(Locks/Mutexes - asyncio) Leitor {} terminou de ler.", reader_id)
+
+        # Controle de saída de leitores
+        async with self.lock:
+            self.read_count -= 1
+            if self.read_count == 0:  # Se não houver mais leitores, libera os escritores
+                self.write_lock.release()
+
+    async def write(self, writer_id):
+        stream = self.workload.stream(f"writer-{writer_id}")  # Sorteios deste participante
+        # Controle de exclusão mútua para escritores
+        start = self.clock.now_ns()
+        async with self.write_lock:
+            self.waits.record("write", self.clock.now_ns() - start)
+            self.events.log("(Locks/Mutexes - asyncio) Escritor {} está escrevendo...", writer_id)
+            await asyncio.sleep(stream.uniform(0.1, 0.5))  # Simula a escrita
+            self.events.log("(Locks/Mutexes - asyncio) Escritor {} terminou de escrever.", writer_id)
+
+# Corrotinas dos leitores e escritores
+async def reader_task(rw, reader_id, num_reads):
+    for _ in range(num_reads):  # Cada leitor executa múltiplas leituras
+        await rw.read(reader_id)
+
+async def writer_task(rw, writer_id, num_writes):
+    for _ in range(num_writes):  # Cada escritor executa múltiplas escritas
+        await rw.write(writer_id)
+
+# Roda o teste com uma tarefa por leitor e por escritor e mede o tempo de execução
+def run_readers_writers_test_async(buffer_class, num_readers=5, num_writers=2, num_operations=3, context=None):
+    context = context or RunContext()
+
+    async def run():
+        rw = buffer_class(context)  # Criado dentro do laço de eventos
+        tasks = [reader_task(rw, i + 1, num_operations) for i in range(num_readers)]
+        tasks += [writer_task(rw, i + 1, num_operations) for i in range(num_writers)]
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        await asyncio.gather(*tasks)
+        return loop.time() - start_time
+
+    return context.clock.run(run())
@@ -0,0 +1,10 @@
+# Compara os resultados gravados com um baseline (pre-results/ por padrão) e os
+# mecanismos entre si, sinalizando regressões estatisticamente significativas.
+# Exemplos:
+#   python analysis.py
+#   python analysis.py results/noite --fail-on-regression
+#   python analysis.py results/noite --baseline results/ontem --problem readers-writers
+from common.analysis import main
+
+if __name__ == "__main__":
+    main()
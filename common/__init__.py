@@ -0,0 +1,2 @@
+# Código compartilhado pelos benchmarks dos três problemas (instrumentação,
+# estatísticas e utilitários de execução).
@@ -0,0 +1,218 @@
+import argparse
+import csv
+import math
+import os
+import sys
+
+import numpy as np
+
+from common.dataset import format_configuration
+from common.runner import PROBLEMS, ROOT_DIR, build_parser, configurations, load_problem
+
+# Comparação estatística dos resultados. Para cada problema:
+#
+#   baseline     cada mecanismo da execução nova contra o mesmo mecanismo no
+#                baseline (por padrão, pre-results/): IC bootstrap da razão entre
+#                as médias (nova / baseline) e teste de Mann-Whitney (amostras
+#                independentes). É regressão quando p < alpha e o IC inteiro
+#                fica acima de 1 (mais lento).
+#   mecanismos   cada par de mecanismos da execução nova, por configuração: as
+#                linhas do dataset são pareadas (mesma repetição e, com
+#                --workload paired, a mesma carga), então usa o teste de
+#                Wilcoxon dos postos sinalizados e o IC bootstrap da razão.
+#
+# O bootstrap é vetorizado: todas as reamostragens são sorteadas de uma vez
+# como uma matriz de índices. Os testes usam a aproximação normal (com
+# correção de empates e de continuidade), adequada às dezenas ou centenas de
+# repetições dos datasets.
+
+ANALYSIS_HEADER = ["Comparação", "Configuração", "Mecanismo", "Referência", "n", "n referência",
+                   "Média (s)", "Média referência (s)", "Razão", "IC inferior", "IC superior", "Teste", "p", "Resultado",
+                   "Observação"]
+RESULT = ANALYSIS_HEADER.index("Resultado")
+
+# Os datasets sem varredura (pre-results) vêm das versões originais: eventos impressos
+# dentro da região medida e tempo medido com time.time. Só são comparáveis com a
+# configuração padrão do runner executada com --log-mode print
+SWEEPLESS_NOTE = "baseline sem varredura: print dentro da medida e time.time"
+
+# Lê um dataset.csv como {configuração: {mecanismo: tempos}}; células vazias viram NaN.
+# Datasets sem a coluna Configuração (ex.: pre-results) têm uma única configuração "".
+def load_dataset(path):
+    with open(path, newline="") as file:
+        rows = list(csv.reader(file))
+    header = rows[0]
+    mechanisms = [column for column in header if column not in ("Execução", "Configuração")]
+    config_column = header.index("Configuração") if "Configuração" in header else None
+    grouped = {}
+    for row in rows[1:]:
+        configuration = row[config_column] if config_column is not None else ""
+        columns = grouped.setdefault(configuration, {mechanism: [] for mechanism in mechanisms})
+        for mechanism in mechanisms:
+            value = row[header.index(mechanism)]
+            columns[mechanism].append(float(value) if value else math.nan)
+    return {configuration: {mechanism: np.array(values) for mechanism, values in columns.items()}
+            for configuration, columns in grouped.items()}
+
+# Postos (1..n) com empates recebendo a média dos postos; devolve também o tamanho de cada grupo de empates
+def rank_with_ties(values):
+    order = np.argsort(values, kind="mergesort")
+    ordered = values[order]
+    starts = np.r_[True, ordered[1:] != ordered[:-1]]
+    group = np.cumsum(starts) - 1
+    ties = np.bincount(group)
+    average = np.flatnonzero(starts) + (ties - 1) / 2 + 1
+    ranks = np.empty(len(values))
+    ranks[order] = average[group]
+    return ranks, ties
+
+# p bilateral de uma estatística com distribuição aproximadamente normal
+def normal_p_value(statistic, mean, variance):
+    if variance <= 0:
+        return 1.0
+    z = (abs(statistic - mean) - 0.5) / math.sqrt(variance)  # Correção de continuidade
+    return min(1.0, math.erfc(max(z, 0.0) / math.sqrt(2)))
+
+# Teste de Mann-Whitney para duas amostras independentes
+def mann_whitney(x, y):
+    n1, n2 = len(x), len(y)
+    ranks, ties = rank_with_ties(np.concatenate([x, y]))
+    u = ranks[:n1].sum() - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - (ties ** 3 - ties).sum() / (n * (n - 1)))
+    return normal_p_value(u, n1 * n2 / 2, variance)
+
+# Teste de Wilcoxon dos postos sinalizados para amostras pareadas (diferenças nulas são descartadas)
+def wilcoxon(x, y):
+    differences = x - y
+    differences = differences[differences != 0]
+    n = len(differences)
+    if n == 0:
+        return 1.0
+    ranks, ties = rank_with_ties(np.abs(differences))
+    w = ranks[differences > 0].sum()
+    variance = n * (n + 1) * (2 * n + 1) / 24 - (ties ** 3 - ties).sum() / 48
+    return normal_p_value(w, n * (n + 1) / 4, variance)
+
+# IC percentil da razão entre as médias de x e y por bootstrap. Pareado: as
+# mesmas linhas são sorteadas nas duas amostras; independente: sorteios separados.
+def bootstrap_ratio(x, y, rng, resamples=10000, confidence=0.95, paired=False):
+    rows = rng.integers(0, len(x), size=(resamples, len(x)))
+    other = rows if paired else rng.integers(0, len(y), size=(resamples, len(y)))
+    ratios = x[rows].mean(axis=1) / y[other].mean(axis=1)
+    tail = (1 - confidence) / 2 * 100
+    low, high = np.percentile(ratios, [tail, 100 - tail])
+    return low, high
+
+# Entre execuções, mais lento é regressão; entre mecanismos, só "mais lento"
+VERDICTS = {"baseline": ("REGRESSÃO", "melhora"), "mecanismos": ("mais lento", "mais rápido")}
+
+def verdict(kind, p, low, high, alpha):
+    slower, faster = VERDICTS[kind]
+    if p < alpha and low > 1:
+        return slower
+    if p < alpha and high < 1:
+        return faster
+    return "sem diferença"
+
+def compare(kind, configuration, name, reference, x, y, rng, args, paired):
+    p = wilcoxon(x, y) if paired else mann_whitney(x, y)
+    low, high = bootstrap_ratio(x, y, rng, args.resamples, paired=paired)
+    ratio = x.mean() / y.mean()
+    return [kind, configuration, name, reference, len(x), len(y), x.mean(), y.mean(), ratio, low, high,
+            "Wilcoxon" if paired else "Mann-Whitney", p, verdict(kind, p, low, high, args.alpha)]
+
+# Tempos válidos (sem as execuções abortadas ou não executadas)
+def valid(values):
+    return values[~np.isnan(values)]
+
+# Configuração equivalente à das versões originais: a padrão do runner com --log-mode print
+def sweepless_configuration(name):
+    module = load_problem(name)
+    return format_configuration(configurations(module, build_parser([name]).parse_args(["--log-mode", "print"]))[0])
+
+# Compara o dataset novo de um problema com o baseline e os mecanismos entre si.
+# Um baseline sem varredura (pre-results) só é comparável com "sweepless"
+# (sweepless_configuration); as demais configurações precisam da mesma
+# configuração no baseline.
+def analyze_problem(dataset_path, baseline_path, rng, args, sweepless=None):
+    current = load_dataset(dataset_path)
+    results = []
+
+    if baseline_path and os.path.exists(baseline_path):
+        baseline = load_dataset(baseline_path)
+        note = ""
+        if list(baseline) == [""]:
+            note = SWEEPLESS_NOTE
+            if sweepless not in current:
+                print(f"Baseline sem varredura em {baseline_path}: só é comparado com a configuração "
+                      f"\"{sweepless}\", que não foi executada")
+        for configuration, columns in current.items():
+            reference = baseline.get(configuration)
+            if reference is None and note and configuration == sweepless:
+                reference = baseline[""]
+            if reference is None:
+                continue
+            for mechanism, values in columns.items():
+                x, y = valid(values), valid(reference.get(mechanism, np.array([])))
+                if len(x) >= 2 and len(y) >= 2:
+                    results.append(compare("baseline", configuration, mechanism, f"{mechanism} (baseline)",
+                                           x, y, rng, args, paired=False) + [note])
+
+    for configuration, columns in current.items():
+        names = [name for name, values in columns.items() if len(valid(values)) >= 2]
+        for i, first in enumerate(names):
+            for second in names[i + 1:]:
+                both = ~np.isnan(columns[first]) & ~np.isnan(columns[second])  # Linhas com os dois tempos
+                if both.sum() >= 2:
+                    results.append(compare("mecanismos", configuration, first, second,
+                                           columns[first][both], columns[second][both], rng, args, paired=True)
+                                   + [""])
+    return results
+
+def print_results(name, results):
+    for row in results:
+        kind, configuration, mechanism, reference = row[:4]
+        ratio, low, high, test, p, result, note = row[8:]
+        where = f" [{configuration}]" if configuration else ""
+        print(f"[{name}] {kind}{where}: {mechanism} vs {reference}: razão {ratio:.3f} "
+              f"(IC 95% {low:.3f}–{high:.3f}), {test} p={p:.4f} -> {result}" + (f" ({note})" if note else ""))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compara os datasets gravados com um baseline e entre mecanismos.")
+    parser.add_argument("base", nargs="?", default=ROOT_DIR,
+                        help="Diretório de resultados a analisar (padrão: raiz do repositório)")
+    parser.add_argument("--baseline", default=os.path.join(ROOT_DIR, "pre-results"),
+                        help="Diretório de resultados de referência (padrão: pre-results)")
+    parser.add_argument("--problem", nargs="+", choices=list(PROBLEMS), help="Problemas a incluir (padrão: todos)")
+    parser.add_argument("--alpha", type=float, default=0.05, help="Nível de significância (padrão: 0.05)")
+    parser.add_argument("--resamples", type=int, default=10000, help="Reamostragens do bootstrap (padrão: 10000)")
+    parser.add_argument("--seed", type=int, default=0, help="Semente do bootstrap")
+    parser.add_argument("--fail-on-regression", action="store_true",
+                        help="Termina com código 1 se alguma regressão em relação ao baseline for encontrada")
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(args.seed)
+    regressions = 0
+    for name, directory in PROBLEMS.items():
+        if args.problem and name not in args.problem:
+            continue
+        dataset_path = os.path.join(args.base, directory, "dataset", "dataset.csv")
+        if not os.path.exists(dataset_path):
+            continue
+        baseline_path = os.path.join(args.baseline, directory, "dataset", "dataset.csv")
+        results = analyze_problem(dataset_path, baseline_path, rng, args, sweepless_configuration(name))
+        print_results(name, results)
+
+        output_path = os.path.join(os.path.dirname(dataset_path), "analise.csv")
+        with open(output_path, mode="w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(ANALYSIS_HEADER)
+            writer.writerows(results)
+        print(f"[{name}] análise gravada em {output_path}")
+        regressions += sum(1 for row in results if row[0] == "baseline" and row[RESULT] == "REGRESSÃO")
+
+    if regressions:
+        print(f"{regressions} regressão(ões) em relação ao baseline")
+        if args.fail_on_regression:
+            sys.exit(1)
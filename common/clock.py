@@ -0,0 +1,91 @@
+import asyncio
+import selectors
+import time
+
+from common.scheduler import VirtualScheduler
+
+# Relógios dos testes. O relógio real mede e dorme em tempo de parede. O
+# virtual é uma simulação de eventos discretos: nada espera de verdade e o
+# tempo apenas avança até o próximo timer quando todos os participantes estão
+# bloqueados. Uma varredura inteira termina em segundos e, com a mesma semente,
+# produz sempre os mesmos resultados.
+#
+# As versões com asyncio rodam em um laço de eventos cujo asyncio.sleep só
+# avança o relógio (VirtualTimeLoop). As versões com threads usam o
+# escalonador de common/scheduler.py (clock.threads): as primitivas de
+# context.sync avisam quando uma thread bloqueia e a fase de trabalho
+# (context.work) só avança o relógio. Processos e as filas da biblioteca
+# padrão bloqueiam por fora do escalonador e não rodam no relógio virtual.
+
+# Seletor que, em vez de bloquear até o próximo timer, avança o relógio do laço
+class VirtualSelector(selectors.DefaultSelector):
+    def __init__(self):
+        super().__init__()
+        self.loop = None
+
+    def select(self, timeout=None):
+        events = super().select(0)
+        if events or timeout == 0:
+            return events
+        if timeout is None:
+            # Nenhum timer agendado: só um evento externo pode acordar o laço
+            return super().select(None)
+        self.loop.now += timeout
+        return []
+
+# Laço de eventos cujo time() é o tempo simulado, começando em zero
+class VirtualTimeLoop(asyncio.SelectorEventLoop):
+    def __init__(self):
+        self.now = 0.0
+        selector = VirtualSelector()
+        super().__init__(selector)
+        selector.loop = self
+
+    def time(self):
+        return self.now
+
+class RealClock:
+    name = "real"
+    threads = None  # Threads escalonadas pelo SO
+
+    # Instante atual em nanossegundos, para os tempos de espera
+    def now_ns(self):
+        return time.perf_counter_ns()
+
+    # Executa a corrotina principal de um teste
+    def run(self, main):
+        return asyncio.run(main)
+
+class VirtualClock:
+    name = "virtual"
+
+    def __init__(self):
+        self.threads = VirtualScheduler()  # Escalonador das versões com threads
+
+    def now_ns(self):
+        if self.threads.running:
+            return self.threads.now_ns()
+        return int(asyncio.get_running_loop().time() * 1e9)
+
+    def run(self, main):
+        loop = VirtualTimeLoop()
+        try:
+            return loop.run_until_complete(main)
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+CLOCKS = {
+    "real": RealClock,
+    "virtual": VirtualClock,
+}
+
+def make_clock(name):
+    if name not in CLOCKS:
+        raise ValueError(f"Relógio desconhecido: {name!r} (opções: {', '.join(CLOCKS)})")
+    return CLOCKS[name]()
+
+# Mecanismos que bloqueiam por fora de context.sync (processos, queue.Queue)
+# declaram virtual_time = False e não rodam no relógio virtual
+def supports_virtual(mechanism_class):
+    return getattr(mechanism_class, "virtual_time", True)
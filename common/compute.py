@@ -0,0 +1,103 @@
+import hashlib
+import inspect
+import sys
+import sysconfig
+import time
+
+# Fases de trabalho das versões com threads e processos (pensar, comer, ler,
+# escrever, produzir e consumir). No modo original ("sleep") cada fase é um
+# time.sleep, que libera o GIL: as threads nunca disputam CPU. Nos demais
+# modos a fase faz computação de verdade:
+#
+#   python    laço aritmético em Python puro (segura o GIL o tempo todo)
+#   hashlib   SHA-256 de um bloco de 64 KiB (o hashlib libera o GIL em blocos grandes)
+#   numpy     produto de matrizes 64x64 (o BLAS libera o GIL), se o numpy estiver instalado
+#
+# A quantidade de trabalho de uma fase é fixa: o runner mede uma vez quantas
+# unidades cabem em um segundo com uma thread sozinha (calibrate) e cada fase
+# de "s" segundos executa s * taxa * escala unidades. Com disputa pelo GIL, a
+# mesma quantidade de trabalho demora mais, e é isso que a medida captura.
+#
+# As versões com asyncio só dormem: computação bloquearia o laço de eventos
+# inteiro e não existe no relógio virtual. Nos modos com computação elas não
+# são executadas, já que seus tempos não seriam comparáveis com os demais.
+
+WORK_MODES = ("sleep", "python", "hashlib", "numpy")
+
+HASH_BLOCK = bytes(64 * 1024)
+
+def python_unit():
+    total = 0
+    for i in range(2000):
+        total += i * i
+    return total
+
+def hashlib_unit():
+    return hashlib.sha256(HASH_BLOCK).digest()
+
+class NumpyUnit:
+    def __init__(self):
+        import numpy  # Opcional: só é necessário neste modo
+        self.matrix = numpy.random.default_rng(0).random((64, 64))
+
+    def __call__(self):
+        return self.matrix @ self.matrix
+
+def make_unit(mode):
+    if mode == "python":
+        return python_unit
+    if mode == "hashlib":
+        return hashlib_unit
+    if mode == "numpy":
+        return NumpyUnit()
+    raise ValueError(f"Modo de trabalho desconhecido: {mode!r} (opções: {', '.join(WORK_MODES)})")
+
+# Unidades de trabalho por segundo com uma única thread
+def calibrate(mode, duration=0.2):
+    unit = make_unit(mode)
+    unit()  # Aquecimento
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < duration:
+        unit()
+        count += 1
+    return count / (time.perf_counter() - start)
+
+# Fase com computação: executa a quantidade de unidades equivalente a "seconds" sem disputa
+class ComputeWork:
+    def __init__(self, mode, rate, scale=1.0):
+        self.mode = mode
+        self.rate = rate  # Unidades por segundo medidas por calibrate
+        self.scale = scale
+        self.unit = make_unit(mode)
+
+    def __call__(self, seconds):
+        for _ in range(max(1, round(seconds * self.rate * self.scale))):
+            self.unit()
+
+# Mecanismos com corrotinas só rodam no modo "sleep"
+def supports_work(mechanism_class, mode):
+    return mode == "sleep" or not any(inspect.iscoroutinefunction(member) for member in vars(mechanism_class).values())
+
+# Fase de trabalho de uma execução: time.sleep (original) ou computação
+def make_work(mode, rate=None, scale=1.0):
+    if mode == "sleep":
+        return time.sleep
+    return ComputeWork(mode, rate if rate is not None else calibrate(mode), scale)
+
+# Indica se o interpretador roda sem GIL (build free-threaded, Python 3.13+).
+# Py_GIL_DISABLED diz como o interpretador foi compilado; sys._is_gil_enabled()
+# diz se o GIL está de fato desligado (ele pode ser religado por PYTHON_GIL=1
+# ou por uma extensão que não suporta execução sem GIL).
+def gil_status():
+    free_threaded_build = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    gil_enabled = is_gil_enabled() if is_gil_enabled is not None else True
+    return {"free_threaded_build": free_threaded_build, "gil_enabled": gil_enabled}
+
+def describe_gil(status):
+    if not status["free_threaded_build"]:
+        return "GIL habilitado (build padrão)"
+    if status["gil_enabled"]:
+        return "build free-threaded com o GIL religado"
+    return "build free-threaded, GIL desabilitado"
@@ -0,0 +1,36 @@
+import threading
+import time
+
+from common.clock import RealClock
+from common.eventlog import EventLog
+from common.histogram import WaitRecorder
+from common.workload import RandomWorkload
+
+# Contexto de uma execução: reúne a instrumentação compartilhada pelos
+# mecanismos de um teste. Cada execução cria o seu, para que as medidas de
+# um mecanismo não se misturem com as de outro.
+class RunContext:
+    def __init__(self, waits=None, events=None, clock=None, workload=None, sync=None, pool=None, work=None):
+        self.waits = waits if waits is not None else WaitRecorder()  # Tempos de espera por operação
+        self.events = events if events is not None else EventLog()  # Eventos, impressos só em flush()
+        self.clock = clock if clock is not None else RealClock()  # Relógio real ou virtual
+        self.workload = workload if workload is not None else RandomWorkload()  # Sorteios dos participantes
+        # Fábrica das primitivas das versões com threads: o módulo threading, o escalonador
+        # do relógio virtual ou um CountingSync sobre um dos dois
+        threads = self.clock.threads
+        self.sync = sync if sync is not None else threads if threads is not None else threading
+        self.pool = pool  # WorkerPool de threads persistentes (--pool) ou None para threads novas
+        # Fase de trabalho: time.sleep (no relógio virtual, o sleep do escalonador) ou computação (--work)
+        self.work = work if work is not None else threads.sleep if threads is not None else time.sleep
+        self.values = {}  # Métricas escalares calculadas pelo teste (ex.: vazão)
+
+    def set_metric(self, name, value):
+        self.values[name] = value
+
+    # Métricas coletadas na execução, prontas para o dataset
+    def metrics(self):
+        metrics = self.waits.summary()
+        if hasattr(self.sync, "summary"):
+            metrics.update(self.sync.summary())  # Contadores de disputa (--count-sync)
+        metrics.update(self.values)
+        return metrics
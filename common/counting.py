@@ -0,0 +1,197 @@
+import threading
+import time
+
+# Contadores de disputa para as versões com threads. CountingSync é uma fábrica
+# com a mesma interface do módulo threading (Lock, Semaphore e Condition); os
+# mecanismos criam suas primitivas por context.sync, que por padrão é o
+# próprio threading (sem custo extra). Com o runner em --count-sync, cada
+# primitiva da base (threading ou, no relógio virtual, o escalonador) é
+# embrulhada e conta:
+#
+#   acquires         tentativas de aquisição (inclui entrar em um "with")
+#   blocked          aquisições que não conseguiram de imediato e bloquearam
+#   waits            chamadas a wait() de condições
+#   futile_wakeups   wait() chamado de novo pela mesma thread sem ter liberado
+#                    nada desde que acordou, ou seja, o predicado do "while"
+#                    continuou falso (acordou à toa)
+#
+# Como no WaitRecorder, cada thread incrementa contadores próprios e eles só
+# são somados ao final.
+
+COUNTERS = ("acquires", "blocked", "waits", "futile_wakeups")
+
+class ThreadCounters:
+    def __init__(self):
+        self._local = threading.local()
+        self._all = []  # Contadores de todas as threads
+        self._lock = threading.Lock()  # Usado apenas quando uma thread cria seus contadores
+
+    # Contadores da thread atual; "releases" só serve para detectar as esperas inúteis
+    def counts(self):
+        counts = getattr(self._local, "counts", None)
+        if counts is None:
+            counts = self._local.counts = dict.fromkeys(COUNTERS + ("releases",), 0)
+            with self._lock:
+                self._all.append(counts)
+        return counts
+
+    # Espera feita em várias tentativas que deve contar como um único bloqueio (ex.: o
+    # watchdog dos Filósofos espera um garfo em fatias): registra o bloqueio e troca
+    # os contadores da thread por uma cópia descartável até resume()
+    def pause(self):
+        counts = self.counts()
+        counts["blocked"] += 1
+        self._local.counts = dict(counts)
+        return counts
+
+    def resume(self, counts):
+        self._local.counts = counts
+
+    def totals(self):
+        totals = dict.fromkeys(COUNTERS, 0)
+        for counts in self._all:
+            for name in COUNTERS:
+                totals[name] += counts[name]
+        return totals
+
+class CountingLock:
+    def __init__(self, counters, lock=None):
+        self.counters = counters
+        self.lock = lock if lock is not None else threading.Lock()
+
+    def acquire(self, blocking=True, timeout=-1):
+        counts = self.counters.counts()
+        counts["acquires"] += 1
+        if self.lock.acquire(False):
+            return True
+        if not blocking:
+            return False
+        counts["blocked"] += 1
+        return self.lock.acquire(True, timeout)
+
+    def release(self):
+        self.counters.counts()["releases"] += 1
+        self.lock.release()
+
+    def locked(self):
+        return self.lock.locked()
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, *exc):
+        self.release()
+
+class CountingSemaphore:
+    def __init__(self, counters, value=1, base=threading):
+        self.counters = counters
+        self.semaphore = base.Semaphore(value)
+
+    def acquire(self, blocking=True, timeout=None):
+        counts = self.counters.counts()
+        counts["acquires"] += 1
+        if self.semaphore.acquire(False):
+            return True
+        if not blocking:
+            return False
+        counts["blocked"] += 1
+        return self.semaphore.acquire(True, timeout)
+
+    def release(self, n=1):
+        self.counters.counts()["releases"] += 1
+        self.semaphore.release(n)
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, *exc):
+        self.release()
+
+class CountingCondition:
+    def __init__(self, counters, lock=None, base=threading):
+        self.counters = counters
+        # Compartilha o lock real quando recebe um CountingLock (ex.: not_full e not_empty)
+        if isinstance(lock, CountingLock):
+            lock = lock.lock
+        self.lock = CountingLock(counters, lock if lock is not None else base.RLock())
+        self.condition = base.Condition(self.lock.lock)
+        self.monotonic = getattr(base, "monotonic", time.monotonic)  # Relógio dos timeouts
+        self._local = threading.local()  # Quando a thread atual acordou pela última vez
+
+    def acquire(self, blocking=True, timeout=-1):
+        return self.lock.acquire(blocking, timeout)
+
+    def release(self):
+        self.lock.release()
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, *exc):
+        self.release()
+
+    def wait(self, timeout=None):
+        counts = self.counters.counts()
+        counts["waits"] += 1
+        # Acordou e voltou a esperar sem liberar nenhuma primitiva: o predicado continuou falso
+        if getattr(self._local, "woken_at", None) == counts["releases"]:
+            counts["futile_wakeups"] += 1
+        result = self.condition.wait(timeout)
+        self._local.woken_at = counts["releases"]
+        return result
+
+    def wait_for(self, predicate, timeout=None):
+        # Mesmo laço do threading.Condition.wait_for, passando pelo wait() contado
+        endtime = None
+        waittime = timeout
+        result = predicate()
+        while not result:
+            if waittime is not None:
+                if endtime is None:
+                    endtime = self.monotonic() + waittime
+                else:
+                    waittime = endtime - self.monotonic()
+                    if waittime <= 0:
+                        break
+            self.wait(waittime)
+            result = predicate()
+        return result
+
+    def notify(self, n=1):
+        self.condition.notify(n)
+
+    def notify_all(self):
+        self.condition.notify_all()
+
+# Fábrica de primitivas contadas, com a interface do módulo threading. "base" é a
+# fábrica das primitivas reais: o módulo threading ou o escalonador do relógio virtual
+class CountingSync:
+    def __init__(self, base=threading):
+        self.base = base
+        self.counters = ThreadCounters()
+        self.created = 0  # Primitivas criadas pelo mecanismo
+
+    def Lock(self):
+        self.created += 1
+        return CountingLock(self.counters, self.base.Lock())
+
+    def Semaphore(self, value=1):
+        self.created += 1
+        return CountingSemaphore(self.counters, value, self.base)
+
+    def Condition(self, lock=None):
+        self.created += 1
+        return CountingCondition(self.counters, lock, self.base)
+
+    # Conta um lock criado fora da fábrica (ex.: o spinlock adaptativo)
+    def wrap(self, lock):
+        self.created += 1
+        return CountingLock(self.counters, lock)
+
+    # Totais da execução, prontos para o metricas.csv (ex.: "sync.futile_wakeups").
+    # Mecanismos que não usam context.sync (asyncio, processos, queue.Queue) não
+    # têm o que contar e ficam sem as métricas, em vez de com zeros
+    def summary(self):
+        if not self.created:
+            return {}
+        return {f"sync.{name}": value for name, value in self.counters.totals().items()}
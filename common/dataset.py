@@ -0,0 +1,15 @@
+# Formato dos arquivos gerados pelo runner. O dataset.csv tem uma coluna por
+# mecanismo com o tempo de cada execução; o metricas.csv tem uma linha por
+# métrica, o que permite acrescentar métricas novas sem mudar as colunas.
+# "Configuração" identifica o ponto da varredura de parâmetros (ex.: "readers=5 writers=2").
+DATASET_PREFIX = ["Execução", "Configuração"]
+METRICS_HEADER = ["Execução", "Configuração", "Mecanismo", "Métrica", "Valor"]
+# resumo.csv: média, desvio padrão e meia-largura do IC de 95% de cada mecanismo por configuração
+SUMMARY_HEADER = ["Configuração", "Mecanismo", "Execuções", "Média (s)", "Desvio padrão (s)", "IC 95% (±s)"]
+
+def format_configuration(params):
+    return " ".join(f"{name}={value}" for name, value in params.items())
+
+def write_metrics(writer, execution, configuration, mechanism, metrics):
+    for name, value in metrics.items():
+        writer.writerow([execution, configuration, mechanism, name, value])
@@ -0,0 +1,44 @@
+import itertools
+import sys
+
+# Registro de eventos dos mecanismos ("Filósofo 3 está comendo", ...).
+# Modos:
+#   "print"  imprime na hora, como as versões originais (custo de E/S dentro da região medida)
+#   "buffer" guarda (modelo, argumentos) em um anel pré-alocado e só formata/imprime em flush(),
+#            chamado pelo runner fora da região medida
+#   "off"    descarta os eventos
+LOG_MODES = ("print", "buffer", "off")
+
+class EventLog:
+    def __init__(self, mode="buffer", capacity=1 << 16):
+        if mode not in LOG_MODES:
+            raise ValueError(f"Modo de log desconhecido: {mode!r} (opções: {', '.join(LOG_MODES)})")
+        self.mode = mode
+        self.capacity = capacity
+        self.slots = [None] * capacity if mode == "buffer" else []
+        self._counter = itertools.count()  # next() é atômico no CPython: não precisa de lock
+        # O método de registro é escolhido uma vez, evitando testar o modo a cada evento
+        self.log = {"print": self._print, "buffer": self._buffer, "off": self._discard}[mode]
+
+    def _print(self, template, *args):
+        print(template.format(*args))
+
+    def _buffer(self, template, *args):
+        self.slots[next(self._counter) % self.capacity] = (template, args)
+
+    def _discard(self, template, *args):
+        pass
+
+    # Formata e escreve os eventos guardados, do mais antigo ao mais recente, e esvazia o anel
+    def flush(self, stream=None):
+        if self.mode != "buffer":
+            return
+        stream = stream or sys.stdout
+        total = next(self._counter)
+        self._counter = itertools.count()
+        if total > self.capacity:
+            stream.write(f"... {total - self.capacity} eventos mais antigos descartados\n")
+        first = max(0, total - self.capacity)
+        stream.write("".join(f"{template.format(*args)}\n"
+                             for template, args in (self.slots[i % self.capacity] for i in range(first, total))))
+        self.slots = [None] * self.capacity
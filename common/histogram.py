@@ -0,0 +1,104 @@
+import threading
+
+# Histograma de latências com baldes logarítmicos (no estilo do HdrHistogram).
+# Cada potência de 2 é dividida em SUB_BUCKETS baldes lineares, então o erro
+# relativo de qualquer percentil fica abaixo de 1 / SUB_BUCKETS (6,25%) e o
+# registro de uma amostra custa apenas algumas operações inteiras.
+SUB_BUCKET_BITS = 4
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+NUM_BUCKETS = SUB_BUCKETS * 64  # Suficiente para qualquer inteiro de 64 bits
+
+# Percentis exportados para o dataset
+PERCENTILES = [("p50", 50), ("p90", 90), ("p99", 99), ("p99.9", 99.9)]
+
+# Índice do balde de um valor (em nanossegundos)
+def bucket_index(value):
+    if value < 2 * SUB_BUCKETS:  # Valores pequenos têm um balde exato cada
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS - 1
+    return SUB_BUCKETS * shift + (value >> shift)
+
+# Menor e maior valor representados por um balde
+def bucket_bounds(index):
+    if index < 2 * SUB_BUCKETS:
+        return index, index
+    shift = index // SUB_BUCKETS - 1
+    mantissa = index - SUB_BUCKETS * shift
+    return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+class LatencyHistogram:
+    def __init__(self):
+        self.counts = [0] * NUM_BUCKETS  # Pré-alocado: registrar nunca aloca memória
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, value):
+        if value < 0:
+            value = 0
+        self.counts[bucket_index(value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    # Soma as amostras de outro histograma a este
+    def merge(self, other):
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    # Valor do percentil p (0-100): ponto médio do balde onde ele cai, limitado ao máximo observado
+    def percentile(self, p):
+        if self.count == 0:
+            return 0
+        rank = max(1, -(-self.count * p // 100))  # Arredonda para cima
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                low, high = bucket_bounds(index)
+                return min((low + high) // 2, self.max)
+        return self.max
+
+# Registra o tempo de espera de cada operação (ex.: "produce", "forks", "write").
+# Cada thread escreve em histogramas próprios, sem lock no caminho de registro;
+# os histogramas só são combinados ao final, fora da região medida.
+class WaitRecorder:
+    def __init__(self):
+        self._local = threading.local()
+        self._histograms = []  # Pares (operação, histograma) de todas as threads
+        self._lock = threading.Lock()  # Usado apenas quando uma thread cria um histograma novo
+
+    def record(self, operation, wait_ns):
+        histograms = getattr(self._local, "histograms", None)
+        if histograms is None:
+            histograms = self._local.histograms = {}
+        histogram = histograms.get(operation)
+        if histogram is None:
+            histogram = histograms[operation] = LatencyHistogram()
+            with self._lock:
+                self._histograms.append((operation, histogram))
+        histogram.record(wait_ns)
+
+    # Histograma combinado de cada operação
+    def merged(self):
+        result = {}
+        for operation, histogram in self._histograms:
+            result.setdefault(operation, LatencyHistogram()).merge(histogram)
+        return result
+
+    # Percentis e máximo de cada operação, em microssegundos (ex.: "produce.p99_us")
+    def summary(self):
+        metrics = {}
+        for operation, histogram in self.merged().items():
+            for name, p in PERCENTILES:
+                metrics[f"{operation}.{name}_us"] = histogram.percentile(p) / 1000
+            metrics[f"{operation}.max_us"] = histogram.max / 1000
+        return metrics
@@ -0,0 +1,81 @@
+import os
+
+# pandas, numpy e matplotlib são importados só dentro das funções: o caminho de
+# medição (runner e processos do pool) nunca os carrega, apenas o relatório.
+
+COLORS = ['#87CEFA', '#2F4F4F', '#F4A460', '#4682B4', '#708090', '#D2691E', '#B0E0E6', '#696969', '#DEB887']
+
+# Carrega o pyplot sem interface gráfica (backend Agg), para rodar em servidores sem display
+def load_pyplot():
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
+# Gera o gráfico comparativo de um dataset.csv. Com uma única configuração é o
+# gráfico de barras original; com uma varredura, uma linha por mecanismo.
+def plot_dataset(dataset_path, output_dir, title):
+    import numpy as np
+    import pandas as pd
+    plt = load_pyplot()
+
+    data = pd.read_csv(dataset_path)
+    # Colunas sem nenhum tempo (ex.: threads no relógio virtual) ficam fora do gráfico
+    mechanisms = [column for column in data.columns
+                  if column not in ("Execução", "Configuração") and data[column].notna().any()]
+    if "Configuração" not in data.columns:  # Datasets antigos (ex.: pre-results) não têm varredura
+        data["Configuração"] = ""
+    configurations = list(dict.fromkeys(data["Configuração"]))
+    os.makedirs(output_dir, exist_ok=True)
+
+    plt.figure()
+    if len(configurations) == 1:
+        avg_times = data[mechanisms].mean()
+        error = 1.96 * data[mechanisms].std() / np.sqrt(len(data))
+        plt.bar(avg_times.index, avg_times.values, yerr=error, capsize=5, color=COLORS[:len(avg_times)])
+        plt.ylim(0, max(avg_times.values + error.fillna(0).values) * 1.2)
+        for i, (value, err) in enumerate(zip(avg_times.values, error.fillna(0).values)):
+            plt.text(i, value + err + 0.05, f"{value:.2f}s", ha='center', va='bottom')
+        plt.xlabel('Mecanismo de Exclusão Mútua')
+        if len(mechanisms) > 3:
+            plt.xticks(rotation=30, ha='right')
+    else:
+        grouped = data.groupby("Configuração", sort=False)[mechanisms]
+        avg_times = grouped.mean().loc[configurations]
+        error = (1.96 * grouped.std() / np.sqrt(grouped.count())).loc[configurations]
+        for column, color in zip(mechanisms, COLORS * (len(mechanisms) // len(COLORS) + 1)):
+            plt.errorbar(range(len(configurations)), avg_times[column].values, yerr=error[column].values,
+                         marker="o", capsize=3, label=column, color=color)
+        plt.xticks(range(len(configurations)), configurations, rotation=30, ha='right', fontsize=7)
+        plt.xlabel('Configuração')
+        plt.legend(fontsize=7)
+    plt.ylabel('Tempo Médio de Execução (s)')
+    plt.title(f'Comparação de Tempos Médios: {title}')
+    plt.tight_layout()
+    plt.savefig(os.path.join(output_dir, "comparison_average.png"))
+    plt.close()
+
+# Média e IC de 95% de cada mecanismo por configuração, como linhas de texto
+def summarize_dataset(dataset_path):
+    import numpy as np
+    import pandas as pd
+
+    data = pd.read_csv(dataset_path)
+    if "Configuração" not in data.columns:
+        data["Configuração"] = ""
+    mechanisms = [column for column in data.columns if column not in ("Execução", "Configuração")]
+    grouped = data.groupby("Configuração", sort=False)[mechanisms]
+    means, counts = grouped.mean(), grouped.count()
+    errors = 1.96 * grouped.std() / np.sqrt(counts)
+    lines = []
+    for configuration in means.index:
+        if configuration:
+            lines.append(configuration)
+        for mechanism in mechanisms:
+            count = counts.loc[configuration, mechanism]
+            if count == 0:
+                continue  # Mecanismo não executado nesta configuração
+            # Com uma só execução não há desvio padrão nem intervalo
+            error = f"{errors.loc[configuration, mechanism]:.3f}s" if count > 1 else "-"
+            lines.append(f"  {mechanism}: {means.loc[configuration, mechanism]:.3f}s ± {error} ({count} execuções)")
+    return lines
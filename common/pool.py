@@ -0,0 +1,87 @@
+import threading
+import time
+
+# Pool de threads persistentes para as versões com threads. Sem o pool, cada
+# repetição cria e junta threads novas; com ele (runner em --pool), as mesmas
+# threads atendem todas as repetições e mecanismos do processo, como em um
+# serviço de vida longa. Cada rodada entrega uma tarefa a cada thread e usa
+# duas barreiras: uma libera todas as tarefas juntas (início da medida) e a
+# outra espera que todas terminem (fim da medida).
+#
+# O custo de criar as threads (setup) fica fora da rodada e é contado à parte:
+# só existe na primeira rodada ou quando a quantidade de threads muda.
+
+class WorkerPool:
+    def __init__(self):
+        self.size = 0
+        self.threads = []
+        self.tasks = []
+        self.errors = []
+        self.setup_s = 0.0  # Tempo gasto criando threads desde a última rodada
+
+    # Ajusta o pool para "size" threads, recriando-as se a quantidade mudou
+    def resize(self, size):
+        if size == self.size:
+            return
+        start = time.perf_counter()
+        self.shutdown()
+        self.size = size
+        self.start_barrier = threading.Barrier(size + 1)
+        self.done_barrier = threading.Barrier(size + 1)
+        self.threads = [threading.Thread(target=self.work, args=(i,), name=f"Trabalhador {i}", daemon=True)
+                        for i in range(size)]
+        for t in self.threads:
+            t.start()
+        self.setup_s += time.perf_counter() - start
+
+    def work(self, index):
+        while True:
+            self.start_barrier.wait()
+            task, name = self.tasks[index]
+            if task is None:  # Pedido de encerramento
+                return
+            if name:
+                threading.current_thread().name = name  # Ex.: "Filósofo 3", usado pelo watchdog
+            try:
+                task()
+            except BaseException as error:
+                self.errors.append(error)
+            self.done_barrier.wait()
+
+    # Executa uma rodada com uma tarefa por thread e devolve a duração (s),
+    # medida da liberação das tarefas até a última terminar
+    def run(self, tasks, names=None):
+        self.resize(len(tasks))
+        self.tasks = list(zip(tasks, names or [None] * len(tasks)))
+        self.errors = []
+        self.start_barrier.wait()
+        start_time = time.perf_counter()
+        self.done_barrier.wait()
+        elapsed = time.perf_counter() - start_time
+        if self.errors:
+            raise self.errors[0]
+        return elapsed
+
+    # Custo de criação de threads acumulado desde a última chamada (zero no regime estável)
+    def take_setup(self):
+        setup, self.setup_s = self.setup_s, 0.0
+        return setup
+
+    def shutdown(self):
+        if not self.threads:
+            return
+        self.tasks = [(None, None)] * self.size
+        self.start_barrier.wait()
+        for t in self.threads:
+            t.join()
+        self.threads = []
+        self.size = 0
+
+_shared = None
+
+# Pool compartilhado do processo, criado na primeira utilização
+def shared_pool():
+    global _shared
+    if _shared is None:
+        _shared = WorkerPool()
+    return _shared
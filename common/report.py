@@ -0,0 +1,45 @@
+import argparse
+import os
+
+from common.plotting import plot_dataset, summarize_dataset
+from common.runner import PROBLEMS, ROOT_DIR
+
+# Etapa de relatório, separada da medição: lê o dataset/dataset.csv de cada
+# problema em um ou mais diretórios de resultados (raiz do repositório,
+# results/<tag>, pre-results...) e gera os gráficos em graficos/, sem display.
+
+# Título do gráfico a partir do diretório do problema (ex.: "Dining-Philosophers")
+def problem_title(directory):
+    return directory[:-len("-Problem")] if directory.endswith("-Problem") else directory
+
+# Gera os gráficos e o resumo de todos os problemas encontrados em "base"
+def render_report(base, problems=None):
+    rendered = []
+    for name, directory in PROBLEMS.items():
+        if problems and name not in problems:
+            continue
+        dataset_path = os.path.join(base, directory, "dataset", "dataset.csv")
+        if not os.path.exists(dataset_path):
+            continue
+        output_dir = os.path.join(base, directory, "graficos")
+        plot_dataset(dataset_path, output_dir, problem_title(directory))
+        print(f"[{name}] {os.path.join(output_dir, 'comparison_average.png')}")
+        for line in summarize_dataset(dataset_path):
+            print(f"[{name}] {line}")
+        rendered.append(output_dir)
+    return rendered
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera os gráficos dos benchmarks a partir dos datasets gravados.")
+    parser.add_argument("bases", nargs="*", metavar="DIRETÓRIO",
+                        help="Diretórios de resultados (padrão: raiz do repositório)")
+    parser.add_argument("--tag", help="Usa results/<tag>/ como diretório de resultados")
+    parser.add_argument("--problem", nargs="+", choices=list(PROBLEMS), help="Problemas a incluir (padrão: todos)")
+    args = parser.parse_args(argv)
+
+    bases = list(args.bases)
+    if args.tag:
+        bases.append(os.path.join(ROOT_DIR, "results", args.tag))
+    for base in bases or [ROOT_DIR]:
+        if not render_report(base, args.problem):
+            print(f"Nenhum dataset encontrado em {base}")
@@ -0,0 +1,482 @@
+import argparse
+import csv
+import importlib.util
+import json
+import os
+import platform
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from itertools import product
+
+from common.clock import CLOCKS, make_clock, supports_virtual
+from common.context import RunContext
+from common.counting import CountingSync
+from common.dataset import DATASET_PREFIX, METRICS_HEADER, SUMMARY_HEADER, format_configuration, write_metrics
+from common.eventlog import LOG_MODES, EventLog
+from common.workload import SeededWorkload, TraceWorkload, load_trace, save_trace
+from common.compute import WORK_MODES, calibrate, describe_gil, gil_status, make_work, supports_work
+from common.pool import shared_pool
+from common.stats import OnlineStats
+
+# Runner não interativo: escolhe problemas, mecanismos, repetições, aquecimento
+# e faixas de parâmetros pela linha de comando e executa a varredura inteira
+# sem intervenção, gravando os resultados (com metadados) em disco.
+#
+# Cada benchmark.py expõe:
+#   TITLE        nome do problema
+#   MECHANISMS   {chave: (rótulo da coluna, classe)}
+#   PARAMETERS   {parâmetro: valor padrão}
+#   MINIMUMS     {parâmetro: menor valor aceito} (opcional)
+#   run_once(mechanism_class, params, context) -> tempo de execução em segundos,
+#                ou None se a execução foi abortada (célula vazia no dataset)
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Problemas disponíveis e os diretórios onde ficam seus benchmarks
+PROBLEMS = {
+    "producer-consumer": "Producer-Consumer-Problem",
+    "dining-philosophers": "Dining-Philosophers-Problem",
+    "readers-writers": "Readers-Writers-Problem",
+}
+
+# Carrega o benchmark.py de um problema como módulo (os diretórios têm hífen,
+# então não podem ser importados com "import")
+def load_problem(name):
+    module_name = name.replace("-", "_") + "_benchmark"
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    path = os.path.join(ROOT_DIR, PROBLEMS[name], "benchmark.py")
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+# Converte os valores de um parâmetro. Além de valores soltos ("5 10 20"),
+# inteiros aceitam faixas "início:fim:passo" (ex.: "1:8:1") e faixas
+# geométricas "início:fim:*fator" (ex.: "5:2000:*2"); o fim é inclusivo.
+def parse_values(tokens, kind):
+    values = []
+    for token in tokens:
+        if kind is int and ":" in token:
+            start, stop, *step = token.split(":")
+            start, stop, step = int(start), int(stop), (step[0] if step else "1")
+            if step.startswith("*"):
+                factor = int(step[1:])
+                if factor < 2:
+                    raise argparse.ArgumentTypeError(f"Fator inválido em {token!r}")
+                value = start
+                while value <= stop:
+                    values.append(value)
+                    value *= factor
+            else:
+                values.extend(range(start, stop + 1, int(step)))
+        else:
+            values.append(kind(token))
+    return values
+
+def option_name(parameter):
+    return "--" + parameter.replace("_", "-")
+
+def build_parser(problems):
+    parser = argparse.ArgumentParser(description="Executa os benchmarks dos mecanismos de exclusão mútua.")
+    parser.add_argument("--problem", nargs="+", choices=list(PROBLEMS) + ["all"], default=["all"],
+                        help="Problemas a executar (padrão: todos)")
+    parser.add_argument("--mechanisms", nargs="+", default=["all"],
+                        help="Chaves dos mecanismos a comparar (padrão: todos os do problema)")
+    parser.add_argument("--repetitions", type=int, default=10,
+                        help="Execuções medidas por configuração (máximo, com --target-ci)")
+    parser.add_argument("--target-ci", type=float, metavar="LARGURA",
+                        help="Para as repetições de uma configuração quando o IC de 95%% da média de todos os "
+                             "mecanismos fica abaixo desta largura relativa (ex.: 0.05 = ±5%%)")
+    parser.add_argument("--min-repetitions", type=int, default=5,
+                        help="Execuções mínimas antes da parada antecipada (padrão: 5)")
+    parser.add_argument("--warmup", type=int, default=0, help="Execuções descartadas antes das medidas")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Repetições executadas em paralelo, cada uma em um processo novo (padrão: 1, em sequência)")
+    parser.add_argument("--tag", help="Identificador dos resultados; grava em results/<tag>/")
+    parser.add_argument("--output-dir", help="Diretório base dos resultados (padrão: raiz do repositório ou results/<tag>)")
+    parser.add_argument("--no-plot", action="store_true",
+                        help="Não gera os gráficos ao final (podem ser gerados depois com report.py)")
+    parser.add_argument("--log-mode", nargs="+", choices=LOG_MODES, default=["buffer"],
+                        help="Registro de eventos: print (original, dentro da medida), buffer (impresso após a medida) "
+                             "ou off; vários modos comparam a sobrecarga em log_overhead.csv")
+    parser.add_argument("--clock", nargs="+", choices=list(CLOCKS), default=["real"],
+                        help="Relógio dos testes, real ou virtual (simulação de eventos discretos das threads e "
+                             "das corrotinas, sem esperas reais). No virtual, processos e as filas da biblioteca "
+                             "padrão ficam vazios no dataset")
+    parser.add_argument("--seed", type=int,
+                        help="Semente do random; cada execução usa uma semente derivada desta, da configuração "
+                             "e da repetição (no relógio virtual, o padrão é 0)")
+    parser.add_argument("--workload", choices=["random", "paired"], default="random",
+                        help="random: cada mecanismo sorteia seus tempos (original); paired: o primeiro mecanismo "
+                             "de cada repetição grava um trace da carga e os demais repetem a mesma agenda")
+    parser.add_argument("--count-sync", action="store_true",
+                        help="Conta aquisições, bloqueios, waits e despertares inúteis das primitivas das versões "
+                             "com threads (sync.* em metricas.csv)")
+    parser.add_argument("--pool", action="store_true",
+                        help="Reaproveita um pool de threads persistentes entre repetições e mecanismos; o custo de "
+                             "criar as threads é gravado à parte (pool.setup_s em metricas.csv)")
+    parser.add_argument("--work", choices=WORK_MODES, default="sleep",
+                        help="Fases de pensar/comer/ler/escrever/produzir/consumir das versões com threads e processos: "
+                             "sleep (original) ou computação real (python, hashlib, numpy); nos modos com "
+                             "computação, as versões com asyncio ficam vazias no dataset")
+    parser.add_argument("--work-scale", type=float, default=1.0,
+                        help="Multiplica a quantidade de computação de cada fase nos modos de --work (padrão: 1.0)")
+    parser.add_argument("--replay-trace", metavar="ARQUIVO",
+                        help="Repete em todas as execuções um trace gravado anteriormente (dataset/traces/)")
+
+    # Um argumento por parâmetro de cada problema, aceitando vários valores para a varredura
+    group = parser.add_argument_group("parâmetros (vários valores geram uma varredura)")
+    for name in problems:
+        for parameter, default in load_problem(name).PARAMETERS.items():
+            group.add_argument(option_name(parameter), dest=parameter, nargs="+", metavar="VALOR",
+                               help=f"{name} (padrão: {default})")
+    return parser
+
+# Produto cartesiano dos valores de cada parâmetro do problema, dos modos de log e dos relógios
+def configurations(module, args):
+    names = list(module.PARAMETERS) + ["log", "clock"]
+    choices = []
+    for name, default in module.PARAMETERS.items():
+        tokens = getattr(args, name)
+        choices.append(parse_values(tokens, type(default)) if tokens else [default])
+    choices.append(args.log_mode)
+    choices.append(args.clock)
+    return [dict(zip(names, values)) for values in product(*choices)]
+
+# Confere todos os valores da varredura de um problema antes de executar qualquer
+# configuração; devolve a mensagem de erro ou None
+def invalid_parameters(module, args):
+    try:
+        configs = configurations(module, args)
+    except (ValueError, argparse.ArgumentTypeError) as error:
+        return str(error)
+    for parameter, minimum in getattr(module, "MINIMUMS", {}).items():
+        below = sorted({params[parameter] for params in configs if params[parameter] < minimum})
+        if below:
+            return (f"{option_name(parameter)} precisa ser pelo menos {minimum} "
+                    f"(recebido: {', '.join(str(value) for value in below)})")
+    return None
+
+def select_mechanisms(module, keys):
+    if keys == ["all"]:
+        return dict(module.MECHANISMS)
+    return {key: module.MECHANISMS[key] for key in keys if key in module.MECHANISMS}
+
+def output_base(args):
+    if args.output_dir:
+        return args.output_dir
+    if args.tag:
+        return os.path.join(ROOT_DIR, "results", args.tag)
+    return ROOT_DIR
+
+def write_metadata(path, name, args, mechanisms, configs, started, executed):
+    metadata = {
+        "problem": name,
+        "tag": args.tag,
+        "started": started,
+        "finished": datetime.now().isoformat(timespec="seconds"),
+        "command": sys.argv,
+        "repetitions": args.repetitions,
+        "warmup": args.warmup,
+        "target_ci": args.target_ci,
+        "executed": executed,
+        "jobs": args.jobs,
+        "count_sync": args.count_sync,
+        "pool": args.pool,
+        "work": args.work,
+        "work_scale": args.work_scale,
+        "work_rate": args.work_rate,
+        "gil": gil_status(),
+        "seed": args.seed,
+        "workload": "trace " + args.replay_trace if args.replay_trace else args.workload,
+        "mechanisms": {key: label for key, (label, _) in mechanisms.items()},
+        "configurations": configs,
+        "python": sys.version,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+    with open(path, "w") as file:
+        json.dump(metadata, file, indent=2, ensure_ascii=False)
+
+# Semente de uma execução: todos os mecanismos da mesma repetição recebem os mesmos
+# sorteios, e a mesma semente base reproduz a varredura (exatamente, no relógio virtual).
+# "configuration" não inclui o modo de log, para que todos os modos repitam os mesmos sorteios
+def seed_run(args, params, configuration, execution):
+    seed = args.seed if args.seed is not None else (0 if params["clock"] == "virtual" else None)
+    if seed is not None:
+        random.seed(f"{seed}:{configuration}:{execution}")
+
+# No relógio virtual, as primitivas e a fase de trabalho das threads vêm do escalonador do relógio
+def make_context(args, params, workload=None):
+    clock = make_clock(params["clock"])
+    threads = clock.threads
+    return RunContext(events=EventLog(params["log"]), clock=clock, workload=workload,
+                      sync=CountingSync(threads if threads is not None else threading) if args.count_sync else None,
+                      pool=shared_pool() if args.pool else None,
+                      work=make_work(args.work, args.work_rate, args.work_scale) if threads is None else None)
+
+# Carga de trabalho de uma execução: trace fixo (--replay-trace), trace gravado pelo
+# primeiro mecanismo da repetição (paired) ou o random global (None, original)
+def run_workload(args, replay, recorded, seed):
+    if replay is not None:
+        return TraceWorkload(replay.trace, replay.seed)
+    if args.workload != "paired":
+        return None
+    if recorded is None:
+        return SeededWorkload(seed)
+    return TraceWorkload(recorded, seed)
+
+def format_time(tempo):
+    return "-" if tempo is None else f"{tempo:.3f}s"
+
+def log_free(params):
+    return format_configuration({name: value for name, value in params.items() if name != "log"})
+
+# Compara o tempo de cada modo de log com o do modo em buffer (ou desligado, se buffer
+# não foi executado), mostrando quanto a impressão dentro da região medida distorce o resultado.
+# Os modos repetem a mesma carga em cada execução (mesma semente), então a comparação é
+# pareada: a sobrecarga é a média das diferenças execução a execução, com o IC de 95% dessa
+# média, ambos relativos ao tempo médio da referência nas mesmas execuções
+def write_log_overhead(path, times_by_mode, modes):
+    reference = "buffer" if "buffer" in modes else modes[-1]
+    with open(path, mode="w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["Configuração", "Mecanismo", "Modo de log", "Pares", "Tempo médio (s)",
+                         f"Sobrecarga vs {reference} (%)", "IC 95% (±%)"])
+        for (configuration, label, mode), times in times_by_mode.items():
+            reference_times = times_by_mode.get((configuration, label, reference), {})
+            executions = [execution for execution in times if execution in reference_times]
+            if not executions:
+                continue  # Todas as execuções de referência foram abortadas
+            differences, reference_stats = OnlineStats(), OnlineStats()
+            for execution in executions:
+                differences.push(times[execution] - reference_times[execution])
+                reference_stats.push(reference_times[execution])
+            mean = sum(times[execution] for execution in executions) / len(executions)
+            overhead = 100 * differences.mean / reference_stats.mean
+            halfwidth = 100 * differences.halfwidth() / reference_stats.mean if len(executions) > 1 else None
+            writer.writerow([configuration, label, mode, len(executions), mean, overhead,
+                             "" if halfwidth is None else halfwidth])
+            if mode != reference:
+                interval = "" if halfwidth is None else f" ± {halfwidth:.1f}%"
+                print(f"Log {mode} vs {reference} | {label} | {configuration}: {overhead:+.1f}%{interval} "
+                      f"({len(executions)} pares)")
+
+# No relógio virtual, só os mecanismos que o escalonador simula são executados; com computação
+# real (--work), só os com threads e processos, já que as corrotinas continuam dormindo
+def runnable_mechanisms(mechanisms, params, work="sleep"):
+    return {label: mechanism_class for label, mechanism_class in mechanisms.values()
+            if (params["clock"] != "virtual" or supports_virtual(mechanism_class))
+            and supports_work(mechanism_class, work)}
+
+def dataset_directory(name, args):
+    return os.path.join(output_base(args), PROBLEMS[name], "dataset")
+
+# Executa uma repetição de uma configuração com todos os mecanismos e devolve os tempos
+# (na ordem das colunas) e as métricas de cada mecanismo. Recebe só valores simples e
+# carrega o problema pelo caminho, para poder rodar em um processo novo do pool (--jobs).
+def run_repetition(name, args, params, config_index, execution, warmup=0):
+    module = load_problem(name)
+    mechanisms = select_mechanisms(module, args.mechanisms)
+    runnable = runnable_mechanisms(mechanisms, params, args.work)
+    configuration = log_free(params)  # Sem o modo de log: todos os modos recebem a mesma carga
+    replay = load_trace(args.replay_trace) if args.replay_trace else None
+    traces_dir = os.path.join(dataset_directory(name, args), "traces")
+
+    # Aquecimento: execuções completas cujos resultados são descartados
+    for _ in range(warmup):
+        for mechanism_class in runnable.values():
+            module.run_once(mechanism_class, params, make_context(args, params))
+
+    tempos = []
+    metrics = []  # (mecanismo, métricas) de cada mecanismo executado
+    recorded = None  # Trace gravado pelo primeiro mecanismo da repetição (paired)
+    workload_seed = f"{args.seed}:{configuration}:{execution}"
+    for label, _ in mechanisms.values():
+        if label not in runnable:
+            tempos.append(None)
+            continue
+        workload = run_workload(args, replay, recorded, workload_seed)
+        context = make_context(args, params, workload)
+        seed_run(args, params, configuration, execution)
+        tempos.append(module.run_once(runnable[label], params, context))
+        if isinstance(workload, SeededWorkload):
+            recorded = workload.trace()
+            save_trace(os.path.join(traces_dir, f"{config_index}-{execution}.trace"), workload_seed, recorded)
+        context.events.flush()  # Fora da região medida
+        metrics.append((label, context.metrics()))
+    return tempos, metrics
+
+# Resultados das repetições de uma configuração, em ordem, como pares (execução, resultado).
+# Com --jobs > 1, cada repetição roda em um interpretador novo do pool (um processo por
+# repetição, que faz o próprio aquecimento), com até "jobs" repetições em andamento; os
+# resultados são devolvidos na ordem original mesmo que terminem fora de ordem. Quem
+# consome pode parar a qualquer momento (parada antecipada): as repetições ainda não
+# iniciadas são canceladas.
+def repetition_results(name, args, params, config_index, pool):
+    if pool is None:
+        for execution in range(1, args.repetitions + 1):
+            yield execution, run_repetition(name, args, params, config_index, execution,
+                                            args.warmup if execution == 1 else 0)
+        return
+
+    futures = {}
+    try:
+        for execution in range(1, args.repetitions + 1):
+            for pending in range(execution + len(futures), min(execution + args.jobs, args.repetitions + 1)):
+                futures[pending] = pool.submit(run_repetition, name, args, params, config_index, pending, args.warmup)
+            yield execution, futures.pop(execution).result()
+    finally:
+        for future in futures.values():
+            future.cancel()
+
+# Parada antecipada (--target-ci): todos os mecanismos com tempos já têm o intervalo de
+# confiança de 95% da média mais estreito que a largura relativa pedida
+def converged(args, stats, execution):
+    if args.target_ci is None or execution < args.min_repetitions:
+        return False
+    return all(s.relative_halfwidth() <= args.target_ci for s in stats.values() if s.count > 0)
+
+# Resumo de cada configuração calculado durante a varredura (Welford), sem reler o dataset
+def write_summary_row(writer, configuration, label, stats):
+    writer.writerow([configuration, label, stats.count, stats.mean, stats.stddev(),
+                     stats.halfwidth() if stats.count > 1 else ""])
+
+# Executa todas as configurações de um problema e grava dataset.csv, metricas.csv, resumo.csv e metadata.json
+def run_problem(name, args):
+    module = load_problem(name)
+    mechanisms = select_mechanisms(module, args.mechanisms)
+    if not mechanisms:
+        print(f"[{name}] nenhum dos mecanismos pedidos existe neste problema, pulando.")
+        return None
+    configs = configurations(module, args)
+    labels = [label for label, _ in mechanisms.values()]
+
+    dataset_dir = dataset_directory(name, args)
+    os.makedirs(dataset_dir, exist_ok=True)
+    dataset_path = os.path.join(dataset_dir, "dataset.csv")
+    metrics_path = os.path.join(dataset_dir, "metricas.csv")
+    summary_path = os.path.join(dataset_dir, "resumo.csv")
+    started = datetime.now().isoformat(timespec="seconds")
+    times_by_mode = {}  # (configuração sem o log, mecanismo, modo de log) -> {execução: tempo}
+    executed = {}  # Configuração -> repetições executadas (menos que o máximo com parada antecipada)
+    if args.workload == "paired" and not args.replay_trace:
+        os.makedirs(os.path.join(dataset_dir, "traces"), exist_ok=True)
+
+    pool = ProcessPoolExecutor(max_workers=args.jobs, max_tasks_per_child=1) if args.jobs > 1 else None
+    try:
+        with open(dataset_path, mode="w", newline="") as file, \
+                open(metrics_path, mode="w", newline="") as metrics_file, \
+                open(summary_path, mode="w", newline="") as summary_file:
+            writer = csv.writer(file)
+            writer.writerow(DATASET_PREFIX + labels)
+            metrics_writer = csv.writer(metrics_file)
+            metrics_writer.writerow(METRICS_HEADER)
+            summary_writer = csv.writer(summary_file)
+            summary_writer.writerow(SUMMARY_HEADER)
+
+            for config_index, params in enumerate(configs, start=1):
+                configuration = format_configuration(params)
+                print(f"[{name}] configuração {config_index} de {len(configs)}: {configuration}")
+                if len(runnable_mechanisms(mechanisms, params)) < len(mechanisms):
+                    print(f"[{name}] relógio virtual: processos e filas da biblioteca padrão ficam vazios no dataset")
+                if len(runnable_mechanisms(mechanisms, params, args.work)) < len(runnable_mechanisms(mechanisms, params)):
+                    print(f"[{name}] --work {args.work}: mecanismos com asyncio ficam vazios no dataset")
+                stats = {label: OnlineStats() for label in labels}
+
+                results = repetition_results(name, args, params, config_index, pool)
+                for execution, (tempos, metrics) in results:
+                    for label, values in metrics:
+                        write_metrics(metrics_writer, execution, configuration, label, values)
+                    for label, tempo in zip(labels, tempos):
+                        if tempo is not None:
+                            stats[label].push(tempo)
+                            times_by_mode.setdefault((log_free(params), label, params["log"]), {})[execution] = tempo
+                    writer.writerow([execution, configuration] + tempos)
+                    # Garante que uma varredura interrompida preserve o que já foi medido
+                    file.flush()
+                    metrics_file.flush()
+                    print(f"[{name}] execução {execution} de {args.repetitions}: "
+                          + ", ".join(f"{label} {format_time(tempo)}" for label, tempo in zip(labels, tempos)))
+                    executed[configuration] = execution
+                    if converged(args, stats, execution):
+                        print(f"[{name}] intervalos de confiança abaixo de ±{100 * args.target_ci:g}% "
+                              f"após {execution} execuções, parando")
+                        results.close()  # Cancela as repetições ainda não iniciadas
+                        break
+
+                for label in labels:
+                    if stats[label].count == 0:
+                        continue  # Mecanismo não executado nesta configuração
+                    write_summary_row(summary_writer, configuration, label, stats[label])
+                    if stats[label].count > 1:
+                        print(f"[{name}] {label}: {stats[label].mean:.3f}s ± {stats[label].halfwidth():.3f}s "
+                              f"({stats[label].count} execuções)")
+                summary_file.flush()
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    write_metadata(os.path.join(dataset_dir, "metadata.json"), name, args, mechanisms, configs, started, executed)
+    if len(args.log_mode) > 1:
+        write_log_overhead(os.path.join(dataset_dir, "log_overhead.csv"), times_by_mode, args.log_mode)
+    return dataset_path
+
+# Ponto de entrada; os benchmark.py chamam com o próprio problema como padrão
+def main(argv=None, default_problem=None):
+    parser = build_parser(PROBLEMS)
+    if default_problem:
+        parser.set_defaults(problem=[default_problem])
+    args = parser.parse_args(argv)
+
+    problems = list(PROBLEMS) if "all" in args.problem else args.problem
+    known = {key for name in problems for key in load_problem(name).MECHANISMS}
+    unknown = [key for key in args.mechanisms if key != "all" and key not in known]
+    if unknown:
+        parser.error(f"mecanismos desconhecidos: {', '.join(unknown)} (opções: {', '.join(sorted(known))})")
+
+    for name in problems:
+        error = invalid_parameters(load_problem(name), args)
+        if error:
+            parser.error(f"{name}: {error}")
+
+    # Vários modos de log e a carga pareada só são comparáveis se repetirem a mesma
+    # carga: sem --seed, sorteia uma semente nova para a varredura (gravada em
+    # metadata.json), em vez de repetir sempre a mesma agenda
+    if args.seed is None and (len(args.log_mode) > 1 or args.workload == "paired"):
+        args.seed = random.SystemRandom().randrange(2 ** 32)
+        print(f"Semente da varredura: {args.seed}")
+
+    # O relógio virtual só simula o tempo das fases: computação real não avançaria o relógio
+    if args.work != "sleep" and "virtual" in args.clock:
+        parser.error(f"--work {args.work} não pode ser usado com --clock virtual")
+
+    print(f"Interpretador: Python {platform.python_version()}, {describe_gil(gil_status())}")
+
+    # A taxa da computação é medida uma única vez, aqui, e enviada aos processos do --jobs
+    args.work_rate = None
+    if args.work != "sleep":
+        try:
+            args.work_rate = calibrate(args.work)
+        except ImportError:
+            parser.error(f"--work {args.work} requer o pacote {args.work}, que não está instalado")
+        print(f"Trabalho: {args.work}, {args.work_rate:.0f} unidades/s por thread (escala {args.work_scale})")
+
+    start = time.perf_counter()
+    for name in problems:
+        path = run_problem(name, args)
+        if path:
+            print(f"[{name}] resultados gravados em {path}")
+    print(f"Varredura concluída em {time.perf_counter() - start:.1f}s")
+
+    # Os gráficos ficam fora do caminho de medição: pandas e matplotlib só são
+    # carregados aqui, depois de todas as medidas, pela mesma etapa do report.py
+    if not args.no_plot:
+        from common.report import render_report
+        render_report(output_base(args), problems)
@@ -0,0 +1,274 @@
+import collections
+import heapq
+import threading
+
+# Escalonador de eventos discretos para as versões com threads no relógio
+# virtual. Cada participante continua sendo uma thread de verdade, mas só uma
+# roda por vez: a thread atual executa até bloquear (em uma primitiva, em um
+# sleep ou ao terminar) e então passa a vez para a próxima pronta. Quando
+# nenhuma está pronta, o tempo avança direto para o próximo timer, como o
+# VirtualTimeLoop faz com as tarefas do asyncio. Nada espera de verdade e, como
+# a ordem de escalonamento só depende das operações dos participantes, a mesma
+# semente produz sempre os mesmos resultados.
+#
+# As primitivas (Lock, Semaphore e Condition) têm a interface do módulo
+# threading e avisam o escalonador quando uma thread bloqueia. Elas acordam os
+# bloqueados em ordem de chegada e entregam o lock ou a unidade do semáforo
+# diretamente a quem acordou, então o resultado não depende de qual thread o SO
+# escolheria. Primitivas que bloqueiam por fora do escalonador (queue.Queue,
+# queue.SimpleQueue, processos) não podem ser simuladas: ver supports_virtual.
+#
+# Se todas as threads vivas ficarem bloqueadas sem nenhum timer pendente, a
+# execução está em deadlock: cada uma é acordada com VirtualDeadlock.
+
+class VirtualDeadlock(RuntimeError):
+    pass
+
+# Estado de uma thread para o escalonador
+class VirtualTask:
+    def __init__(self, target, name):
+        self.target = target
+        self.name = name
+        self.go = threading.Semaphore(0)  # Liberado quando é a vez desta thread
+        self.timer = None  # Número do timer armado (None: sem timer)
+        self.waiters = None  # Fila da primitiva em que está bloqueada
+        self.timed_out = False
+
+class VirtualScheduler:
+    def __init__(self):
+        self.now = 0.0  # Tempo simulado em segundos
+        self.ready = collections.deque()  # Threads prontas, em ordem de chegada
+        self.timers = []  # Heap de (instante, número, tarefa)
+        self.sequence = 0  # Desempata timers do mesmo instante pela ordem de criação
+        self.tasks = []
+        self.current = None  # Thread que está rodando
+        self.running = False
+        self.deadlock = False
+
+    def now_ns(self):
+        return int(self.now * 1e9)
+
+    def monotonic(self):
+        return self.now
+
+    # Executa as tarefas como threads escalonadas por este objeto e devolve o tempo
+    # simulado da rodada, como WorkerPool.run; a primeira exceção é relançada
+    def run(self, tasks, names=None):
+        self.tasks = [VirtualTask(target, name) for target, name in zip(tasks, names or [None] * len(tasks))]
+        self.ready.extend(self.tasks)
+        self.deadlock = False
+        errors = []
+        threads = [threading.Thread(target=self.bootstrap, args=(task, errors), name=task.name)
+                   for task in self.tasks]
+        for t in threads:
+            t.start()
+        start_time = self.now
+        self.running = True
+        try:
+            self.switch_to(self.ready.popleft())
+            for t in threads:
+                t.join()
+        finally:
+            self.running = False
+        if errors:
+            raise errors[0]
+        return self.now - start_time
+
+    def bootstrap(self, task, errors):
+        task.go.acquire()
+        try:
+            task.target()
+        except Exception as error:
+            errors.append(error)
+        finally:
+            self.tasks.remove(task)
+            following = self.next_task()
+            if following is not None:
+                self.switch_to(following)
+
+    def switch_to(self, task):
+        self.current = task
+        task.go.release()
+
+    # Próxima thread a rodar, avançando o tempo até o próximo timer se nenhuma estiver pronta
+    def next_task(self):
+        while not self.ready:
+            if not self.timers:
+                if not self.tasks:
+                    return None  # Todas terminaram
+                self.abort_blocked()
+                continue
+            when, number, task = heapq.heappop(self.timers)
+            if task.timer != number:
+                continue  # Timer cancelado: a thread já foi acordada
+            self.now = max(self.now, when)
+            if task.waiters is not None:
+                task.waiters.remove(task)
+                task.timed_out = True
+            self.wake(task)
+        return self.ready.popleft()
+
+    # Deadlock: todas as threads vivas estão bloqueadas sem timer; acorda cada uma com erro
+    def abort_blocked(self):
+        self.deadlock = True
+        for task in self.tasks:
+            if task.waiters is not None:
+                task.waiters.remove(task)
+            self.wake(task)
+
+    def wake(self, task):
+        task.timer = None
+        task.waiters = None
+        self.ready.append(task)
+
+    # Bloqueia a thread atual na fila "waiters" (None: só no timer) por até "timeout"
+    # segundos. Devolve False se o tempo acabou antes de alguém acordá-la
+    def block(self, waiters, timeout=None):
+        if self.deadlock:
+            raise VirtualDeadlock("deadlock: todas as threads ficaram bloqueadas")
+        task = self.current
+        task.timed_out = False
+        if waiters is not None:
+            task.waiters = waiters
+            waiters.append(task)
+        if timeout is not None:
+            self.sequence += 1
+            task.timer = self.sequence
+            heapq.heappush(self.timers, (self.now + max(timeout, 0), self.sequence, task))
+        following = self.next_task()
+        if following is not task:
+            self.switch_to(following)
+            task.go.acquire()
+        if self.deadlock:
+            raise VirtualDeadlock("deadlock: todas as threads ficaram bloqueadas")
+        return not task.timed_out
+
+    # Fase de trabalho no relógio virtual (context.work): avança o tempo sem esperar
+    def sleep(self, seconds):
+        self.block(None, seconds)
+
+    def Lock(self):
+        return VirtualLock(self)
+
+    # Os mecanismos nunca adquirem o mesmo lock duas vezes, então o lock padrão das
+    # condições (um RLock no threading) pode ser um lock comum
+    def RLock(self):
+        return VirtualLock(self)
+
+    def Semaphore(self, value=1):
+        return VirtualSemaphore(self, value)
+
+    def Condition(self, lock=None):
+        return VirtualCondition(self, lock)
+
+# Converte o timeout do threading (-1 ou None: sem limite) para o do escalonador
+def block_timeout(timeout):
+    return None if timeout is None or timeout < 0 else timeout
+
+class VirtualLock:
+    def __init__(self, scheduler):
+        self.scheduler = scheduler
+        self.held = False
+        self.waiters = collections.deque()
+
+    def acquire(self, blocking=True, timeout=-1):
+        if not self.held:
+            self.held = True
+            return True
+        if not blocking:
+            return False
+        return self.scheduler.block(self.waiters, block_timeout(timeout))
+
+    # Como o threading.Lock, pode ser liberado por outra thread (ex.: o write_lock
+    # dos Leitores-Escritores); o lock passa direto para o primeiro da fila
+    def release(self):
+        if not self.held:
+            if self.scheduler.deadlock:
+                return  # Thread abortada saindo de um "with" cujo lock não conseguiu readquirir
+            raise RuntimeError("release de um lock que não está adquirido")
+        if self.waiters:
+            self.scheduler.wake(self.waiters.popleft())
+        else:
+            self.held = False
+
+    def locked(self):
+        return self.held
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, *exc):
+        self.release()
+
+class VirtualSemaphore:
+    def __init__(self, scheduler, value=1):
+        self.scheduler = scheduler
+        self.value = value
+        self.waiters = collections.deque()
+
+    def acquire(self, blocking=True, timeout=None):
+        if self.value > 0:
+            self.value -= 1
+            return True
+        if not blocking:
+            return False
+        return self.scheduler.block(self.waiters, block_timeout(timeout))
+
+    def release(self, n=1):
+        for _ in range(n):
+            if self.waiters:
+                self.scheduler.wake(self.waiters.popleft())
+            else:
+                self.value += 1
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, *exc):
+        self.release()
+
+class VirtualCondition:
+    def __init__(self, scheduler, lock=None):
+        self.scheduler = scheduler
+        self.lock = lock if lock is not None else VirtualLock(scheduler)
+        self.waiters = collections.deque()
+
+    def acquire(self, blocking=True, timeout=-1):
+        return self.lock.acquire(blocking, timeout)
+
+    def release(self):
+        self.lock.release()
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, *exc):
+        self.release()
+
+    def wait(self, timeout=None):
+        self.lock.release()
+        try:
+            return self.scheduler.block(self.waiters, block_timeout(timeout))
+        finally:
+            if not self.scheduler.deadlock:
+                self.lock.acquire()
+
+    def wait_for(self, predicate, timeout=None):
+        endtime = None if timeout is None else self.scheduler.now + timeout
+        result = predicate()
+        while not result:
+            waittime = None
+            if endtime is not None:
+                waittime = endtime - self.scheduler.now
+                if waittime <= 0:
+                    break
+            self.wait(waittime)
+            result = predicate()
+        return result
+
+    def notify(self, n=1):
+        for _ in range(min(n, len(self.waiters))):
+            self.scheduler.wake(self.waiters.popleft())
+
+    def notify_all(self):
+        self.notify(len(self.waiters))
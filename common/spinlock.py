@@ -0,0 +1,83 @@
+import threading
+import time
+
+# Lock que tenta adquirir sem bloquear algumas vezes antes de dormir (spin-then-block),
+# como o mutex adaptativo da glibc. Em seções críticas muito curtas (ex.: atualizar
+# read_count), o dono costuma liberar o lock em poucos microssegundos; insistir um
+# pouco evita a ida e volta de dormir no lock e ser acordado pelo SO.
+#
+# O orçamento de espera se adapta: cada liberação atualiza uma média móvel
+# exponencial do tempo em que o lock ficou preso. Quem encontra o lock ocupado
+# insiste por até duas vezes essa média (no máximo MAX_SPINS tentativas); se a
+# média passa de SPIN_LIMIT_NS (ex.: um garfo preso durante a refeição),
+# insistir não compensa e a thread bloqueia direto.
+#
+# Cada tentativa cede o GIL com time.sleep(0), senão o dono do lock não
+# conseguiria rodar para liberá-lo. O lock interno é sempre comum: com
+# --count-sync, make_spinlock embrulha o spinlock inteiro em um lock contado, que
+# conta uma vez cada aquisição lógica, como nos Locks (as tentativas não contam).
+# No relógio virtual só uma thread roda por vez e o dono nunca libera o lock
+# durante o giro: o spinlock sempre acaba bloqueando no lock interno.
+
+MAX_SPINS = 100  # Tentativas sem bloquear antes de dormir no lock
+SPIN_LIMIT_NS = 50_000  # Acima deste tempo médio de posse, não vale a pena insistir
+
+class AdaptiveSpinLock:
+    def __init__(self, lock=None, max_spins=MAX_SPINS):
+        self.lock = lock if lock is not None else threading.Lock()
+        self.max_spins = max_spins
+        self.hold_ns = 0  # Média móvel do tempo de posse (atualizada por quem tem o lock)
+        self.acquired_at = 0
+        self.owner = None
+
+    def acquire(self, blocking=True, timeout=-1):
+        if not self.lock.acquire(False):
+            if not blocking:
+                return False
+            if not self.spin() and not self.lock.acquire(True, timeout):
+                return False
+        self.acquired_at = time.perf_counter_ns()
+        self.owner = threading.get_ident()
+        return True
+
+    # Insiste enquanto o tempo esperado de posse permitir; True se conseguiu o lock
+    def spin(self):
+        hold_ns = self.hold_ns
+        if hold_ns > SPIN_LIMIT_NS:
+            return False
+        deadline = time.perf_counter_ns() + 2 * hold_ns
+        for _ in range(self.max_spins):
+            time.sleep(0)  # Cede o GIL para o dono do lock
+            if self.lock.acquire(False):
+                return True
+            if time.perf_counter_ns() > deadline:
+                return False
+        return False
+
+    def release(self):
+        held = time.perf_counter_ns() - self.acquired_at
+        self.hold_ns += (held - self.hold_ns) // 8  # Média móvel com peso 1/8 para a posse mais recente
+        self.owner = None
+        self.lock.release()
+
+    def locked(self):
+        return self.lock.locked()
+
+    # Usado por threading.Condition para conferir o dono sem tentar adquirir o lock
+    def _is_owned(self):
+        return self.owner == threading.get_ident()
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, *exc):
+        self.release()
+
+# Spinlock de um mecanismo, criado sobre um lock da fábrica context.sync (o módulo
+# threading ou o escalonador do relógio virtual); com --count-sync (CountingSync),
+# o lock interno vem da base e o spinlock inteiro é embrulhado pelo contador
+def make_spinlock(sync):
+    wrap = getattr(sync, "wrap", None)
+    if wrap is None:
+        return AdaptiveSpinLock(sync.Lock())
+    return wrap(AdaptiveSpinLock(sync.base.Lock()))
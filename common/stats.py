@@ -0,0 +1,39 @@
+import math
+
+# Estatísticas calculadas durante a varredura, sem guardar as amostras.
+# Usadas pelo runner para resumir cada configuração e para parar as repetições
+# assim que o intervalo de confiança de todos os mecanismos fica estreito o bastante.
+
+Z_95 = 1.96  # Mesmo intervalo de 95% (1.96·σ/√n) usado nos gráficos
+
+# Média e variância incrementais pelo algoritmo de Welford
+class OnlineStats:
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # Soma dos quadrados dos desvios em relação à média
+
+    def push(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    # Variância amostral (n - 1)
+    def variance(self):
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def stddev(self):
+        return math.sqrt(self.variance())
+
+    # Meia-largura do intervalo de confiança da média
+    def halfwidth(self, z=Z_95):
+        return z * self.stddev() / math.sqrt(self.count) if self.count > 1 else math.inf
+
+    # Meia-largura relativa à média (ex.: 0.05 = ±5%)
+    def relative_halfwidth(self, z=Z_95):
+        if self.count < 2:
+            return math.inf
+        if self.mean == 0:
+            return 0.0 if self.m2 == 0 else math.inf
+        return self.halfwidth(z) / abs(self.mean)
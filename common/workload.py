@@ -0,0 +1,139 @@
+import random
+import struct
+import sys
+from array import array
+
+# Carga de trabalho dos testes: os tempos de pensar/comer/ler/escrever e os
+# itens produzidos. Cada participante (ex.: "philosopher-3", "reader-2") tira
+# seus sorteios de um fluxo próprio, então a sequência de cada um não depende
+# da ordem em que o SO escalona as threads.
+#
+#   RandomWorkload   comportamento original: todos sorteiam do random global
+#   SeededWorkload   um gerador por participante, derivado de uma semente,
+#                    que grava os valores sorteados (trace)
+#   TraceWorkload    repete um trace gravado, para que todos os mecanismos de
+#                    uma repetição recebam exatamente a mesma agenda
+#
+# O trace é gravado em binário: cabeçalho, semente e, para cada participante,
+# o nome e seus valores como doubles (array('d')).
+
+TRACE_MAGIC = b"WKT1"
+
+# Fluxo do gerador global (picklável, para os processos filhos)
+class RandomStream:
+    def uniform(self, a, b):
+        return random.uniform(a, b)
+
+    def randint(self, a, b):
+        return random.randint(a, b)
+
+# Fluxo com gerador próprio que guarda cada valor sorteado
+class RecordingStream:
+    def __init__(self, seed):
+        self.rng = random.Random(seed)
+        self.values = array("d")
+
+    def uniform(self, a, b):
+        value = self.rng.uniform(a, b)
+        self.values.append(value)
+        return value
+
+    def randint(self, a, b):
+        value = self.rng.randint(a, b)
+        self.values.append(value)
+        return value
+
+# Fluxo que devolve os valores de um trace na ordem em que foram gravados
+class ReplayStream:
+    def __init__(self, values):
+        self.values = values
+        self.position = 0
+
+    def next(self):
+        if self.position >= len(self.values):
+            raise IndexError(f"Trace esgotado após {len(self.values)} valores")
+        value = self.values[self.position]
+        self.position += 1
+        return value
+
+    def uniform(self, a, b):
+        return self.next()
+
+    def randint(self, a, b):
+        return int(self.next())
+
+class RandomWorkload:
+    def __init__(self):
+        self.shared = RandomStream()
+
+    def stream(self, actor):
+        return self.shared
+
+class SeededWorkload:
+    def __init__(self, seed):
+        self.seed = str(seed)
+        self.streams = {}  # Participante -> fluxo
+
+    def stream(self, actor):
+        if actor not in self.streams:
+            self.streams[actor] = RecordingStream(f"{self.seed}:{actor}")
+        return self.streams[actor]
+
+    # Valores sorteados por participante. Fluxos enviados a processos filhos
+    # sorteiam lá e voltam vazios; esses ficam de fora e são gerados de novo
+    # a partir da semente na repetição.
+    def trace(self):
+        return {actor: stream.values for actor, stream in self.streams.items() if stream.values}
+
+class TraceWorkload:
+    def __init__(self, trace, seed):
+        self.trace = trace
+        self.seed = str(seed)
+        self.streams = {}
+
+    def stream(self, actor):
+        if actor not in self.streams:
+            if actor in self.trace:
+                self.streams[actor] = ReplayStream(self.trace[actor])
+            else:
+                self.streams[actor] = RecordingStream(f"{self.seed}:{actor}")
+        return self.streams[actor]
+
+def save_trace(path, seed, trace):
+    seed = str(seed).encode()
+    with open(path, "wb") as file:
+        file.write(TRACE_MAGIC + struct.pack("<H", len(seed)) + seed + struct.pack("<I", len(trace)))
+        for actor, values in trace.items():
+            name = actor.encode()
+            values = array("d", values)
+            if sys.byteorder == "big":
+                values.byteswap()  # O arquivo é sempre little-endian
+            file.write(struct.pack("<H", len(name)) + name + struct.pack("<I", len(values)))
+            file.write(values.tobytes())
+
+# Lê um trace gravado e devolve um TraceWorkload pronto para repeti-lo
+def load_trace(path):
+    with open(path, "rb") as file:
+        data = file.read()
+    if data[:4] != TRACE_MAGIC:
+        raise ValueError(f"{path} não é um trace de carga de trabalho")
+    offset = 4
+    (size,) = struct.unpack_from("<H", data, offset)
+    seed = data[offset + 2:offset + 2 + size].decode()
+    offset += 2 + size
+    (actors,) = struct.unpack_from("<I", data, offset)
+    offset += 4
+    trace = {}
+    for _ in range(actors):
+        (size,) = struct.unpack_from("<H", data, offset)
+        actor = data[offset + 2:offset + 2 + size].decode()
+        offset += 2 + size
+        (count,) = struct.unpack_from("<I", data, offset)
+        offset += 4
+        values = array("d")
+        values.frombytes(data[offset:offset + 8 * count])
+        if sys.byteorder == "big":
+            values.byteswap()
+        offset += 8 * count
+        trace[actor] = values
+    return TraceWorkload(trace, seed)
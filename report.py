@@ -0,0 +1,9 @@
+# Gera os gráficos de todos os problemas a partir dos datasets já gravados,
+# sem executar nenhuma medição. Exemplos:
+#   python report.py
+#   python report.py pre-results
+#   python report.py --tag noite --problem dining-philosophers
+from common.report import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+# Runner unificado dos benchmarks, sem perguntas interativas.
+# Exemplos:
+#   python run_benchmarks.py --repetitions 100 --warmup 2
+#   python run_benchmarks.py --problem dining-philosophers --philosophers 5 50 500 --tag noite
+#   python run_benchmarks.py --problem producer-consumer --producers 1:8:*2 --consumers 1:8:*2
+from common.runner import main
+
+if __name__ == "__main__":
+    main()